@@ -4,9 +4,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import httpx
 import logging
+from bovara_ops import ReadinessProbe, health_router, setup_metrics, setup_tracing, setup_logging, start_span, inject_headers
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +23,15 @@ app.add_middleware(
 )
 
 
+# Métricas (/metrics) y trazas distribuidas
+setup_metrics(app, "api-gateway")
+setup_tracing(app, "api-gateway")
+
+
+# Logging estructurado (JSON, asíncrono y muestreado por petición)
+setup_logging("api-gateway", app)
+
+
 # URLs de servicios
 AUTH_SERVICE_URL = "http://localhost:8000"
 CORE_SERVICE_URL = "http://localhost:8001"
@@ -42,39 +51,36 @@ async def root():
 
 
 
-@app.get("/health")
-async def health_check():
-    """Health check del gateway"""
-    services_status = {}
-    
-    # Check Auth Service
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{AUTH_SERVICE_URL}/health")
-            services_status["auth_service"] = "healthy" if response.status_code == 200 else "unhealthy"
-    except:
-        services_status["auth_service"] = "unreachable"
-    
-    # Check Core Service
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{CORE_SERVICE_URL}/health")
-            services_status["core_service"] = "healthy" if response.status_code == 200 else "unhealthy"
-    except:
-        services_status["core_service"] = "unreachable"
-    
-    # ✅ Check Chatbot Service
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{CHATBOT_SERVICE_URL}/api/v1/chat/health")
-            services_status["chatbot_service"] = "healthy" if response.status_code == 200 else "unhealthy"
-    except:
-        services_status["chatbot_service"] = "unreachable"
-    
-    return {
-        "gateway": "healthy",
-        "services": services_status
-    }
+# Health checks: los servicios downstream se consultan en segundo plano y
+# se reportan sin afectar la readiness del gateway
+probe = ReadinessProbe(service="api-gateway")
+_health_client = httpx.AsyncClient(timeout=2.0)
+
+
+def _downstream_check(url: str):
+    async def check():
+        response = await _health_client.get(url)
+        return response.status_code == 200
+    return check
+
+
+probe.add_check("auth_service", _downstream_check(f"{AUTH_SERVICE_URL}/health/live"), critical=False)
+probe.add_check("core_service", _downstream_check(f"{CORE_SERVICE_URL}/health/live"), critical=False)
+probe.add_check("chatbot_service", _downstream_check(f"{CHATBOT_SERVICE_URL}/health/live"), critical=False)
+
+
+@app.on_event("startup")
+async def start_probe():
+    await probe.start()
+
+
+@app.on_event("shutdown")
+async def stop_probe():
+    await probe.stop()
+    await _health_client.aclose()
+
+
+app.include_router(health_router(probe))
 
 
 
@@ -86,33 +92,43 @@ async def auth_proxy(request: Request, path: str):
     """Proxy para Auth Service - Solo /api/v1/auth/*"""
     try:
         target_url = f"{AUTH_SERVICE_URL}/api/v1/auth/{path}"
-        logger.info(f"🔵 [AUTH] {request.method} /api/v1/auth/{path}")
         
         headers = dict(request.headers)
         headers.pop("host", None)
+        # IP del cliente para el rate limiting de login en auth-service.
+        # Se reemplaza (no se concatena): el valor que envía el cliente no es de fiar
+        headers.pop("x-forwarded-for", None)
+        if request.client:
+            headers["x-forwarded-for"] = request.client.host
         body = await request.body()
         
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            response = await client.request(
-                method=request.method,
-                url=target_url,
-                headers=headers,
-                content=body,
-                params=request.query_params
-            )
+        with start_span("proxy auth", "CLIENT", **{"http.url": target_url}):
+            inject_headers(headers)
+            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+                response = await client.request(
+                    method=request.method,
+                    url=target_url,
+                    headers=headers,
+                    content=body,
+                    params=request.query_params
+                )
         
-        logger.info(f"✅ [AUTH] {response.status_code}")
+        logger.info(
+            "proxy",
+            extra={"upstream": "auth", "method": request.method, "path": f"/api/v1/auth/{path}", "status": response.status_code}
+        )
         
         return JSONResponse(
             content=response.json() if response.content else {},
-            status_code=response.status_code
+            status_code=response.status_code,
+            headers={"Retry-After": response.headers["retry-after"]} if "retry-after" in response.headers else None
         )
     
     except httpx.ConnectError:
-        logger.error("❌ Auth Service no disponible")
+        logger.error("Auth Service no disponible", extra={"upstream": "auth"})
         raise HTTPException(status_code=503, detail="Auth Service no disponible")
     except Exception as e:
-        logger.error(f"❌ Error: {str(e)}")
+        logger.exception("Error en proxy", extra={"upstream": "auth"})
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -126,22 +142,26 @@ async def chatbot_proxy(request: Request, path: str):
     """Proxy para Chatbot Service - Solo /api/v1/chat/*"""
     try:
         target_url = f"{CHATBOT_SERVICE_URL}/api/v1/chat/{path}"
-        logger.info(f"🤖 [CHATBOT] {request.method} /api/v1/chat/{path}")
         
         headers = dict(request.headers)
         headers.pop("host", None)
         body = await request.body()
         
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            response = await client.request(
-                method=request.method,
-                url=target_url,
-                headers=headers,
-                content=body,
-                params=request.query_params
-            )
+        with start_span("proxy chatbot", "CLIENT", **{"http.url": target_url}):
+            inject_headers(headers)
+            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+                response = await client.request(
+                    method=request.method,
+                    url=target_url,
+                    headers=headers,
+                    content=body,
+                    params=request.query_params
+                )
         
-        logger.info(f"✅ [CHATBOT] {response.status_code}")
+        logger.info(
+            "proxy",
+            extra={"upstream": "chatbot", "method": request.method, "path": f"/api/v1/chat/{path}", "status": response.status_code}
+        )
         
         return JSONResponse(
             content=response.json() if response.content else {},
@@ -149,10 +169,10 @@ async def chatbot_proxy(request: Request, path: str):
         )
     
     except httpx.ConnectError:
-        logger.error("❌ Chatbot Service no disponible")
+        logger.error("Chatbot Service no disponible", extra={"upstream": "chatbot"})
         raise HTTPException(status_code=503, detail="Chatbot Service no disponible")
     except Exception as e:
-        logger.error(f"❌ Error: {str(e)}")
+        logger.exception("Error en proxy", extra={"upstream": "chatbot"})
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -165,22 +185,26 @@ async def core_proxy(request: Request, path: str):
     """Proxy para Core Service - Todo /api/v1/* EXCEPTO /api/v1/auth/* y /api/v1/chat/*"""
     try:
         target_url = f"{CORE_SERVICE_URL}/api/v1/{path}"
-        logger.info(f"🟢 [CORE] {request.method} /api/v1/{path}")
         
         headers = dict(request.headers)
         headers.pop("host", None)
         body = await request.body()
         
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            response = await client.request(
-                method=request.method,
-                url=target_url,
-                headers=headers,
-                content=body,
-                params=request.query_params
-            )
+        with start_span("proxy core", "CLIENT", **{"http.url": target_url}):
+            inject_headers(headers)
+            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+                response = await client.request(
+                    method=request.method,
+                    url=target_url,
+                    headers=headers,
+                    content=body,
+                    params=request.query_params
+                )
         
-        logger.info(f"✅ [CORE] {response.status_code}")
+        logger.info(
+            "proxy",
+            extra={"upstream": "core", "method": request.method, "path": f"/api/v1/{path}", "status": response.status_code}
+        )
         
         return JSONResponse(
             content=response.json() if response.content else {},
@@ -188,10 +212,10 @@ async def core_proxy(request: Request, path: str):
         )
     
     except httpx.ConnectError:
-        logger.error("❌ Core Service no disponible")
+        logger.error("Core Service no disponible", extra={"upstream": "core"})
         raise HTTPException(status_code=503, detail="Core Service no disponible")
     except Exception as e:
-        logger.error(f"❌ Error: {str(e)}")
+        logger.exception("Error en proxy", extra={"upstream": "core"})
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -59,19 +59,31 @@ class UserResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class RefreshRequest(BaseModel):
+    """DTO para solicitud de renovación de token"""
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    """DTO para solicitud de logout (revoca también el refresh token si se envía)"""
+    refresh_token: Optional[str] = None
+
+
 class TokenResponse(BaseModel):
     """DTO para respuesta de autenticación con token"""
     access_token: str
     expires_in: int
     user: UserResponse
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
     
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                "refresh_token": "Jx3cQ6w4lS1r0Y...",
                 "token_type": "bearer",
-                "expires_in": 1800,
+                "expires_in": 900,
                 "user": {
                     "id": "123e4567-e89b-12d3-a456-426614174000",
                     "email": "user@bovara.com",
@@ -1,11 +1,16 @@
+from typing import Optional
 from src.domain.entities.user import User
 from src.domain.ports.user_repository_port import UserRepositoryPort
 from src.domain.ports.password_hasher_port import PasswordHasherPort
+from src.domain.ports.refresh_token_repository_port import RefreshTokenRepositoryPort
+from src.domain.ports.cache_port import CachePort
+from src.domain.entities.refresh_token import RefreshToken
 from src.domain.exceptions.auth_exceptions import (
     UserAlreadyExistsException,
     UserNotFoundException,
     InvalidCredentialsException,
-    InactiveUserException
+    InactiveUserException,
+    InvalidTokenException
 )
 from src.application.dtos.auth_dtos import (
     RegisterRequest,
@@ -23,11 +28,46 @@ class AuthService:
         self,
         user_repository: UserRepositoryPort,
         password_hasher: PasswordHasherPort,
-        jwt_handler: JWTHandler
+        jwt_handler: JWTHandler,
+        refresh_token_repository: RefreshTokenRepositoryPort,
+        user_cache: Optional[CachePort] = None
     ):
         self._user_repository = user_repository
         self._password_hasher = password_hasher
         self._jwt_handler = jwt_handler
+        self._refresh_token_repository = refresh_token_repository
+        self._user_cache = user_cache
+    
+    async def _issue_tokens(self, user: User, rotated: Optional[RefreshToken] = None) -> TokenResponse:
+        """
+        Emite un access token corto y un refresh token nuevo (persistido como hash).
+        Si se indica `rotated`, el nuevo token hereda su familia y lo reemplaza;
+        si otra petición ya lo rotó, se trata como reutilización.
+        """
+        refresh_token, token_hash = self._jwt_handler.create_refresh_token()
+        new_token = RefreshToken.create(
+            user_id=user.id,
+            token_hash=token_hash,
+            ttl=self._jwt_handler.refresh_token_ttl,
+            family_id=rotated.family_id if rotated else None
+        )
+        
+        # Revocación condicional antes de emitir: solo una rotación concurrente gana
+        if rotated and not await self._refresh_token_repository.revoke(rotated.id, replaced_by=new_token.id):
+            await self._refresh_token_repository.revoke_family(rotated.family_id)
+            raise InvalidTokenException()
+        
+        await self._refresh_token_repository.save(new_token)
+        access_token, expires_in = self._jwt_handler.create_access_token(
+            subject=user.id
+        )
+        
+        return TokenResponse(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            expires_in=expires_in,
+            user=UserResponse.from_entity(user)
+        )
     
     async def register(self, request: RegisterRequest) -> TokenResponse:
         """Caso de uso: Registrar nuevo usuario"""
@@ -37,7 +77,7 @@ class AuthService:
             raise UserAlreadyExistsException(request.email)
         
         # Hashear contraseña
-        hashed_password = self._password_hasher.hash(request.password)
+        hashed_password = await self._password_hasher.hash(request.password)
         
         # Crear entidad de usuario
         user = User.create(
@@ -49,23 +89,8 @@ class AuthService:
         # Persistir usuario
         saved_user = await self._user_repository.save(user)
         
-        # Generar token
-        access_token, expires_in = self._jwt_handler.create_access_token(
-            subject=saved_user.id
-        )
-        
-        return TokenResponse(
-            access_token=access_token,
-            expires_in=expires_in,
-            user=UserResponse(
-                id=saved_user.id,
-                email=saved_user.email,
-                full_name=saved_user.full_name,
-                is_active=saved_user.is_active,
-                is_superuser=saved_user.is_superuser,
-                created_at=saved_user.created_at
-            )
-        )
+        # Generar tokens
+        return await self._issue_tokens(saved_user)
     
     async def login(self, request: LoginRequest) -> TokenResponse:
         """Caso de uso: Iniciar sesión"""
@@ -77,47 +102,82 @@ class AuthService:
             raise InvalidCredentialsException()
         
         # Verificar contraseña
-        if not self._password_hasher.verify(request.password, user.hashed_password):
+        if not await self._password_hasher.verify(request.password, user.hashed_password):
             raise InvalidCredentialsException()
         
         # Verificar si está activo
         if not user.is_active:
             raise InactiveUserException()
         
-        # Generar token
-        access_token, expires_in = self._jwt_handler.create_access_token(
-            subject=user.id
+        # Generar tokens
+        return await self._issue_tokens(user)
+    
+    async def refresh(self, refresh_token: str) -> TokenResponse:
+        """
+        Caso de uso: Renovar tokens con un refresh token (sin pasar por bcrypt)
+        
+        El refresh token usado se revoca y se reemplaza por otro de la misma
+        familia. Si llega un token ya revocado (reutilización), se revoca
+        toda la familia.
+        """
+        stored = await self._refresh_token_repository.find_by_hash(
+            self._jwt_handler.hash_refresh_token(refresh_token)
         )
         
-        return TokenResponse(
-            access_token=access_token,
-            expires_in=expires_in,
-            user=UserResponse(
-                id=user.id,
-                email=user.email,
-                full_name=user.full_name,
-                is_active=user.is_active,
-                is_superuser=user.is_superuser,
-                created_at=user.created_at
-            )
-        )
-    
-    async def get_current_user(self, user_id: str) -> UserResponse:
-        """Caso de uso: Obtener usuario actual"""
+        if not stored:
+            raise InvalidTokenException()
+        
+        if stored.is_revoked:
+            await self._refresh_token_repository.revoke_family(stored.family_id)
+            raise InvalidTokenException()
         
-        user = await self._user_repository.find_by_id(user_id)
+        if stored.is_expired:
+            raise InvalidTokenException()
+        
+        user = await self._user_repository.find_by_id(stored.user_id)
         
         if not user:
-            raise UserNotFoundException(user_id)
+            raise UserNotFoundException(stored.user_id)
         
         if not user.is_active:
             raise InactiveUserException()
         
-        return UserResponse(
-            id=user.id,
-            email=user.email,
-            full_name=user.full_name,
-            is_active=user.is_active,
-            is_superuser=user.is_superuser,
-            created_at=user.created_at
-        )
+        return await self._issue_tokens(user, rotated=stored)
+    
+    async def logout(self, access_token: str, refresh_token: Optional[str] = None) -> None:
+        """Caso de uso: Cerrar sesión revocando el access token y el refresh token"""
+        self._jwt_handler.revoke_access_token(access_token)
+        
+        if refresh_token:
+            stored = await self._refresh_token_repository.find_by_hash(
+                self._jwt_handler.hash_refresh_token(refresh_token)
+            )
+            if stored and not stored.is_revoked:
+                await self._refresh_token_repository.revoke_family(stored.family_id)
+    
+    async def get_current_user(self, user_id: str) -> UserResponse:
+        """Caso de uso: Obtener usuario actual (read-through sobre la caché de usuarios)"""
+        
+        cached = await self._user_cache.get(user_id) if self._user_cache else None
+        
+        if cached:
+            response = UserResponse(**cached)
+        else:
+            user = await self._user_repository.find_by_id(user_id)
+            
+            if not user:
+                raise UserNotFoundException(user_id)
+            
+            response = UserResponse.from_entity(user)
+            if self._user_cache:
+                await self._user_cache.set(user_id, response.model_dump(mode="json"))
+        
+        if not response.is_active:
+            raise InactiveUserException()
+        
+        return response
+    
+    async def invalidate_user(self, user_id: str) -> None:
+        """Invalida la entrada de caché de un usuario (tras actualizarlo o eliminarlo)"""
+        if self._user_cache:
+            await self._user_cache.delete(user_id)
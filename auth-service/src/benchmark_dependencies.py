@@ -0,0 +1,87 @@
+"""
+Microbenchmark del costo por petición de resolver las dependencias de auth.
+
+- before: se construyen Settings, JWTHandler y BcryptPasswordHasher (CryptContext
+  + pool de hilos) en cada petición, como hacían get_jwt_handler/get_password_hasher
+- after: se toman del Container creado una vez en el lifespan
+
+En ambos casos se construyen los repositorios y el AuthService por petición
+(los repositorios envuelven la sesión de la petición).
+
+Uso:
+    python -m src.benchmark_dependencies --iterations 2000
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from src.application.services.auth_service import AuthService
+from src.infrastructure.adapters.outbound.bcrypt_password_hasher import BcryptPasswordHasher
+from src.infrastructure.adapters.outbound.postgres_user_repository import PostgresUserRepository
+from src.infrastructure.adapters.outbound.postgres_refresh_token_repository import PostgresRefreshTokenRepository
+from src.infrastructure.adapters.outbound.memory_cache import InMemoryCache
+from src.infrastructure.config.container import build_container
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.security.jwt_handler import JWTHandler
+
+
+def _time(func: Callable[[], None], iterations: int) -> List[float]:
+    """Latencias en microsegundos de cada llamada"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_us": round(statistics.fmean(ordered), 2),
+        "p50_us": round(ordered[len(ordered) // 2], 2),
+        "p99_us": round(ordered[int(len(ordered) * 0.99) - 1], 2),
+    }
+
+
+def run(iterations: int) -> Dict[str, Dict[str, float]]:
+    def before() -> None:
+        settings = Settings()
+        hasher = BcryptPasswordHasher(rounds=settings.BCRYPT_ROUNDS)
+        AuthService(
+            user_repository=PostgresUserRepository(None),
+            password_hasher=hasher,
+            jwt_handler=JWTHandler(settings),
+            refresh_token_repository=PostgresRefreshTokenRepository(None),
+            user_cache=InMemoryCache()
+        )
+        hasher.shutdown()
+
+    container = build_container(Settings())
+
+    def after() -> None:
+        AuthService(
+            user_repository=PostgresUserRepository(None, user_cache=container.user_cache),
+            password_hasher=container.password_hasher,
+            jwt_handler=container.jwt_handler,
+            refresh_token_repository=PostgresRefreshTokenRepository(None),
+            user_cache=container.user_cache
+        )
+
+    try:
+        return {
+            "before": _summary(_time(before, iterations)),
+            "after": _summary(_time(after, iterations)),
+        }
+    finally:
+        container.password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de dependencias por petición")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.iterations), indent=2))
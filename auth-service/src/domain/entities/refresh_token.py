@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+import uuid
+
+
+@dataclass
+class RefreshToken:
+    """
+    Entidad de dominio RefreshToken
+
+    Solo se guarda el hash del token. Todos los tokens obtenidos por rotación
+    desde un mismo login comparten family_id, de modo que reutilizar un token
+    ya rotado permite revocar la familia completa.
+    """
+    
+    id: str
+    user_id: str
+    token_hash: str
+    family_id: str
+    expires_at: datetime
+    created_at: Optional[datetime] = None
+    revoked_at: Optional[datetime] = None
+    replaced_by: Optional[str] = None
+    
+    @staticmethod
+    def create(
+        user_id: str,
+        token_hash: str,
+        ttl: timedelta,
+        family_id: Optional[str] = None
+    ) -> "RefreshToken":
+        """Factory method para emitir un nuevo refresh token"""
+        now = datetime.utcnow()
+        token_id = str(uuid.uuid4())
+        return RefreshToken(
+            id=token_id,
+            user_id=user_id,
+            token_hash=token_hash,
+            family_id=family_id or token_id,
+            expires_at=now + ttl,
+            created_at=now
+        )
+    
+    @property
+    def is_revoked(self) -> bool:
+        return self.revoked_at is not None
+    
+    @property
+    def is_expired(self) -> bool:
+        return datetime.utcnow() >= self.expires_at
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class CachePort(ABC):
+    """Puerto de salida - Caché clave/valor con expiración"""
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Obtiene un valor o None si no existe o expiró"""
+        pass
+    
+    @abstractmethod
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Guarda un valor con el TTL configurado"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Invalida un valor"""
+        pass
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.domain.entities.refresh_token import RefreshToken
+
+
+class RefreshTokenRepositoryPort(ABC):
+    """Puerto de salida - Interfaz del repositorio de refresh tokens"""
+    
+    @abstractmethod
+    async def save(self, token: RefreshToken) -> RefreshToken:
+        """Guarda un refresh token"""
+        pass
+    
+    @abstractmethod
+    async def find_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        """Busca un refresh token por su hash"""
+        pass
+    
+    @abstractmethod
+    async def revoke(self, token_id: str, replaced_by: Optional[str] = None) -> bool:
+        """
+        Revoca un refresh token activo (opcionalmente indicando su reemplazo).
+        Devuelve False si ya estaba revocado (otra petición lo usó antes).
+        """
+        pass
+    
+    @abstractmethod
+    async def revoke_family(self, family_id: str) -> int:
+        """Revoca todos los tokens activos de una familia de rotación"""
+        pass
+    
+    @abstractmethod
+    async def revoke_all_for_user(self, user_id: str) -> int:
+        """Revoca todos los tokens activos de un usuario"""
+        pass
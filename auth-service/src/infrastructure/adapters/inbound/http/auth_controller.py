@@ -1,22 +1,28 @@
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from src.application.services.auth_service import AuthService
 from src.application.dtos.auth_dtos import (
     RegisterRequest,
     LoginRequest,
+    RefreshRequest,
+    LogoutRequest,
     TokenResponse,
     UserResponse,
     MessageResponse
 )
 from src.infrastructure.adapters.inbound.http.dependencies import (
     get_auth_service,
-    get_current_user_id
+    get_current_user_id,
+    enforce_login_rate_limit,
+    security
 )
 from src.domain.exceptions.auth_exceptions import (
     UserAlreadyExistsException,
     InvalidCredentialsException,
     InactiveUserException,
-    UserNotFoundException
+    UserNotFoundException,
+    InvalidTokenException
 )
 
 
@@ -60,7 +66,8 @@ async def register(
     response_model=TokenResponse,
     status_code=status.HTTP_200_OK,
     summary="Iniciar sesión",
-    description="Autentica un usuario y retorna un token de acceso"
+    description="Autentica un usuario y retorna un token de acceso",
+    dependencies=[Depends(enforce_login_rate_limit)]
 )
 async def login(
     request: LoginRequest,
@@ -69,6 +76,7 @@ async def login(
     """
     Endpoint: Login de usuario
     
+    - Limitado por IP y por email (429 antes de consultar DB o bcrypt)
     - Valida las credenciales del usuario
     - Genera un nuevo token JWT
     - Retorna el token y la información del usuario
@@ -93,6 +101,44 @@ async def login(
         )
 
 
+@router.post(
+    "/refresh",
+    response_model=TokenResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Renovar tokens",
+    description="Canjea un refresh token por un nuevo access token y un nuevo refresh token"
+)
+async def refresh(
+    request: RefreshRequest,
+    auth_service: Annotated[AuthService, Depends(get_auth_service)]
+) -> TokenResponse:
+    """
+    Endpoint: Refresh de tokens
+    
+    - No requiere contraseña (no pasa por bcrypt)
+    - El refresh token usado queda revocado (rotación)
+    - Reutilizar un refresh token ya rotado revoca toda la sesión
+    """
+    try:
+        return await auth_service.refresh(request.refresh_token)
+    except (InvalidTokenException, UserNotFoundException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.message,
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    except InactiveUserException as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=e.message
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error al renovar token: {str(e)}"
+        )
+
+
 @router.get(
     "/me",
     response_model=UserResponse,
@@ -132,17 +178,24 @@ async def get_me(
     "/logout",
     response_model=MessageResponse,
     summary="Cerrar sesión",
-    description="Invalida la sesión actual (el cliente debe eliminar el token)"
+    description="Revoca el access token actual y, si se envía, el refresh token"
 )
 async def logout(
-    user_id: Annotated[str, Depends(get_current_user_id)]
+    user_id: Annotated[str, Depends(get_current_user_id)],
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    auth_service: Annotated[AuthService, Depends(get_auth_service)],
+    request: Optional[LogoutRequest] = None
 ) -> MessageResponse:
     """
     Endpoint: Logout
     
-    - El cliente debe eliminar el token JWT almacenado
-    - Los tokens JWT son stateless
+    - El access token queda en la lista de revocación hasta que expire
+    - El refresh token enviado (y su familia de rotación) queda revocado
     """
+    await auth_service.logout(
+        credentials.credentials,
+        refresh_token=request.refresh_token if request else None
+    )
     return MessageResponse(
         message="Sesión cerrada exitosamente",
         success=True
@@ -1,9 +1,11 @@
 from typing import Annotated
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.infrastructure.config.database import get_db
+from src.infrastructure.config.container import Container
 from src.infrastructure.adapters.outbound.postgres_user_repository import PostgresUserRepository
+from src.infrastructure.adapters.outbound.postgres_refresh_token_repository import PostgresRefreshTokenRepository
 from src.infrastructure.adapters.outbound.bcrypt_password_hasher import BcryptPasswordHasher
 from src.infrastructure.security.jwt_handler import JWTHandler
 from src.application.services.auth_service import AuthService
@@ -13,27 +15,73 @@ from src.domain.exceptions.auth_exceptions import InvalidTokenException
 security = HTTPBearer()
 
 
-def get_jwt_handler() -> JWTHandler:
+def get_container(request: Request) -> Container:
+    """Dependency: singletons creados en el lifespan"""
+    return request.app.state.container
+
+
+def get_jwt_handler(
+    container: Annotated[Container, Depends(get_container)]
+) -> JWTHandler:
     """Dependency: JWT Handler"""
-    return JWTHandler()
+    return container.jwt_handler
+
+
+async def enforce_login_rate_limit(
+    request: Request,
+    container: Annotated[Container, Depends(get_container)]
+) -> None:
+    """
+    Dependency: rechaza con 429 los intentos de login que exceden el límite
+    por IP o por email, antes de tocar la DB o bcrypt
+    """
+    try:
+        body = await request.json()
+    except ValueError:
+        return
+    
+    email = body.get("email") if isinstance(body, dict) else None
+    if not isinstance(email, str) or "@" not in email or not body.get("password"):
+        # No es un intento plausible: la validación del DTO responderá 422
+        return
+    
+    ip = request.client.host if request.client else None
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded and container.settings.TRUST_FORWARDED_FOR:
+        # Último salto: lo escribe el api-gateway; los anteriores los controla el cliente
+        ip = forwarded.split(",")[-1].strip()
+    
+    wait = await container.login_limiter.check(ip, email)
+    if wait:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Demasiados intentos de inicio de sesión. Intenta más tarde",
+            headers={"Retry-After": str(max(1, round(wait)))}
+        )
 
 
-def get_password_hasher() -> BcryptPasswordHasher:
+def get_password_hasher(
+    container: Annotated[Container, Depends(get_container)]
+) -> BcryptPasswordHasher:
     """Dependency: Password Hasher"""
-    return BcryptPasswordHasher()
+    return container.password_hasher
 
 
 async def get_auth_service(
     db: Annotated[AsyncSession, Depends(get_db)],
+    container: Annotated[Container, Depends(get_container)],
     jwt_handler: Annotated[JWTHandler, Depends(get_jwt_handler)],
     password_hasher: Annotated[BcryptPasswordHasher, Depends(get_password_hasher)]
 ) -> AuthService:
     """Dependency: Auth Service con todas sus dependencias inyectadas"""
-    user_repository = PostgresUserRepository(db)
+    # Los repositorios envuelven la sesión de la petición (definen la transacción),
+    # por eso son lo único que se construye por petición
     return AuthService(
-        user_repository=user_repository,
+        user_repository=PostgresUserRepository(db, user_cache=container.user_cache),
         password_hasher=password_hasher,
-        jwt_handler=jwt_handler
+        jwt_handler=jwt_handler,
+        refresh_token_repository=PostgresRefreshTokenRepository(db),
+        user_cache=container.user_cache
     )
 
 
@@ -0,0 +1,26 @@
+from typing import Annotated, Any, Dict
+from fastapi import APIRouter, Depends, Query
+from src.infrastructure.adapters.inbound.http.dependencies import get_jwt_handler
+from src.infrastructure.security.jwt_handler import JWTHandler
+
+
+router = APIRouter(prefix="/internal", tags=["Internal"])
+
+
+@router.get(
+    "/revocations",
+    summary="Access tokens revocados",
+    description="Para servicios que validan JWT localmente (core-service). No se expone por el api-gateway",
+    include_in_schema=False
+)
+async def list_revocations(
+    jwt_handler: Annotated[JWTHandler, Depends(get_jwt_handler)],
+    after: int = Query(0, ge=0, description="Cursor devuelto por la llamada anterior")
+) -> Dict[str, Any]:
+    """
+    Endpoint: Revocaciones posteriores a `after`
+    
+    - `epoch` cambia si auth-service se reinicia: el cliente debe volver a pedir desde 0
+    - Solo incluye tokens que aún no han expirado
+    """
+    return jwt_handler.revoked_since(after)
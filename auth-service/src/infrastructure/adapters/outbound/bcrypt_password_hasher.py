@@ -1,19 +1,75 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, TypeVar
+
 from passlib.context import CryptContext
 from src.domain.ports.password_hasher_port import PasswordHasherPort
 
+T = TypeVar("T")
+
 
 class BcryptPasswordHasher(PasswordHasherPort):
-    """Adaptador de salida - Hasher de contraseñas con bcrypt"""
+    """
+    Adaptador de salida - Hasher de contraseñas con bcrypt
+
+    bcrypt tarda ~100-300 ms por llamada y libera el GIL, así que se ejecuta en
+    un pool de hilos acotado para no bloquear el event loop. El semáforo limita
+    las operaciones en curso; las que esperan turno cuentan como cola.
+    """
+    
+    def __init__(self, rounds: int = 12, max_workers: Optional[int] = None):
+        self._context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="bcrypt"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._waiting = 0
+        self._active = 0
+        self._max_waiting = 0
+        self._completed = 0
     
-    def __init__(self):
-        self._context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        """Ejecuta una operación de bcrypt en el pool respetando el límite de concurrencia"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_workers)
+        
+        self._waiting += 1
+        self._max_waiting = max(self._max_waiting, self._waiting)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        
+        self._active += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._active -= 1
+            self._completed += 1
+            self._semaphore.release()
     
-    def hash(self, password: str) -> str:
+    async def hash(self, password: str) -> str:
         """Hashea una contraseña con bcrypt"""
-        return self._context.hash(password)
+        return await self._run(self._context.hash, password)
     
-    def verify(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
         """Verifica si la contraseña coincide"""
-        return self._context.verify(plain_password, hashed_password)
+        return await self._run(self._context.verify, plain_password, hashed_password)
     
+    def stats(self) -> Dict[str, int]:
+        """Métricas del pool: operaciones en cola, en curso y completadas"""
+        return {
+            "max_workers": self._max_workers,
+            "queue_depth": self._waiting,
+            "max_queue_depth": self._max_waiting,
+            "in_flight": self._active,
+            "completed": self._completed,
+        }
     
+    def shutdown(self) -> None:
+        """Libera los hilos del pool"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,38 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from src.domain.ports.cache_port import CachePort
+
+
+class InMemoryCache(CachePort):
+    """Adaptador de salida - Caché LRU en proceso con TTL"""
+    
+    def __init__(self, ttl_seconds: int = 60, max_entries: int = 10_000):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+    
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+    
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+    
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
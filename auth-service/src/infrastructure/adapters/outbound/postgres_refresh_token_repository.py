@@ -0,0 +1,100 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from src.domain.entities.refresh_token import RefreshToken
+from src.domain.ports.refresh_token_repository_port import RefreshTokenRepositoryPort
+from src.infrastructure.persistence.models.refresh_token_model import RefreshTokenModel
+
+
+class PostgresRefreshTokenRepository(RefreshTokenRepositoryPort):
+    """Adaptador de salida - Repositorio PostgreSQL de refresh tokens"""
+    
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def save(self, token: RefreshToken) -> RefreshToken:
+        """Guarda un refresh token en la DB"""
+        db_token = RefreshTokenModel(
+            id=UUID(token.id),
+            user_id=UUID(token.user_id),
+            token_hash=token.token_hash,
+            family_id=UUID(token.family_id),
+            expires_at=token.expires_at
+        )
+        self._session.add(db_token)
+        await self._session.flush()
+        return token
+    
+    async def find_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        """Busca un refresh token por su hash"""
+        result = await self._session.execute(
+            select(RefreshTokenModel).where(RefreshTokenModel.token_hash == token_hash)
+        )
+        db_token = result.scalar_one_or_none()
+        return self._to_entity(db_token) if db_token else None
+    
+    async def revoke(self, token_id: str, replaced_by: Optional[str] = None) -> bool:
+        """
+        Revoca un refresh token solo si sigue activo
+
+        Con dos rotaciones concurrentes del mismo token, la segunda espera el
+        bloqueo de la fila, ve revoked_at ya asignado y no actualiza nada.
+        """
+        result = await self._session.execute(
+            update(RefreshTokenModel)
+            .where(
+                RefreshTokenModel.id == UUID(token_id),
+                RefreshTokenModel.revoked_at.is_(None)
+            )
+            .values(
+                revoked_at=datetime.utcnow(),
+                replaced_by=UUID(replaced_by) if replaced_by else None
+            )
+        )
+        return result.rowcount == 1
+    
+    async def revoke_family(self, family_id: str) -> int:
+        """
+        Revoca todos los tokens activos de una familia
+
+        Se confirma de inmediato: en la detección de reutilización la petición
+        termina en error y el rollback de la sesión no debe deshacer la revocación.
+        """
+        result = await self._session.execute(
+            update(RefreshTokenModel)
+            .where(
+                RefreshTokenModel.family_id == UUID(family_id),
+                RefreshTokenModel.revoked_at.is_(None)
+            )
+            .values(revoked_at=datetime.utcnow())
+        )
+        await self._session.commit()
+        return result.rowcount
+    
+    async def revoke_all_for_user(self, user_id: str) -> int:
+        """Revoca todos los tokens activos de un usuario"""
+        result = await self._session.execute(
+            update(RefreshTokenModel)
+            .where(
+                RefreshTokenModel.user_id == UUID(user_id),
+                RefreshTokenModel.revoked_at.is_(None)
+            )
+            .values(revoked_at=datetime.utcnow())
+        )
+        return result.rowcount
+    
+    @staticmethod
+    def _to_entity(model: RefreshTokenModel) -> RefreshToken:
+        """Convierte modelo SQLAlchemy a entidad de dominio"""
+        return RefreshToken(
+            id=str(model.id),
+            user_id=str(model.user_id),
+            token_hash=str(model.token_hash),
+            family_id=str(model.family_id),
+            expires_at=model.expires_at,
+            created_at=model.created_at,
+            revoked_at=model.revoked_at,
+            replaced_by=str(model.replaced_by) if model.replaced_by else None
+        )
@@ -4,14 +4,27 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from src.domain.entities.user import User
 from src.domain.ports.user_repository_port import UserRepositoryPort
+from src.domain.ports.cache_port import CachePort
+from src.infrastructure.config.database import after_commit
 from src.infrastructure.persistence.models.user_model import UserModel
 
 
 class PostgresUserRepository(UserRepositoryPort):
     """Adaptador de salida - Repositorio PostgreSQL"""
     
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, user_cache: Optional[CachePort] = None):
         self._session = session
+        self._user_cache = user_cache
+    
+    def _invalidate(self, user_id: str) -> None:
+        """Invalida la caché del usuario cuando get_db confirma la transacción.
+
+        Borrarla tras el flush no basta: un /auth/me concurrente leería aún la fila
+        anterior y la volvería a cachear durante todo el TTL.
+        """
+        if self._user_cache:
+            cache = self._user_cache
+            after_commit(self._session, lambda: cache.delete(user_id))
     
     async def save(self, user: User) -> User:
         """Guarda un usuario en la DB"""
@@ -64,6 +77,7 @@ class PostgresUserRepository(UserRepositoryPort):
             self._session.add(db_user)
             await self._session.flush()
             await self._session.refresh(db_user)
+            self._invalidate(user.id)
             return self._to_entity(db_user)
         
         return user
@@ -78,6 +92,7 @@ class PostgresUserRepository(UserRepositoryPort):
         if db_user:
             await self._session.delete(db_user)
             await self._session.flush()
+            self._invalidate(user_id)
             return True
         return False
     
@@ -0,0 +1,37 @@
+import json
+from typing import Any, Dict, Optional
+from src.domain.ports.cache_port import CachePort
+
+
+class RedisCache(CachePort):
+    """
+    Adaptador de salida - Caché en Redis con TTL
+
+    Dependencia opcional: requiere el paquete `redis` (pip install redis).
+    """
+    
+    def __init__(self, url: str, ttl_seconds: int = 60, prefix: str = "auth:"):
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as e:
+            raise RuntimeError("USER_CACHE_BACKEND=redis requiere el paquete 'redis'") from e
+        
+        self._client = aioredis.from_url(url, decode_responses=True)
+        self._ttl = ttl_seconds
+        self._prefix = prefix
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._client.get(self._prefix + key)
+        return json.loads(raw) if raw else None
+    
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        await self._client.set(self._prefix + key, json.dumps(value), ex=self._ttl)
+    
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._prefix + key)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "redis"}
+    
+    async def close(self) -> None:
+        await self._client.aclose()
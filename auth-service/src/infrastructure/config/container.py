@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from src.domain.ports.cache_port import CachePort
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.adapters.outbound.memory_cache import InMemoryCache
+from src.infrastructure.adapters.outbound.bcrypt_password_hasher import BcryptPasswordHasher
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.infrastructure.security.revocation_filter import RevocationFilter
+from src.infrastructure.security.rate_limiter import (
+    LoginRateLimiter,
+    TokenBucketLimiter,
+    RedisTokenBucketLimiter
+)
+
+
+@dataclass(frozen=True)
+class Container:
+    """Dependencias sin estado por petición, creadas una vez en el lifespan"""
+    settings: Settings
+    jwt_handler: JWTHandler
+    password_hasher: BcryptPasswordHasher
+    user_cache: CachePort
+    login_limiter: LoginRateLimiter
+
+
+def build_user_cache(settings: Settings) -> CachePort:
+    """Caché de usuarios según USER_CACHE_BACKEND"""
+    if settings.USER_CACHE_BACKEND == "redis":
+        from src.infrastructure.adapters.outbound.redis_cache import RedisCache
+        return RedisCache(settings.REDIS_URL, ttl_seconds=settings.USER_CACHE_TTL_SECONDS)
+    return InMemoryCache(
+        ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+        max_entries=settings.USER_CACHE_MAX_ENTRIES
+    )
+
+
+def build_login_limiter(settings: Settings) -> LoginRateLimiter:
+    """Limitador de login según LOGIN_RATE_LIMIT_BACKEND"""
+    def bucket(capacity: int, per_minute: float):
+        if settings.LOGIN_RATE_LIMIT_BACKEND == "redis":
+            return RedisTokenBucketLimiter(settings.REDIS_URL, capacity, per_minute / 60)
+        return TokenBucketLimiter(capacity, per_minute / 60)
+    
+    return LoginRateLimiter(
+        by_ip=bucket(settings.LOGIN_RATE_IP_CAPACITY, settings.LOGIN_RATE_IP_PER_MINUTE),
+        by_email=bucket(settings.LOGIN_RATE_EMAIL_CAPACITY, settings.LOGIN_RATE_EMAIL_PER_MINUTE)
+    )
+
+
+def build_container(settings: Settings) -> Container:
+    """Construye los singletons de la aplicación a partir de la configuración"""
+    return Container(
+        settings=settings,
+        jwt_handler=JWTHandler(
+            settings,
+            revocation_filter=RevocationFilter(
+                ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                capacity=settings.REVOCATION_FILTER_CAPACITY
+            )
+        ),
+        password_hasher=BcryptPasswordHasher(
+            rounds=settings.BCRYPT_ROUNDS,
+            max_workers=settings.BCRYPT_MAX_WORKERS or None
+        ),
+        user_cache=build_user_cache(settings),
+        login_limiter=build_login_limiter(settings)
+    )
+
+
+async def close_container(container: Container) -> None:
+    """Libera los recursos de los singletons"""
+    container.password_hasher.shutdown()
+    close = getattr(container.user_cache, "close", None)
+    if close:
+        await close()
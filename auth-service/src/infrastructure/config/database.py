@@ -1,4 +1,4 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from src.infrastructure.config.settings import get_settings
@@ -30,6 +30,11 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Registra un callback que get_db ejecuta cuando la transacción ya está confirmada"""
+    session.info.setdefault("after_commit", []).append(callback)
+
+
 async def get_db() -> AsyncIterator[AsyncSession]:
     """Dependency para obtener sesión de DB"""
     async with AsyncSessionLocal() as session:
@@ -37,7 +42,11 @@ async def get_db() -> AsyncIterator[AsyncSession]:
             yield session
             await session.commit()
         except Exception:
+            session.info.pop("after_commit", None)
             await session.rollback()
             raise
         finally:
             await session.close()
+        # Fuera del try: un fallo aquí no debe intentar revertir lo ya confirmado
+        for callback in session.info.pop("after_commit", []):
+            await callback()
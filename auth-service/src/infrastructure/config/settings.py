@@ -12,7 +12,27 @@ class Settings(BaseSettings):
     # Security
     SECRET_KEY: str = "dev-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    REVOCATION_FILTER_CAPACITY: int = 100_000
+    
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_MAX_WORKERS: int = 0  # 0 = número de CPUs
+    
+    # User cache (get_current_user)
+    USER_CACHE_BACKEND: str = "memory"  # memory | redis
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_ENTRIES: int = 10_000
+    REDIS_URL: str = "redis://localhost:6379/0"
+    
+    # Login rate limiting (token bucket por IP y por email)
+    LOGIN_RATE_LIMIT_BACKEND: str = "memory"  # memory | redis
+    LOGIN_RATE_IP_CAPACITY: int = 20
+    LOGIN_RATE_IP_PER_MINUTE: float = 30
+    LOGIN_RATE_EMAIL_CAPACITY: int = 5
+    LOGIN_RATE_EMAIL_PER_MINUTE: float = 2
+    TRUST_FORWARDED_FOR: bool = False  # True solo si el único acceso es a través del api-gateway
     
     # API
     API_V1_PREFIX: str = "/api/v1"
@@ -31,9 +51,3 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Singleton de configuración"""
     return Settings()
-
-def get_settings() -> Settings:
-    """Singleton de configuración"""
-    s = Settings()
-    print(f"🔑 Auth JWT Secret Key: {s.SECRET_KEY}")  # DEBUG
-    return s
\ No newline at end of file
@@ -1,22 +1,37 @@
 from datetime import datetime, timedelta
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict, Any
+import hashlib
+import secrets
+import uuid
 from jose import jwt, JWTError
-from src.infrastructure.config.settings import get_settings
-
-settings = get_settings()
+from src.infrastructure.config.settings import Settings, get_settings
+from src.infrastructure.security.revocation_filter import RevocationFilter
 
 
 class JWTHandler:
-    """Manejador de tokens JWT"""
+    """Manejador de tokens JWT (access) y tokens opacos de refresco"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        revocation_filter: Optional[RevocationFilter] = None
+    ):
+        settings = settings or get_settings()
         self._secret_key = settings.SECRET_KEY
         self._algorithm = settings.ALGORITHM
         self._expire_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        self._refresh_expire_days = settings.REFRESH_TOKEN_EXPIRE_DAYS
+        self._revocation_filter = revocation_filter or RevocationFilter(
+            ttl_seconds=self._expire_minutes * 60
+        )
+    
+    @property
+    def refresh_token_ttl(self) -> timedelta:
+        return timedelta(days=self._refresh_expire_days)
     
     def create_access_token(self, subject: str) -> Tuple[str, int]:
         """
-        Crea un token de acceso
+        Crea un token de acceso de vida corta
         Returns: (token, expires_in_seconds)
         """
         expire = datetime.utcnow() + timedelta(minutes=self._expire_minutes)
@@ -26,16 +41,31 @@ class JWTHandler:
             "sub": subject,
             "exp": expire,
             "iat": datetime.utcnow(),
+            "jti": uuid.uuid4().hex,
             "type": "access"
         }
         
         token = jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
         return token, expires_in
     
-    def decode_token(self, token: str) -> Optional[str]:
+    @staticmethod
+    def create_refresh_token() -> Tuple[str, str]:
         """
-        Decodifica un token y retorna el subject (user_id)
-        Returns None si el token es inválido
+        Crea un refresh token opaco
+        Returns: (token, token_hash) - solo el hash se persiste
+        """
+        token = secrets.token_urlsafe(32)
+        return token, JWTHandler.hash_refresh_token(token)
+    
+    @staticmethod
+    def hash_refresh_token(token: str) -> str:
+        """SHA-256 del refresh token (tiene 256 bits de entropía, no requiere bcrypt)"""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+    
+    def decode_payload(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Valida un access token sin consultar la DB
+        Returns None si es inválido, expirado o revocado
         """
         try:
             payload = jwt.decode(
@@ -43,6 +73,36 @@ class JWTHandler:
                 self._secret_key, 
                 algorithms=[self._algorithm]
             )
-            return payload.get("sub")
         except JWTError:
             return None
+        
+        if payload.get("type") != "access":
+            return None
+        
+        jti = payload.get("jti")
+        if jti and self._revocation_filter.is_revoked(jti):
+            return None
+        
+        return payload
+    
+    def decode_token(self, token: str) -> Optional[str]:
+        """
+        Decodifica un token y retorna el subject (user_id)
+        Returns None si el token es inválido
+        """
+        payload = self.decode_payload(token)
+        return payload.get("sub") if payload else None
+    
+    def revoke_access_token(self, token: str) -> None:
+        """Revoca un access token hasta su expiración"""
+        payload = self.decode_payload(token)
+        if payload and payload.get("jti"):
+            self._revocation_filter.revoke(payload["jti"], expires_at=payload.get("exp"))
+    
+    def revoked_since(self, cursor: int) -> Dict[str, Any]:
+        """Access tokens revocados después de `cursor` (sincronización de otros servicios)"""
+        latest, revoked = self._revocation_filter.revoked_since(cursor)
+        return {"epoch": self._revocation_filter.epoch, "cursor": latest, "revoked": revoked}
+    
+    def revocation_stats(self) -> Dict[str, int]:
+        return self._revocation_filter.stats()
@@ -0,0 +1,127 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from bovara_ops import count_rate_limit
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket por clave en memoria
+
+    Cada clave tiene `capacity` intentos de ráfaga que se recargan a
+    `refill_per_second`. Las claves menos usadas se descartan al superar
+    `max_keys` (un bucket descartado equivale a uno lleno).
+    """
+
+    def __init__(self, capacity: int, refill_per_second: float, max_keys: int = 100_000):
+        self._capacity = float(capacity)
+        self._refill = refill_per_second
+        self._max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def acquire(self, key: str) -> float:
+        """Consume un token. Returns 0 si se permite, o los segundos hasta el próximo token"""
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (self._capacity, now))
+        tokens = min(self._capacity, tokens + (now - updated) * self._refill)
+
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            return (1 - tokens) / self._refill
+
+        self._buckets[key] = (tokens - 1, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+        return 0.0
+
+
+class RedisTokenBucketLimiter:
+    """
+    Token bucket compartido entre procesos en Redis (script Lua atómico)
+
+    Dependencia opcional: requiere el paquete `redis` (pip install redis).
+    """
+
+    _SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local refill = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+    local tokens = tonumber(state[1]) or capacity
+    local updated = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + (now - updated) * refill)
+    local wait = 0
+    if tokens < 1 then
+        wait = (1 - tokens) / refill
+    else
+        tokens = tokens - 1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / refill) + 1)
+    return tostring(wait)
+    """
+
+    def __init__(self, url: str, capacity: int, refill_per_second: float, prefix: str = "auth:rl:"):
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as e:
+            raise RuntimeError("LOGIN_RATE_LIMIT_BACKEND=redis requiere el paquete 'redis'") from e
+
+        self._client = aioredis.from_url(url, decode_responses=True)
+        self._script = self._client.register_script(self._SCRIPT)
+        self._capacity = capacity
+        self._refill = refill_per_second
+        self._prefix = prefix
+
+    async def acquire(self, key: str) -> float:
+        wait = await self._script(
+            keys=[self._prefix + key],
+            args=[self._capacity, self._refill, time.time()]
+        )
+        return float(wait)
+
+
+class LoginRateLimiter:
+    """
+    Escudo contra fuerza bruta / credential stuffing delante de login
+
+    Se consulta antes de cualquier acceso a DB o bcrypt: primero el bucket
+    por IP (frena floods desde un origen) y luego el bucket por email (frena
+    ataques distribuidos contra una misma cuenta).
+    """
+
+    def __init__(self, by_ip, by_email):
+        self._by_ip = by_ip
+        self._by_email = by_email
+        self._processed = 0
+        self._rejected: Dict[str, int] = {"ip": 0, "email": 0}
+
+    async def check(self, ip: Optional[str], email: str) -> float:
+        """Returns 0 si el intento puede procesarse, o los segundos de espera sugeridos"""
+        if ip:
+            wait = await self._by_ip.acquire(f"ip:{ip}")
+            if wait:
+                self._rejected["ip"] += 1
+                count_rate_limit("login", "rejected_ip")
+                return wait
+
+        wait = await self._by_email.acquire(f"email:{email.strip().lower()}")
+        if wait:
+            self._rejected["email"] += 1
+            count_rate_limit("login", "rejected_email")
+            return wait
+
+        self._processed += 1
+        count_rate_limit("login", "processed")
+        return 0.0
+
+    def stats(self) -> Dict[str, int]:
+        """Intentos de login procesados vs rechazados por el limitador"""
+        return {
+            "processed": self._processed,
+            "rejected_ip": self._rejected["ip"],
+            "rejected_email": self._rejected["email"],
+        }
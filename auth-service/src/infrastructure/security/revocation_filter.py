@@ -0,0 +1,105 @@
+import hashlib
+import math
+import time
+import uuid
+from collections import deque
+from threading import Lock
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+class _BloomFilter:
+    """Bloom filter de tamaño fijo sobre un bytearray"""
+
+    def __init__(self, size_bits: int, num_hashes: int):
+        self._size = size_bits
+        self._num_hashes = num_hashes
+        self._bits = bytearray((size_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        # Doble hashing (Kirsch-Mitzenmacher) a partir de un único blake2b
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._size for i in range(self._num_hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class RevocationFilter:
+    """
+    Lista de revocación de access tokens (por jti) en memoria
+
+    Dos generaciones de bloom filter que rotan cada `ttl_seconds` (la vida de
+    un access token): un jti revocado sigue presente al menos ese tiempo, y
+    después ya no importa porque el token expiró. La consulta es O(k) sin E/S;
+    un falso positivo solo obliga al cliente a usar su refresh token.
+
+    Además guarda un registro ordenado de las revocaciones aún vigentes para
+    que otros servicios que validan JWT por su cuenta (core-service) puedan
+    sincronizarse (`revoked_since`).
+    """
+
+    def __init__(self, ttl_seconds: int, capacity: int = 100_000, error_rate: float = 0.001):
+        self._ttl = ttl_seconds
+        self._size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._num_hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._current = _BloomFilter(self._size, self._num_hashes)
+        self._previous = _BloomFilter(self._size, self._num_hashes)
+        self._rotated_at = time.monotonic()
+        self._lock = Lock()
+        # (secuencia, jti, exp en epoch) en orden de revocación
+        self._log: Deque[Tuple[int, str, float]] = deque()
+        self._seq = 0
+        self.epoch = uuid.uuid4().hex  # cambia al reiniciar: los clientes deben resincronizar
+
+    def _maybe_rotate(self) -> None:
+        if time.monotonic() - self._rotated_at >= self._ttl:
+            with self._lock:
+                if time.monotonic() - self._rotated_at >= self._ttl:
+                    self._previous = self._current
+                    self._current = _BloomFilter(self._size, self._num_hashes)
+                    self._rotated_at = time.monotonic()
+
+    def revoke(self, jti: str, expires_at: Optional[float] = None) -> None:
+        """Marca un jti como revocado (expires_at: exp del token, en epoch)"""
+        self._maybe_rotate()
+        with self._lock:
+            self._current.add(jti)
+            self._seq += 1
+            self._log.append((self._seq, jti, expires_at or time.time() + self._ttl))
+
+    def revoked_since(self, cursor: int) -> Tuple[int, List[Dict[str, object]]]:
+        """Revocaciones posteriores a `cursor` de tokens aún no expirados; devuelve (nuevo cursor, lista)"""
+        now = time.time()
+        with self._lock:
+            # Casi en orden de exp (todos los tokens viven lo mismo): basta con podar el inicio
+            while self._log and self._log[0][2] <= now:
+                self._log.popleft()
+            revoked = [
+                {"jti": jti, "exp": exp}
+                for seq, jti, exp in self._log
+                if seq > cursor and exp > now
+            ]
+            return self._seq, revoked
+
+    def is_revoked(self, jti: str) -> bool:
+        """True si el jti fue revocado (con probabilidad de falso positivo acotada)"""
+        self._maybe_rotate()
+        return jti in self._current or jti in self._previous
+
+    def stats(self) -> Dict[str, int]:
+        """Tamaño y ocupación de las generaciones del filtro"""
+        return {
+            "size_bytes": 2 * len(self._current._bits),
+            "num_hashes": self._num_hashes,
+            "current": self._current.count,
+            "previous": self._previous.count,
+            "log": len(self._log),
+        }
@@ -1,11 +1,20 @@
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from src.infrastructure.config.settings import get_settings
 from src.infrastructure.config.database import engine, Base
 from src.infrastructure.adapters.inbound.http.auth_controller import router as auth_router
+from src.infrastructure.adapters.inbound.http.internal_controller import router as internal_router
+from src.infrastructure.config.container import build_container, close_container
+from bovara_ops import ReadinessProbe, health_router, async_sql_check, setup_metrics, setup_tracing, setup_logging, instrument_engine, track_pool
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Health checks (readiness cacheada, refrescada en segundo plano)
+probe = ReadinessProbe(service="auth-service")
+probe.add_check("database", async_sql_check(engine))
 
 
 @asynccontextmanager
@@ -14,13 +23,36 @@ async def lifespan(app: FastAPI):
     # Startup: Crear tablas
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    print("Base de datos inicializada")
+    logger.info("Base de datos inicializada")
+    
+    # Singletons compartidos por todas las peticiones
+    app.state.container = build_container(settings)
+    container = app.state.container
+    
+    # Cola de bcrypt en /metrics (worker_pool_queue_depth{pool="bcrypt"}); los intentos
+    # de login los cuenta el limitador (rate_limit_decisions_total{limiter="login"})
+    hasher = container.password_hasher
+    track_pool("bcrypt", lambda: hasher.stats()["queue_depth"], lambda: hasher.stats()["in_flight"])
+    
+    async def components():
+        """Métricas de los singletons (informativo, no afecta readiness)"""
+        return {
+            "password_hasher": container.password_hasher.stats(),
+            "revocation_filter": container.jwt_handler.revocation_stats(),
+            "user_cache": container.user_cache.stats(),
+            "login_rate_limit": container.login_limiter.stats()
+        }
+    
+    probe.add_check("components", components, critical=False)
+    await probe.start()
     
     yield
     
     # Shutdown
+    await probe.stop()
+    await close_container(app.state.container)
     await engine.dispose()
-    print("Conexión a DB cerrada")
+    logger.info("Conexión a DB cerrada")
 
 
 # Crear aplicación
@@ -42,8 +74,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Métricas (/metrics) y trazas distribuidas
+setup_metrics(app, "auth-service")
+setup_tracing(app, "auth-service")
+instrument_engine(engine)
+
+
+# Logging estructurado (JSON, asíncrono y muestreado por petición)
+setup_logging("auth-service", app)
+
 # Registrar routers
 app.include_router(auth_router, prefix=settings.API_V1_PREFIX)
+app.include_router(internal_router)  # fuera de /api/v1/auth: el api-gateway no lo expone
+app.include_router(health_router(probe))
 
 
 @app.get("/", tags=["Health"])
@@ -56,14 +99,6 @@ async def root():
     }
 
 
-@app.get("/health", tags=["Health"])
-async def health_check():
-    """Health check detallado"""
-    return {
-        "status": "healthy",
-        "database": "connected",
-        "service": "auth-service"
-    }
     
     
     # Configurar CORS para permitir peticiones desde la app móvil
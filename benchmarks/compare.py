@@ -0,0 +1,84 @@
+# benchmarks/compare.py
+"""
+Compara un reporte de loadgen.py con un baseline.
+
+Una regresión es: p95 o p99 más altos, throughput más bajo o tasa de error
+mayor que el baseline en más de `tolerance` (fracción). Los escenarios que
+solo aparecen en uno de los dos reportes se listan pero no cuentan.
+
+Uso:
+    python compare.py results/report.json baselines/100k.json --tolerance 0.1
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+
+# (métrica, True si más alto es peor)
+METRICS = [
+    ("p95_ms", True),
+    ("p99_ms", True),
+    ("throughput_rps", False),
+    ("error_rate", True),
+]
+
+
+def compare_reports(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.10) -> Dict[str, Any]:
+    current, base = report["scenarios"], baseline["scenarios"]
+    rows, regressions = [], []
+
+    for name in sorted(set(current) & set(base)):
+        for metric, higher_is_worse in METRICS:
+            old, new = base[name][metric], current[name][metric]
+            change = (new - old) / old if old else (0.0 if new == old else float("inf"))
+            worse = change > tolerance if higher_is_worse else change < -tolerance
+            # La tasa de error se compara en puntos absolutos: 0 → 0.001 no es un +inf%
+            if metric == "error_rate":
+                worse = new - old > tolerance / 10
+            row = {"scenario": name, "metric": metric, "baseline": old, "current": new,
+                   "change": round(change, 4) if change != float("inf") else None, "regression": worse}
+            rows.append(row)
+            if worse:
+                regressions.append(row)
+
+    return {
+        "tolerance": tolerance,
+        "rows": rows,
+        "regressions": regressions,
+        "only_in_report": sorted(set(current) - set(base)),
+        "only_in_baseline": sorted(set(base) - set(current)),
+    }
+
+
+def format_comparison(comparison: Dict[str, Any]) -> str:
+    lines = [f"\nComparación con baseline (tolerancia {comparison['tolerance']:.0%}):"]
+    for row in comparison["rows"]:
+        change = "n/a" if row["change"] is None else f"{row['change']:+.1%}"
+        flag = "❌" if row["regression"] else "  "
+        lines.append(f"{flag} {row['scenario']:<24} {row['metric']:<15} {row['baseline']:>10} → {row['current']:>10} ({change})")
+    for name in comparison["only_in_report"]:
+        lines.append(f"   {name}: sin baseline")
+    for name in comparison["only_in_baseline"]:
+        lines.append(f"   {name}: no ejecutado en este reporte")
+    lines.append(
+        f"\n{'❌' if comparison['regressions'] else '✅'} {len(comparison['regressions'])} regresiones"
+    )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Comparar un reporte de benchmark con un baseline")
+    parser.add_argument("report")
+    parser.add_argument("baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    comparison = compare_reports(
+        json.loads(Path(args.report).read_text()),
+        json.loads(Path(args.baseline).read_text()),
+        args.tolerance,
+    )
+    print(format_comparison(comparison))
+    sys.exit(1 if comparison["regressions"] else 0)
@@ -0,0 +1,236 @@
+# benchmarks/loadgen.py
+"""
+Generador de carga para el stack completo de Bovara.
+
+Cada escenario se ejecuta de forma aislada (uno tras otro) con `concurrency`
+clientes concurrentes durante `duration` segundos, tras un calentamiento. Se
+registran throughput, latencias p50/p95/p99 y códigos de estado en un reporte
+JSON que puede compararse con un baseline guardado (ver compare.py).
+
+Uso:
+    python loadgen.py --manifest results/seed_100k.json --output results/report.json
+    python loadgen.py --manifest results/seed_100k.json --scenarios ml_forecast_predict --concurrency 32
+    python loadgen.py --manifest results/seed_100k.json --baseline baselines/100k.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from compare import compare_reports, format_comparison
+
+
+BENCH_EMAIL = "bench-{i}@bovara.com"
+BENCH_PASSWORD = "bench-password-123"
+
+
+@dataclass
+class Scenario:
+    """Petición a repetir. `build` recibe el contexto y devuelve (método, url, json)"""
+
+    name: str
+    build: Callable[[Dict[str, Any], random.Random], tuple]
+    max_requests: Optional[int] = None   # tope para escenarios caros (entrenamiento)
+    max_concurrency: Optional[int] = None
+
+
+def _scenarios(gateway: str, ml: str) -> List[Scenario]:
+    return [
+        Scenario("gateway_cattle_list", lambda ctx, rng: ("GET", f"{gateway}/api/v1/cattle?limit=50&skip={rng.randrange(0, 500)}", None)),
+        Scenario("gateway_cattle_get", lambda ctx, rng: ("GET", f"{gateway}/api/v1/cattle/{rng.choice(ctx['cattle_ids'])}", None)),
+        Scenario("gateway_health_events", lambda ctx, rng: ("GET", f"{gateway}/api/v1/health-events/cattle/{rng.choice(ctx['cattle_ids'])}", None)),
+        Scenario("gateway_heat_events", lambda ctx, rng: ("GET", f"{gateway}/api/v1/heat-events/cattle/{rng.choice(ctx['female_ids'])}", None)),
+        Scenario("auth_login", lambda ctx, rng: (
+            "POST", f"{gateway}/api/v1/auth/login",
+            {"email": BENCH_EMAIL.format(i=rng.randrange(ctx["login_users"])), "password": BENCH_PASSWORD},
+        )),
+        Scenario("ml_forecast_predict", lambda ctx, rng: ("GET", f"{ml}/api/v1/forecasting/predict/{rng.choice(ctx['female_ids'])}", None)),
+        # Rancho del usuario del token: sembrar con seed.py --owner-id <id de bench-0> para que vea el hato
+        Scenario("ml_forecast_upcoming", lambda ctx, rng: ("GET", f"{ml}/api/v1/forecasting/upcoming?days={rng.choice([7, 14, 30])}&skip={rng.randrange(0, 5) * 50}&limit=50", None)),
+        Scenario("ml_cluster_predict", lambda ctx, rng: ("GET", f"{ml}/api/v1/clustering/predict/{rng.choice(ctx['cattle_ids'])}", None)),
+        Scenario("ml_forecast_train", lambda ctx, rng: ("POST", f"{ml}/api/v1/forecasting/train", None), max_requests=3, max_concurrency=1),
+        Scenario("ml_cluster_train", lambda ctx, rng: ("POST", f"{ml}/api/v1/clustering/train", None), max_requests=3, max_concurrency=1),
+    ]
+
+
+def _percentile(ordered: List[float], p: float) -> float:
+    """Percentil por rango más cercano sobre una lista ordenada"""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(p * len(ordered)) - 1)]
+
+
+def _summarize(latencies: List[float], statuses: Dict[str, int], errors: int, elapsed: float) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    total = len(ordered) + errors
+    ok = sum(count for status, count in statuses.items() if status.startswith("2"))
+    return {
+        "requests": total,
+        "ok": ok,
+        "errors": total - ok,
+        "error_rate": round((total - ok) / total, 4) if total else 0.0,
+        "status_counts": statuses,
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered), 2) if ordered else 0.0,
+        "p50_ms": round(_percentile(ordered, 0.50), 2),
+        "p95_ms": round(_percentile(ordered, 0.95), 2),
+        "p99_ms": round(_percentile(ordered, 0.99), 2),
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+        "seconds": round(elapsed, 2),
+    }
+
+
+async def _run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    ctx: Dict[str, Any],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed: int,
+) -> Dict[str, Any]:
+    concurrency = min(concurrency, scenario.max_concurrency or concurrency)
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    errors = 0
+    issued = 0
+    recording = False
+
+    async def worker(worker_id: int, deadline: float) -> None:
+        nonlocal errors, issued
+        rng = random.Random(seed * 1_000 + worker_id)
+        while time.perf_counter() < deadline:
+            if scenario.max_requests is not None:
+                if issued >= scenario.max_requests:
+                    return
+                issued += 1
+            method, url, body = scenario.build(ctx, rng)
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body, headers=ctx["headers"])
+            except httpx.HTTPError:
+                if recording:
+                    errors += 1
+                continue
+            if recording:
+                latencies.append((time.perf_counter() - start) * 1000)
+                key = str(response.status_code)
+                statuses[key] = statuses.get(key, 0) + 1
+
+    # Los escenarios de entrenamiento no se calientan: cada petición cuenta
+    if warmup and scenario.max_requests is None:
+        await asyncio.gather(*(worker(i, time.perf_counter() + warmup) for i in range(concurrency)))
+
+    recording = True
+    start = time.perf_counter()
+    deadline = start + (duration if scenario.max_requests is None else 24 * 3600)
+    await asyncio.gather(*(worker(i, deadline) for i in range(concurrency)))
+    return _summarize(latencies, statuses, errors, time.perf_counter() - start)
+
+
+async def _prepare_auth(client: httpx.AsyncClient, gateway: str, users: int) -> Dict[str, str]:
+    """Registra los usuarios del benchmark (409 si ya existen) y obtiene un token"""
+    for i in range(users):
+        await client.post(f"{gateway}/api/v1/auth/register", json={
+            "email": BENCH_EMAIL.format(i=i), "password": BENCH_PASSWORD, "full_name": f"Bench {i}",
+        })
+    response = await client.post(f"{gateway}/api/v1/auth/login", json={
+        "email": BENCH_EMAIL.format(i=0), "password": BENCH_PASSWORD,
+    })
+    if response.status_code != 200:
+        print(f"⚠️ Login de preparación falló ({response.status_code}); se continúa sin token", file=sys.stderr)
+        return {}
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    manifest = json.loads(Path(args.manifest).read_text())
+    scenarios = {s.name: s for s in _scenarios(args.gateway_url.rstrip("/"), args.ml_url.rstrip("/"))}
+    selected = args.scenarios.split(",") if args.scenarios else [n for n, s in scenarios.items() if s.max_requests is None]
+    unknown = [name for name in selected if name not in scenarios]
+    if unknown:
+        raise SystemExit(f"Escenarios desconocidos: {', '.join(unknown)}. Disponibles: {', '.join(scenarios)}")
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        headers = await _prepare_auth(client, args.gateway_url.rstrip("/"), args.login_users)
+        ctx = {
+            "cattle_ids": manifest["cattle_ids"],
+            "female_ids": manifest["female_ids"] or manifest["cattle_ids"],
+            "login_users": args.login_users,
+            "headers": headers,
+        }
+
+        results = {}
+        for name in selected:
+            print(f"▶ {name}", file=sys.stderr)
+            results[name] = await _run_scenario(
+                client, scenarios[name], ctx, args.concurrency, args.duration, args.warmup, args.seed,
+            )
+            summary = results[name]
+            print(
+                f"  {summary['throughput_rps']} req/s  p50={summary['p50_ms']}ms  "
+                f"p95={summary['p95_ms']}ms  p99={summary['p99_ms']}ms  errores={summary['errors']}",
+                file=sys.stderr,
+            )
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "herd_size": manifest.get("herd_size"),
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "seed": args.seed,
+            "gateway_url": args.gateway_url,
+            "ml_url": args.ml_url,
+        },
+        "scenarios": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de carga de Bovara")
+    parser.add_argument("--manifest", required=True, help="Manifiesto generado por seed.py")
+    parser.add_argument("--gateway-url", default="http://localhost:8002")
+    parser.add_argument("--ml-url", default="http://localhost:8003")
+    parser.add_argument("--scenarios", help="Lista separada por comas (defecto: todos menos entrenamiento)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="Segundos medidos por escenario")
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--login-users", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=str(Path(__file__).parent / "results" / "report.json"))
+    parser.add_argument("--baseline", help="Reporte baseline contra el que comparar")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Regresión tolerada (fracción)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\n✅ Reporte guardado en {output}")
+
+    if args.baseline:
+        comparison = compare_reports(report, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        print(format_comparison(comparison))
+        sys.exit(1 if comparison["regressions"] else 0)
@@ -0,0 +1,36 @@
+# bovara_data/__init__.py
+from bovara_data.models import (
+    Base,
+    Cattle,
+    HealthEvent,
+    HeatEvent,
+    Reminder,
+    GenderEnum,
+    EventTypeEnum,
+    AdministrationRouteEnum,
+    ReminderTypeEnum,
+    ReminderStatusEnum,
+)
+from bovara_data.repositories import (
+    CattleBaseRepository,
+    HealthEventBaseRepository,
+    HeatEventBaseRepository,
+    ReminderBaseRepository,
+)
+
+__all__ = [
+    "Base",
+    "Cattle",
+    "HealthEvent",
+    "HeatEvent",
+    "Reminder",
+    "GenderEnum",
+    "EventTypeEnum",
+    "AdministrationRouteEnum",
+    "ReminderTypeEnum",
+    "ReminderStatusEnum",
+    "CattleBaseRepository",
+    "HealthEventBaseRepository",
+    "HeatEventBaseRepository",
+    "ReminderBaseRepository",
+]
@@ -0,0 +1,172 @@
+# bovara_data/models.py
+"""
+Mapeos de las tablas de core-service (cattle, health_events, heat_events, reminders).
+
+Describen el mismo esquema que las migraciones Alembic de core-service: columnas,
+tipos, claves foráneas e índices. Es el único mapeo de estas tablas: core-service
+usa estas mismas clases y declara sus tablas propias sobre `Base`. En la base de
+core-service las tablas las crea Alembic; la base propia de chatbot-service se crea
+a partir de `Base.metadata` (src/init_db.py), así ambas tienen exactamente el mismo
+esquema. Los servicios leen y escriben con estos mismos mapeos; las relaciones son
+`viewonly` y los borrados en cascada los resuelve Postgres.
+"""
+from sqlalchemy import Column, String, Text, Boolean, Date, DateTime, Float, ForeignKey, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import declarative_base, relationship
+from datetime import datetime
+import uuid
+import enum
+
+
+Base = declarative_base()
+
+
+class GenderEnum(str, enum.Enum):
+    male = "male"
+    female = "female"
+
+
+class EventTypeEnum(str, enum.Enum):
+    vaccine = "vaccine"
+    treatment = "treatment"
+    checkup = "checkup"
+    surgery = "surgery"
+    injury = "injury"
+    illness = "illness"
+    other = "other"
+
+
+class AdministrationRouteEnum(str, enum.Enum):
+    oral = "oral"
+    intramuscular = "intramuscular"
+    subcutaneous = "subcutaneous"
+    intravenous = "intravenous"
+    topical = "topical"
+    other = "other"
+
+
+class ReminderTypeEnum(str, enum.Enum):
+    vaccine = "vaccine"
+    checkup = "checkup"
+    treatment = "treatment"
+    feeding = "feeding"
+    breeding = "breeding"
+    other = "other"
+
+
+class ReminderStatusEnum(str, enum.Enum):
+    pending = "pending"
+    completed = "completed"
+    cancelled = "cancelled"
+
+
+class Cattle(Base):
+    __tablename__ = "cattle"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    owner_id = Column(UUID(as_uuid=True), nullable=False)
+    name = Column(String(100), nullable=False)
+    lote = Column(String(50), nullable=False)
+    breed = Column(String(100))
+    gender = Column(SQLEnum(GenderEnum), nullable=False)
+    birth_date = Column(Date)
+    weight = Column(Float)
+    fecha_ultimo_parto = Column(Date)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    health_events = relationship("HealthEvent", back_populates="cattle", viewonly=True)
+    heat_events = relationship("HeatEvent", back_populates="cattle", viewonly=True)
+    reminders = relationship("Reminder", back_populates="cattle", viewonly=True)
+
+    __table_args__ = (
+        Index("ix_cattle_lote", "lote", unique=True),
+        Index("ix_cattle_owner_id", "owner_id"),
+    )
+
+
+class HealthEvent(Base):
+    __tablename__ = "health_events"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), nullable=False)
+    event_type = Column(SQLEnum(EventTypeEnum), nullable=False)
+    disease_name = Column(String(100))
+    medicine_name = Column(String(100))
+    application_date = Column(Date, nullable=False)
+    administration_route = Column(SQLEnum(AdministrationRouteEnum))
+    next_dose_date = Column(Date)
+    treatment_end_date = Column(Date)
+    dosage = Column(String(50))
+    veterinarian_name = Column(String(100))
+    notes = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    cattle = relationship("Cattle", back_populates="health_events", viewonly=True)
+
+    __table_args__ = (
+        Index("ix_health_events_application_date", "application_date"),
+        Index("ix_health_events_cattle_id_event_type", "cattle_id", "event_type", "application_date"),
+        Index(
+            "ix_health_events_next_dose_date",
+            "next_dose_date",
+            postgresql_where=next_dose_date.isnot(None),
+        ),
+    )
+
+
+class HeatEvent(Base):
+    __tablename__ = "heat_events"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), nullable=False)
+    heat_date = Column(Date, nullable=False)
+    allows_mounting = Column(Boolean)
+    vaginal_discharge = Column(String(20))
+    vulva_swelling = Column(String(20))
+    comportamiento = Column(String(30))
+    was_inseminated = Column(Boolean, default=False)
+    insemination_date = Column(Date)
+    pregnancy_confirmed = Column(Boolean)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    cattle = relationship("Cattle", back_populates="heat_events", viewonly=True)
+
+    __table_args__ = (
+        Index("ix_heat_events_cattle_id_heat_date", "cattle_id", "heat_date"),
+        Index(
+            "ix_heat_events_pending_pregnancy",
+            "insemination_date",
+            postgresql_where=(was_inseminated.is_(True)) & (pregnancy_confirmed.is_(None)),
+        ),
+        Index(
+            "ix_heat_events_confirmed_pregnancy",
+            "insemination_date",
+            postgresql_where=pregnancy_confirmed.is_(True),
+        ),
+    )
+
+
+class Reminder(Base):
+    __tablename__ = "reminders"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="SET NULL"))
+    title = Column(String(200), nullable=False)
+    description = Column(Text)
+    reminder_date = Column(Date, nullable=False, index=True)
+    reminder_type = Column(SQLEnum(ReminderTypeEnum), nullable=False)
+    status = Column(SQLEnum(ReminderStatusEnum), default=ReminderStatusEnum.pending, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    cattle = relationship("Cattle", back_populates="reminders", viewonly=True)
+
+    __table_args__ = (
+        Index("ix_reminders_status_reminder_date", "status", "reminder_date"),
+        Index("ix_reminders_cattle_id_reminder_date", "cattle_id", "reminder_date"),
+        Index("ix_reminders_user_id_reminder_date", "user_id", "reminder_date"),
+    )
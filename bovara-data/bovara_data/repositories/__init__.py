@@ -0,0 +1,14 @@
+# bovara_data/repositories/__init__.py
+from bovara_data.repositories.base import BaseRepository
+from bovara_data.repositories.cattle import CattleBaseRepository
+from bovara_data.repositories.health_event import HealthEventBaseRepository
+from bovara_data.repositories.heat_event import HeatEventBaseRepository
+from bovara_data.repositories.reminder import ReminderBaseRepository
+
+__all__ = [
+    "BaseRepository",
+    "CattleBaseRepository",
+    "HealthEventBaseRepository",
+    "HeatEventBaseRepository",
+    "ReminderBaseRepository",
+]
@@ -0,0 +1,38 @@
+# bovara_data/repositories/base.py
+from typing import Any, Optional
+from uuid import UUID
+from sqlalchemy import func
+from sqlalchemy.orm import Session, Query, joinedload
+
+
+class BaseRepository:
+    """Base de los repositorios compartidos (consultas): sesión, carga anticipada y conteos"""
+
+    model: Any = None
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _query(self, with_cattle: bool = False) -> Query:
+        """Consulta base; with_cattle carga el ganado en el mismo SELECT (evita N+1)"""
+        query = self.db.query(self.model)
+        if with_cattle:
+            query = query.options(joinedload(self.model.cattle))
+        return query
+
+    @staticmethod
+    def _page(query: Query, skip: int = 0, limit: Optional[int] = 100) -> Query:
+        """Aplica paginación; limit=None devuelve todas las filas"""
+        if skip:
+            query = query.offset(skip)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    def get_by_id(self, record_id: UUID) -> Optional[Any]:
+        """Obtiene un registro por su ID"""
+        return self.db.get(self.model, record_id)
+
+    def count(self) -> int:
+        """Cuenta el total de registros"""
+        return self.db.query(func.count(self.model.id)).scalar()
@@ -0,0 +1,80 @@
+# bovara_data/repositories/cattle.py
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import func
+
+from bovara_data.models import Cattle
+from bovara_data.repositories.base import BaseRepository
+
+
+class CattleBaseRepository(BaseRepository):
+    model = Cattle
+
+    def get_by_lote(self, lote: str) -> Optional[Cattle]:
+        """Obtiene un ganado por su lote (ix_cattle_lote)"""
+        return self.db.query(Cattle).filter(Cattle.lote == lote).first()
+
+    def get_all(
+        self,
+        gender: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[Cattle]:
+        """Obtiene todo el ganado, opcionalmente filtrado por género, en orden estable de lote"""
+        query = self.db.query(Cattle)
+        if gender:
+            query = query.filter(Cattle.gender == gender)
+        return self._page(query.order_by(Cattle.lote), skip, limit).all()
+
+    def get_by_gender(self, gender: str, skip: int = 0, limit: Optional[int] = 100) -> List[Cattle]:
+        """Obtiene ganado filtrado por género"""
+        return self.get_all(gender=gender, skip=skip, limit=limit)
+
+    def get_by_owner(
+        self,
+        owner_id: UUID,
+        gender: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[Cattle]:
+        """Obtiene el ganado de un dueño"""
+        query = self.db.query(Cattle).filter(Cattle.owner_id == owner_id)
+        if gender:
+            query = query.filter(Cattle.gender == gender)
+        return self._page(query.order_by(Cattle.lote), skip, limit).all()
+
+    def get_by_breed(self, breed: str, skip: int = 0, limit: Optional[int] = 100) -> List[Cattle]:
+        """Obtiene ganado filtrado por raza"""
+        query = self.db.query(Cattle).filter(Cattle.breed == breed)
+        return self._page(query, skip, limit).all()
+
+    def search_by_name(self, name: str, skip: int = 0, limit: Optional[int] = 100) -> List[Cattle]:
+        """Busca ganado por nombre (búsqueda parcial)"""
+        query = self.db.query(Cattle).filter(Cattle.name.ilike(f"%{name}%"))
+        return self._page(query, skip, limit).all()
+
+    def search_by_lote(self, query: str, limit: Optional[int] = None) -> List[Cattle]:
+        """Busca ganado por lote (búsqueda parcial)"""
+        result = self.db.query(Cattle).filter(Cattle.lote.ilike(f"%{query}%"))
+        return self._page(result.order_by(Cattle.lote), 0, limit).all()
+
+    def count_all(self, gender: Optional[str] = None) -> int:
+        """Cuenta el ganado, opcionalmente filtrado por género"""
+        query = self.db.query(func.count(Cattle.id))
+        if gender:
+            query = query.filter(Cattle.gender == gender)
+        return query.scalar()
+
+    def count_by_owner(self, owner_id: UUID, gender: Optional[str] = None) -> int:
+        """Cuenta el ganado de un dueño"""
+        query = self.db.query(func.count(Cattle.id)).filter(Cattle.owner_id == owner_id)
+        if gender:
+            query = query.filter(Cattle.gender == gender)
+        return query.scalar()
+
+    def exists_lote(self, lote: str, exclude_id: Optional[UUID] = None) -> bool:
+        """Verifica si un lote ya existe sin cargar la fila"""
+        query = self.db.query(Cattle.id).filter(Cattle.lote == lote)
+        if exclude_id:
+            query = query.filter(Cattle.id != exclude_id)
+        return self.db.query(query.exists()).scalar()
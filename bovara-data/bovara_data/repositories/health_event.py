@@ -0,0 +1,136 @@
+# bovara_data/repositories/health_event.py
+from typing import List, Optional
+from uuid import UUID
+from datetime import date
+from sqlalchemy import func
+
+from bovara_data.models import HealthEvent, EventTypeEnum
+from bovara_data.repositories.base import BaseRepository
+
+
+class HealthEventBaseRepository(BaseRepository):
+    model = HealthEvent
+
+    def get_by_cattle_id(
+        self,
+        cattle_id: UUID,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[HealthEvent]:
+        """Historial de salud de un ganado, más reciente primero (ix_health_events_cattle_id_event_type)"""
+        query = self.db.query(HealthEvent).filter(
+            HealthEvent.cattle_id == cattle_id
+        ).order_by(HealthEvent.application_date.desc())
+        return self._page(query, skip, limit).all()
+
+    def get_by_cattle_and_type(
+        self,
+        cattle_id: UUID,
+        event_type: EventTypeEnum,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[HealthEvent]:
+        """Eventos de un tipo para un ganado (ix_health_events_cattle_id_event_type)"""
+        query = self.db.query(HealthEvent).filter(
+            HealthEvent.cattle_id == cattle_id,
+            HealthEvent.event_type == event_type
+        ).order_by(HealthEvent.application_date.desc())
+        return self._page(query, skip, limit).all()
+
+    def get_last_by_type(
+        self,
+        cattle_id: UUID,
+        event_type: EventTypeEnum,
+        medicine_name: Optional[str] = None
+    ) -> Optional[HealthEvent]:
+        """Último evento de un tipo para un ganado, opcionalmente filtrado por medicamento"""
+        query = self.db.query(HealthEvent).filter(
+            HealthEvent.cattle_id == cattle_id,
+            HealthEvent.event_type == event_type
+        )
+        if medicine_name:
+            query = query.filter(HealthEvent.medicine_name.ilike(f"%{medicine_name}%"))
+        return query.order_by(HealthEvent.application_date.desc()).first()
+
+    def get_by_event_type(
+        self,
+        event_type: EventTypeEnum,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        with_cattle: bool = False,
+    ) -> List[HealthEvent]:
+        """Eventos de salud por tipo"""
+        query = self._query(with_cattle).filter(HealthEvent.event_type == event_type)
+        return self._page(query, skip, limit).all()
+
+    def get_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        with_cattle: bool = False,
+    ) -> List[HealthEvent]:
+        """Eventos de salud aplicados en un rango de fechas (ix_health_events_application_date)"""
+        query = self._query(with_cattle).filter(
+            HealthEvent.application_date >= start_date,
+            HealthEvent.application_date <= end_date
+        ).order_by(HealthEvent.application_date.desc())
+        return self._page(query, skip, limit).all()
+
+    def get_upcoming_doses(
+        self,
+        from_date: date,
+        cattle_id: Optional[UUID] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        with_cattle: bool = False,
+    ) -> List[HealthEvent]:
+        """Próximas dosis desde una fecha, de todo el hato o de un ganado (ix_health_events_next_dose_date)"""
+        query = self._query(with_cattle).filter(
+            HealthEvent.next_dose_date.isnot(None),
+            HealthEvent.next_dose_date >= from_date
+        )
+        if cattle_id:
+            query = query.filter(HealthEvent.cattle_id == cattle_id)
+        return self._page(query.order_by(HealthEvent.next_dose_date), skip, limit).all()
+
+    def get_doses_in_range(
+        self,
+        start_date: date,
+        end_date: date,
+        event_type: Optional[EventTypeEnum] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        with_cattle: bool = True,
+    ) -> List[HealthEvent]:
+        """Próximas dosis entre dos fechas (ix_health_events_next_dose_date)"""
+        query = self._query(with_cattle).filter(
+            HealthEvent.next_dose_date.isnot(None),
+            HealthEvent.next_dose_date >= start_date,
+            HealthEvent.next_dose_date <= end_date
+        )
+        if event_type:
+            query = query.filter(HealthEvent.event_type == event_type)
+        return self._page(query.order_by(HealthEvent.next_dose_date), skip, limit).all()
+
+    def count_upcoming_doses(self, from_date: date) -> int:
+        """Cuenta las próximas dosis de todo el hato desde una fecha"""
+        return self.db.query(func.count(HealthEvent.id)).filter(
+            HealthEvent.next_dose_date.isnot(None),
+            HealthEvent.next_dose_date >= from_date
+        ).scalar()
+
+    def count_doses_in_range(self, start_date: date, end_date: date) -> int:
+        """Cuenta las próximas dosis entre dos fechas (ix_health_events_next_dose_date)"""
+        return self.db.query(func.count(HealthEvent.id)).filter(
+            HealthEvent.next_dose_date.isnot(None),
+            HealthEvent.next_dose_date >= start_date,
+            HealthEvent.next_dose_date <= end_date
+        ).scalar()
+
+    def count_by_cattle_id(self, cattle_id: UUID) -> int:
+        """Cuenta los eventos de salud de un ganado"""
+        return self.db.query(func.count(HealthEvent.id)).filter(
+            HealthEvent.cattle_id == cattle_id
+        ).scalar()
@@ -0,0 +1,91 @@
+# bovara_data/repositories/heat_event.py
+from typing import List, Optional
+from uuid import UUID
+from datetime import date, timedelta
+from sqlalchemy import func
+
+from bovara_data.models import HeatEvent
+from bovara_data.repositories.base import BaseRepository
+
+
+class HeatEventBaseRepository(BaseRepository):
+    model = HeatEvent
+
+    def get_by_cattle_id(
+        self,
+        cattle_id: UUID,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[HeatEvent]:
+        """Historial de celo de un ganado, más reciente primero (ix_heat_events_cattle_id_heat_date)"""
+        query = self.db.query(HeatEvent).filter(
+            HeatEvent.cattle_id == cattle_id
+        ).order_by(HeatEvent.heat_date.desc())
+        return self._page(query, skip, limit).all()
+
+    def get_last_heat(self, cattle_id: UUID) -> Optional[HeatEvent]:
+        """Último evento de celo de un ganado"""
+        return self.db.query(HeatEvent).filter(
+            HeatEvent.cattle_id == cattle_id
+        ).order_by(HeatEvent.heat_date.desc()).first()
+
+    def get_inseminated(
+        self,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        with_cattle: bool = False,
+    ) -> List[HeatEvent]:
+        """Eventos de celo con inseminación"""
+        query = self._query(with_cattle).filter(
+            HeatEvent.was_inseminated.is_(True)
+        ).order_by(HeatEvent.insemination_date.desc())
+        return self._page(query, skip, limit).all()
+
+    def get_confirmed_pregnancies(
+        self,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        with_cattle: bool = False,
+    ) -> List[HeatEvent]:
+        """Eventos con embarazo confirmado (ix_heat_events_confirmed_pregnancy)"""
+        query = self._query(with_cattle).filter(
+            HeatEvent.pregnancy_confirmed.is_(True)
+        ).order_by(HeatEvent.insemination_date.desc())
+        return self._page(query, skip, limit).all()
+
+    def get_pending_pregnancy_check(
+        self,
+        days_after_insemination: int = 45,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        with_cattle: bool = False,
+    ) -> List[HeatEvent]:
+        """Inseminaciones sin confirmar con más de N días (ix_heat_events_pending_pregnancy)"""
+        check_date = date.today() - timedelta(days=days_after_insemination)
+        query = self._query(with_cattle).filter(
+            HeatEvent.was_inseminated.is_(True),
+            HeatEvent.pregnancy_confirmed.is_(None),
+            HeatEvent.insemination_date <= check_date
+        ).order_by(HeatEvent.insemination_date)
+        return self._page(query, skip, limit).all()
+
+    def get_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        with_cattle: bool = False,
+    ) -> List[HeatEvent]:
+        """Eventos de celo en un rango de fechas"""
+        query = self._query(with_cattle).filter(
+            HeatEvent.heat_date >= start_date,
+            HeatEvent.heat_date <= end_date
+        ).order_by(HeatEvent.heat_date.desc())
+        return self._page(query, skip, limit).all()
+
+    def count_by_cattle_id(self, cattle_id: UUID) -> int:
+        """Cuenta los eventos de celo de un ganado"""
+        return self.db.query(func.count(HeatEvent.id)).filter(
+            HeatEvent.cattle_id == cattle_id
+        ).scalar()
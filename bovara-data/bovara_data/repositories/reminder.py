@@ -0,0 +1,118 @@
+# bovara_data/repositories/reminder.py
+from typing import List, Optional
+from uuid import UUID
+from datetime import date, timedelta
+from sqlalchemy import func
+
+from bovara_data.models import Reminder, ReminderStatusEnum, ReminderTypeEnum
+from bovara_data.repositories.base import BaseRepository
+
+
+class ReminderBaseRepository(BaseRepository):
+    model = Reminder
+
+    def get_all(
+        self,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        with_cattle: bool = False,
+    ) -> List[Reminder]:
+        """Recordatorios con filtros opcionales de estado y fechas (ix_reminders_status_reminder_date)"""
+        query = self._query(with_cattle)
+        if status:
+            query = query.filter(Reminder.status == status)
+        if start_date:
+            query = query.filter(Reminder.reminder_date >= start_date)
+        if end_date:
+            query = query.filter(Reminder.reminder_date <= end_date)
+        return self._page(query.order_by(Reminder.reminder_date), skip, limit).all()
+
+    def get_by_cattle_id(
+        self,
+        cattle_id: UUID,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[Reminder]:
+        """Recordatorios de un ganado (ix_reminders_cattle_id_reminder_date)"""
+        query = self.db.query(Reminder).filter(
+            Reminder.cattle_id == cattle_id
+        ).order_by(Reminder.reminder_date)
+        return self._page(query, skip, limit).all()
+
+    def get_by_status(
+        self,
+        status: ReminderStatusEnum,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[Reminder]:
+        """Recordatorios por estado"""
+        return self.get_all(status=status, skip=skip, limit=limit)
+
+    def get_pending(self, skip: int = 0, limit: Optional[int] = 100) -> List[Reminder]:
+        """Recordatorios pendientes"""
+        return self.get_by_status(ReminderStatusEnum.pending, skip, limit)
+
+    def get_by_type(
+        self,
+        reminder_type: ReminderTypeEnum,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[Reminder]:
+        """Recordatorios por tipo"""
+        query = self.db.query(Reminder).filter(
+            Reminder.reminder_type == reminder_type
+        ).order_by(Reminder.reminder_date)
+        return self._page(query, skip, limit).all()
+
+    def get_today(self) -> List[Reminder]:
+        """Recordatorios pendientes de hoy"""
+        return self.get_all(
+            status=ReminderStatusEnum.pending,
+            start_date=date.today(),
+            end_date=date.today(),
+            limit=None,
+        )
+
+    def get_upcoming(self, days: int = 7, skip: int = 0, limit: Optional[int] = 100) -> List[Reminder]:
+        """Recordatorios pendientes en los próximos X días"""
+        return self.get_all(
+            status=ReminderStatusEnum.pending,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=days),
+            skip=skip,
+            limit=limit,
+        )
+
+    def get_overdue(self, skip: int = 0, limit: Optional[int] = 100) -> List[Reminder]:
+        """Recordatorios vencidos (pendientes con fecha pasada)"""
+        query = self.db.query(Reminder).filter(
+            Reminder.status == ReminderStatusEnum.pending,
+            Reminder.reminder_date < date.today()
+        ).order_by(Reminder.reminder_date)
+        return self._page(query, skip, limit).all()
+
+    def get_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[Reminder]:
+        """Recordatorios en un rango de fechas"""
+        return self.get_all(start_date=start_date, end_date=end_date, skip=skip, limit=limit)
+
+    def count_pending(self) -> int:
+        """Cuenta los recordatorios pendientes"""
+        return self.db.query(func.count(Reminder.id)).filter(
+            Reminder.status == ReminderStatusEnum.pending
+        ).scalar()
+
+    def count_overdue(self) -> int:
+        """Cuenta los recordatorios vencidos"""
+        return self.db.query(func.count(Reminder.id)).filter(
+            Reminder.status == ReminderStatusEnum.pending,
+            Reminder.reminder_date < date.today()
+        ).scalar()
@@ -0,0 +1,49 @@
+# bovara_ops/__init__.py
+from bovara_ops.health import (
+    ReadinessProbe,
+    health_router,
+    sql_check,
+    async_sql_check,
+)
+from bovara_ops.metrics import (
+    setup_metrics,
+    instrument_engine,
+    time_inference,
+    observe_batch,
+    time_llm,
+    time_tool,
+    track_pool,
+    count_rate_limit,
+)
+from bovara_ops.tracing import (
+    setup_tracing,
+    start_span,
+    inject_headers,
+    current_trace_id,
+    JsonFileExporter,
+    ZipkinExporter,
+)
+from bovara_ops.logs import setup_logging, JsonFormatter
+
+__all__ = [
+    "ReadinessProbe",
+    "health_router",
+    "sql_check",
+    "async_sql_check",
+    "setup_metrics",
+    "instrument_engine",
+    "time_inference",
+    "observe_batch",
+    "time_llm",
+    "time_tool",
+    "track_pool",
+    "count_rate_limit",
+    "setup_tracing",
+    "start_span",
+    "inject_headers",
+    "current_trace_id",
+    "JsonFileExporter",
+    "ZipkinExporter",
+    "setup_logging",
+    "JsonFormatter",
+]
@@ -0,0 +1,146 @@
+# bovara_ops/health.py
+"""
+Liveness y readiness con resultado cacheado.
+
+Los checks se ejecutan en una tarea de fondo; los endpoints devuelven el
+último resultado sin tocar la base de datos ni otros servicios.
+"""
+import asyncio
+import inspect
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+
+CheckResult = Union[bool, Dict[str, Any], None]
+Check = Callable[[], Union[CheckResult, Awaitable[CheckResult]]]
+
+
+class ReadinessProbe:
+    """Ejecuta checks en segundo plano y guarda el último resultado"""
+
+    def __init__(self, service: str, interval: float = 5.0, timeout: float = 2.0):
+        self.service = service
+        self._interval = interval
+        self._timeout = timeout
+        self._checks: Dict[str, Check] = {}
+        self._critical: Dict[str, bool] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._checked_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def add_check(self, name: str, check: Check, critical: bool = True) -> None:
+        """
+        Registra un check. Puede ser síncrono (se ejecuta en un hilo) o async.
+        Falla si lanza una excepción o devuelve False; un dict se añade como detalle.
+        Los checks no críticos se reportan pero no afectan la readiness.
+        """
+        self._checks[name] = check
+        self._critical[name] = critical
+
+    async def _run_check(self, check: Check) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            if inspect.iscoroutinefunction(check):
+                result = await asyncio.wait_for(check(), self._timeout)
+            else:
+                result = await asyncio.wait_for(asyncio.to_thread(check), self._timeout)
+        except asyncio.TimeoutError:
+            return {"ok": False, "error": f"timeout ({self._timeout}s)"}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+        status = {"ok": result is not False, "latency_ms": round((time.perf_counter() - start) * 1000, 2)}
+        if isinstance(result, dict):
+            status.update(result)
+        return status
+
+    async def refresh(self) -> None:
+        """Ejecuta todos los checks una vez y actualiza el resultado cacheado"""
+        names = list(self._checks)
+        results = await asyncio.gather(*(self._run_check(self._checks[n]) for n in names))
+        self._results = dict(zip(names, results))
+        self._checked_at = time.time()
+
+    async def _loop(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self._interval)
+
+    async def start(self) -> None:
+        """Lanza la tarea de refresco en segundo plano"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Detiene la tarea de refresco"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def ready(self) -> bool:
+        return self._checked_at is not None and all(
+            result["ok"] for name, result in self._results.items() if self._critical[name]
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Último resultado conocido (sin ejecutar checks)"""
+        return {
+            "status": "ready" if self.ready else ("starting" if self._checked_at is None else "not_ready"),
+            "service": self.service,
+            "checked_at": self._checked_at,
+            "checks": self._results,
+        }
+
+
+def health_router(probe: ReadinessProbe) -> APIRouter:
+    """Rutas /health, /health/live y /health/ready para un servicio"""
+    router = APIRouter(tags=["Health"])
+
+    @router.get("/health/live")
+    async def liveness():
+        """Liveness: el proceso está vivo (no consulta dependencias)"""
+        return {"status": "alive", "service": probe.service}
+
+    @router.get("/health/ready")
+    async def readiness():
+        """Readiness: último resultado de los checks en segundo plano"""
+        return JSONResponse(probe.snapshot(), status_code=200 if probe.ready else 503)
+
+    @router.get("/health")
+    async def health():
+        """Estado de salud (compatibilidad): readiness cacheado, siempre 200"""
+        return probe.snapshot()
+
+    return router
+
+
+def sql_check(engine) -> Callable[[], bool]:
+    """Check síncrono de `SELECT 1` usando el pool de un Engine de SQLAlchemy"""
+    from sqlalchemy import text
+
+    def check() -> bool:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True
+
+    return check
+
+
+def async_sql_check(engine) -> Callable[[], Awaitable[bool]]:
+    """Check async de `SELECT 1` usando el pool de un AsyncEngine de SQLAlchemy"""
+    from sqlalchemy import text
+
+    async def check() -> bool:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return True
+
+    return check
@@ -0,0 +1,164 @@
+# bovara_ops/logs.py
+"""
+Logging estructurado (una línea JSON por evento) sin escrituras síncronas a
+stdout en el camino de la petición.
+
+Los handlers de la raíz y de uvicorn se sustituyen por un QueueHandler: el
+hilo de la petición solo encola el registro y un QueueListener lo formatea y
+escribe en segundo plano. Los registros por debajo de WARNING se muestrean por
+petición (todas las líneas de una petición muestreada o ninguna); WARNING y
+superiores se emiten siempre.
+
+Configuración por variables de entorno:
+
+- BOVARA_LOG_LEVEL: nivel raíz (defecto: INFO)
+- BOVARA_LOG_LEVELS: niveles por módulo, p. ej. "sqlalchemy.engine=WARNING,src.services=DEBUG"
+- BOVARA_LOG_SAMPLE_RATE: fracción de peticiones cuyos logs < WARNING se emiten (defecto: 1.0)
+- BOVARA_LOG_FORMAT: json (defecto) | text
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from fastapi import FastAPI
+
+from bovara_ops.tracing import current_trace_id
+
+
+# Atributos estándar de LogRecord: el resto llega vía `extra=` y se añade al JSON
+_RESERVED = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "trace_id", "service"}
+
+_sampled: ContextVar[bool] = ContextVar("bovara_log_sampled", default=True)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatea cada registro como un objeto JSON en una línea"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "service": getattr(record, "service", None),
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            data["trace_id"] = trace_id
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                data[key] = value
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _ContextFilter(logging.Filter):
+    """
+    Corre en el hilo que registra: descarta logs de peticiones no muestreadas
+    y captura servicio y trace-id antes de que el registro cruce a la cola.
+    """
+
+    def __init__(self, service: str):
+        super().__init__()
+        self._service = service
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING and not _sampled.get():
+            return False
+        record.service = self._service
+        record.trace_id = current_trace_id()
+        return True
+
+
+class LogSamplingMiddleware:
+    """Middleware ASGI: decide una vez por petición si sus logs < WARNING se emiten"""
+
+    def __init__(self, app, sample_rate: float):
+        self.app = app
+        self._sample_rate = sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._sample_rate >= 1.0:
+            await self.app(scope, receive, send)
+            return
+        token = _sampled.set(random.random() < self._sample_rate)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _sampled.reset(token)
+
+
+def _parse_levels(spec: str) -> Dict[str, str]:
+    levels = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def _stop_listener() -> None:
+    """Vacía la cola al salir del proceso"""
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+
+
+def setup_logging(
+    service: str,
+    app: Optional[FastAPI] = None,
+    level: Optional[str] = None,
+    module_levels: Optional[Dict[str, str]] = None,
+    sample_rate: Optional[float] = None,
+) -> None:
+    """
+    Configura el logging del proceso. Con `app` registra además el muestreo
+    por petición. Los argumentos explícitos tienen prioridad sobre el entorno.
+    """
+    global _listener
+
+    level = (level or os.getenv("BOVARA_LOG_LEVEL", "INFO")).upper()
+    levels = _parse_levels(os.getenv("BOVARA_LOG_LEVELS", ""))
+    levels.update(module_levels or {})
+    if sample_rate is None:
+        sample_rate = float(os.getenv("BOVARA_LOG_SAMPLE_RATE", "1.0"))
+
+    output = logging.StreamHandler(sys.stdout)
+    if os.getenv("BOVARA_LOG_FORMAT", "json").lower() == "text":
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(service)s] %(name)s: %(message)s"))
+    else:
+        output.setFormatter(JsonFormatter())
+
+    if _listener is None:
+        atexit.register(_stop_listener)
+    else:
+        _listener.stop()
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=False)
+    _listener.start()
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(_ContextFilter(service))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+
+    # uvicorn instala sus propios StreamHandler síncronos: se redirigen a la cola
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    if app is not None:
+        app.add_middleware(LogSamplingMiddleware, sample_rate=sample_rate)
@@ -0,0 +1,221 @@
+# bovara_ops/metrics.py
+"""
+Métricas estilo Prometheus comunes a todos los servicios.
+
+Todas las series llevan la etiqueta `service`; las de HTTP usan la plantilla
+de la ruta (`/api/v1/cattle/{cattle_id}`), nunca la URL concreta, para que la
+cardinalidad no crezca con los IDs.
+"""
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from fastapi import FastAPI, Response
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+from bovara_ops.tracing import begin_span, end_span, start_span
+
+
+_service = "unknown"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Peticiones HTTP atendidas",
+    ["service", "method", "route", "status"],
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Latencia de peticiones HTTP",
+    ["service", "method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+HTTP_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Peticiones HTTP en curso",
+    ["service"],
+)
+DB_QUERIES = Counter(
+    "db_queries_total",
+    "Sentencias SQL ejecutadas",
+    ["service", "operation"],
+)
+DB_LATENCY = Histogram(
+    "db_query_duration_seconds",
+    "Duración de sentencias SQL",
+    ["service", "operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+INFERENCE_LATENCY = Histogram(
+    "ml_inference_duration_seconds",
+    "Duración de inferencia de modelos",
+    ["service", "model"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+LLM_LATENCY = Histogram(
+    "llm_request_duration_seconds",
+    "Duración de llamadas al LLM",
+    ["service", "model", "stage"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60),
+)
+BATCH_SIZE = Histogram(
+    "ml_batch_size",
+    "Peticiones resueltas por lote (micro-batching)",
+    ["service", "batcher"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+TOOL_LATENCY = Histogram(
+    "tool_call_duration_seconds",
+    "Duración de ejecución de herramientas del agente",
+    ["service", "tool", "status"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+POOL_QUEUE_DEPTH = Gauge(
+    "worker_pool_queue_depth",
+    "Operaciones esperando turno en un pool acotado",
+    ["service", "pool"],
+)
+POOL_IN_FLIGHT = Gauge(
+    "worker_pool_in_flight",
+    "Operaciones en curso en un pool acotado",
+    ["service", "pool"],
+)
+RATE_LIMIT_DECISIONS = Counter(
+    "rate_limit_decisions_total",
+    "Intentos procesados o rechazados por un limitador",
+    ["service", "limiter", "result"],
+)
+
+
+class MetricsMiddleware:
+    """Middleware ASGI: conteo, latencia y peticiones en curso por ruta"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = HTTP_IN_FLIGHT.labels(_service)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_LATENCY.labels(_service, method, path).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(_service, method, path, str(status_code)).inc()
+
+
+def setup_metrics(app: FastAPI, service: str) -> None:
+    """Registra el middleware de métricas y el endpoint /metrics"""
+    global _service
+    _service = service
+
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+def instrument_engine(engine) -> None:
+    """
+    Cuenta, mide y traza cada sentencia SQL de un Engine (o AsyncEngine) de
+    SQLAlchemy. El span solo se crea dentro de una petición trazada.
+    """
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    def _operation(statement: str) -> str:
+        return statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        span = begin_span(f"SQL {_operation(statement)}", "CLIENT", {"db.statement": statement[:1000]})
+        conn.info.setdefault("_bovara_query_start", []).append((time.perf_counter(), span))
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("_bovara_query_start")
+        if not starts:
+            return
+        start, span = starts.pop()
+        operation = _operation(statement)
+        DB_QUERIES.labels(_service, operation).inc()
+        DB_LATENCY.labels(_service, operation).observe(time.perf_counter() - start)
+        end_span(span)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        starts = conn.info.get("_bovara_query_start") if conn is not None else None
+        if starts:
+            _, span = starts.pop()
+            end_span(span, exception_context.original_exception)
+
+
+@contextmanager
+def time_inference(model: str) -> Iterator[None]:
+    """Mide y traza una inferencia de modelo (ml-service)"""
+    start = time.perf_counter()
+    try:
+        with start_span(f"inference {model}", model=model):
+            yield
+    finally:
+        INFERENCE_LATENCY.labels(_service, model).observe(time.perf_counter() - start)
+
+
+def observe_batch(batcher: str, size: int) -> None:
+    """Registra el tamaño de un lote de un micro-batcher (ml-service)"""
+    BATCH_SIZE.labels(_service, batcher).observe(size)
+
+
+@contextmanager
+def time_llm(model: str, stage: str) -> Iterator[None]:
+    """Mide y traza una llamada al LLM (chatbot-service)"""
+    start = time.perf_counter()
+    try:
+        with start_span(f"llm {stage}", "CLIENT", model=model, stage=stage):
+            yield
+    finally:
+        LLM_LATENCY.labels(_service, model, stage).observe(time.perf_counter() - start)
+
+
+@contextmanager
+def time_tool(tool: str) -> Iterator[None]:
+    """Mide y traza la ejecución de una herramienta del agente (chatbot-service)"""
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        with start_span(f"tool {tool}", tool=tool):
+            yield
+    except Exception:
+        status = "error"
+        raise
+    finally:
+        TOOL_LATENCY.labels(_service, tool, status).observe(time.perf_counter() - start)
+
+
+def track_pool(pool: str, queue_depth: Callable[[], int], in_flight: Callable[[], int]) -> None:
+    """Expone la cola y las operaciones en curso de un pool (se leen al servir /metrics)"""
+    POOL_QUEUE_DEPTH.labels(_service, pool).set_function(queue_depth)
+    POOL_IN_FLIGHT.labels(_service, pool).set_function(in_flight)
+
+
+def count_rate_limit(limiter: str, result: str) -> None:
+    """Cuenta una decisión de un limitador: `processed` o `rejected_<clave>` (auth-service)"""
+    RATE_LIMIT_DECISIONS.labels(_service, limiter, result).inc()
@@ -0,0 +1,307 @@
+# bovara_ops/tracing.py
+"""
+Trazas distribuidas entre servicios (gateway → auth/core/chatbot → Postgres/Gemini).
+
+El contexto viaja en la cabecera W3C `traceparent`; el gateway genera el
+trace-id si la petición no trae uno. Cada servicio crea un span SERVER por
+petición y spans hijos para SQL, herramientas del agente, LLM e inferencia.
+Los spans se exportan en formato Zipkin v2 (JSON) a un fichero JSON-lines o a
+un collector local (Zipkin, Jaeger o el OpenTelemetry Collector con receiver
+zipkin) desde un hilo de fondo, sin bloquear la petición.
+
+Configuración por variables de entorno:
+
+- BOVARA_TRACE_EXPORTER: none (defecto) | file | zipkin
+- BOVARA_TRACE_FILE: ruta del fichero JSON-lines (defecto: traces.jsonl)
+- BOVARA_TRACE_ENDPOINT: URL del collector (defecto: http://localhost:9411/api/v2/spans)
+- BOVARA_TRACE_SAMPLE_RATE: fracción de trazas muestreadas en el origen (defecto: 1.0)
+"""
+import abc
+import json
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional
+
+from fastapi import FastAPI
+
+
+TRACEPARENT = "traceparent"
+TRACE_ID_HEADER = "x-trace-id"
+
+
+@dataclass
+class Span:
+    """Un tramo de trabajo dentro de una traza"""
+
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    kind: str = "INTERNAL"
+    sampled: bool = True
+    start: float = field(default_factory=time.time)
+    duration: Optional[float] = None
+    tags: Dict[str, str] = field(default_factory=dict)
+
+    def set_tag(self, key: str, value: Any) -> None:
+        self.tags[key] = str(value)
+
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def to_zipkin(self, service: str) -> Dict[str, Any]:
+        data = {
+            "traceId": self.trace_id,
+            "id": self.span_id,
+            "name": self.name,
+            "timestamp": int(self.start * 1_000_000),
+            "duration": max(1, int((self.duration or 0) * 1_000_000)),
+            "localEndpoint": {"serviceName": service},
+            "tags": self.tags,
+        }
+        if self.parent_id:
+            data["parentId"] = self.parent_id
+        if self.kind != "INTERNAL":
+            data["kind"] = self.kind
+        return data
+
+
+class _BatchExporter(abc.ABC):
+    """Cola acotada + hilo de fondo; si la cola se llena los spans se descartan"""
+
+    def __init__(self, max_queue: int = 10_000, batch_size: int = 256, flush_interval: float = 1.0):
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self.dropped = 0
+        threading.Thread(target=self._run, name=type(self).__name__, daemon=True).start()
+
+    def submit(self, span: Dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self.export(batch)
+            except Exception:
+                self.dropped += len(batch)
+
+    @abc.abstractmethod
+    def export(self, batch: List[Dict[str, Any]]) -> None:
+        """Envía un lote de spans Zipkin v2 a su destino"""
+
+
+class JsonFileExporter(_BatchExporter):
+    """Escribe un span Zipkin v2 por línea en un fichero"""
+
+    def __init__(self, path: str, **kwargs):
+        self._path = path
+        super().__init__(**kwargs)
+
+    def export(self, batch: List[Dict[str, Any]]) -> None:
+        with open(self._path, "a", encoding="utf-8") as f:
+            for span in batch:
+                f.write(json.dumps(span, ensure_ascii=False) + "\n")
+
+
+class ZipkinExporter(_BatchExporter):
+    """Envía lotes de spans a un collector compatible con la API Zipkin v2"""
+
+    def __init__(self, endpoint: str, timeout: float = 2.0, **kwargs):
+        self._endpoint = endpoint
+        self._timeout = timeout
+        super().__init__(**kwargs)
+
+    def export(self, batch: List[Dict[str, Any]]) -> None:
+        request = urllib.request.Request(
+            self._endpoint,
+            data=json.dumps(batch).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self._timeout):
+            pass
+
+
+_service = "unknown"
+_exporter: Optional[_BatchExporter] = None
+_sample_rate = 1.0
+_current: ContextVar[Optional[Span]] = ContextVar("bovara_current_span", default=None)
+
+
+def _new_id(hex_chars: int) -> str:
+    return f"{random.getrandbits(hex_chars * 4):0{hex_chars}x}"
+
+
+def _parse_traceparent(value: Optional[str]) -> Optional[Span]:
+    """Contexto remoto a partir de `traceparent` (None si falta o es inválido)"""
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+        sampled = bool(int(parts[3], 16) & 1)
+    except ValueError:
+        return None
+    return Span(trace_id=parts[1], span_id=parts[2], parent_id=None, name="remote", sampled=sampled)
+
+
+def current_span() -> Optional[Span]:
+    """Span activo en este contexto (None fuera de una petición trazada)"""
+    return _current.get()
+
+
+def current_trace_id() -> Optional[str]:
+    span = _current.get()
+    return span.trace_id if span else None
+
+
+def begin_span(name: str, kind: str = "INTERNAL", tags: Optional[Dict[str, Any]] = None) -> Optional[Span]:
+    """
+    Abre un span hijo del activo sin convertirlo en el activo (para hooks como
+    los de SQLAlchemy). Devuelve None si no hay traza muestreada o el tracing
+    está desactivado, de modo que el coste fuera de una traza es mínimo.
+    """
+    parent = _current.get()
+    if _exporter is None or parent is None or not parent.sampled:
+        return None
+    span = Span(trace_id=parent.trace_id, span_id=_new_id(16), parent_id=parent.span_id, name=name, kind=kind)
+    if tags:
+        for key, value in tags.items():
+            span.set_tag(key, value)
+    return span
+
+
+def end_span(span: Optional[Span], error: Optional[BaseException] = None) -> None:
+    """Cierra un span y lo encola para exportar"""
+    if span is None:
+        return
+    span.duration = time.time() - span.start
+    if error is not None:
+        span.set_tag("error", f"{type(error).__name__}: {error}")
+    if _exporter is not None and span.sampled:
+        _exporter.submit(span.to_zipkin(_service))
+
+
+@contextmanager
+def start_span(name: str, kind: str = "INTERNAL", **tags: Any) -> Iterator[Optional[Span]]:
+    """Span hijo del activo, activo mientras dura el bloque"""
+    span = begin_span(name, kind, tags)
+    if span is None:
+        yield None
+        return
+    token = _current.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        end_span(span, e)
+        raise
+    else:
+        end_span(span)
+    finally:
+        _current.reset(token)
+
+
+def inject_headers(headers: MutableMapping[str, str]) -> MutableMapping[str, str]:
+    """Sustituye `traceparent` por el contexto activo antes de llamar a otro servicio"""
+    span = _current.get()
+    if span is not None:
+        headers[TRACEPARENT] = span.traceparent()
+    return headers
+
+
+class TracingMiddleware:
+    """Middleware ASGI: span SERVER por petición, continuando la traza entrante"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        remote = _parse_traceparent(headers.get(TRACEPARENT.encode(), b"").decode("latin-1"))
+        if remote is None:
+            # Origen de la traza: la decisión de muestreo se propaga a los demás servicios
+            trace_id, parent_id, sampled = _new_id(32), None, random.random() < _sample_rate
+        else:
+            trace_id, parent_id, sampled = remote.trace_id, remote.span_id, remote.sampled
+
+        span = Span(
+            trace_id=trace_id,
+            span_id=_new_id(16),
+            parent_id=parent_id,
+            name=scope["method"],
+            kind="SERVER",
+            # Sin exportador local se propaga igualmente la decisión (end_span no exporta)
+            sampled=sampled,
+        )
+        span.set_tag("http.method", scope["method"])
+        span.set_tag("http.path", scope.get("path", ""))
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                span.set_tag("http.status_code", message["status"])
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(TRACE_ID_HEADER.encode(), trace_id.encode())]
+            await send(message)
+
+        token = _current.set(span)
+        error = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            span.name = f"{scope['method']} {getattr(route, 'path', None) or 'unmatched'}"
+            end_span(span, error)
+
+
+def _exporter_from_env() -> Optional[_BatchExporter]:
+    kind = os.getenv("BOVARA_TRACE_EXPORTER", "none").lower()
+    if kind == "file":
+        return JsonFileExporter(os.getenv("BOVARA_TRACE_FILE", "traces.jsonl"))
+    if kind == "zipkin":
+        return ZipkinExporter(os.getenv("BOVARA_TRACE_ENDPOINT", "http://localhost:9411/api/v2/spans"))
+    return None
+
+
+def setup_tracing(app: FastAPI, service: str, exporter: Optional[_BatchExporter] = None) -> None:
+    """
+    Registra el middleware de trazas. Sin exportador (BOVARA_TRACE_EXPORTER=none)
+    no se graban spans, pero `traceparent` se sigue propagando y cada respuesta
+    lleva la cabecera `x-trace-id`.
+    """
+    global _service, _exporter, _sample_rate
+    _service = service
+    _exporter = exporter if exporter is not None else _exporter_from_env()
+    _sample_rate = float(os.getenv("BOVARA_TRACE_SAMPLE_RATE", "1.0"))
+
+    app.add_middleware(TracingMiddleware)
@@ -0,0 +1,120 @@
+"""
+Benchmark del formato de resultados de herramientas sobre los datos del seed.
+
+Para cada herramienta de lectura compara el payload compacto (JSON) con el
+formato de texto anterior (una línea decorada por campo) y mide:
+- tokens del payload (count_tokens de Gemini)
+- latencia de la segunda llamada (resultado de herramienta -> respuesta final)
+
+Uso:
+    python -m src.seed_db
+    python -m src.benchmark_tool_payloads --repeat 3 --output bench_tool_payloads.json
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from google import genai
+from google.genai import types
+
+from src.infrastructure.database import SessionLocal
+from src.services.agent_service import AgentService, LivestockTools
+from src.services.tools.records import serialize
+
+
+# (mensaje de usuario, herramienta, argumentos) usando los lotes del seed
+CASES = [
+    ("Muéstrame todo mi ganado", "get_all_cattle", {}),
+    ("¿Qué sabes de la vaca 001?", "get_cattle_by_lote", {"lote": "LOTE-001"}),
+    ("Historial de salud de la vaca 001", "get_health_events_by_cattle", {"lote": "LOTE-001"}),
+    ("¿Qué vacunas tocan este mes?", "get_upcoming_vaccines", {"days": 30}),
+    ("Todas las dosis pendientes", "get_all_upcoming_vaccines", {}),
+    ("Historial de celo de la vaca 001", "get_heat_events_by_cattle", {"lote": "LOTE-001"}),
+    ("¿Qué vacas están preñadas?", "get_pregnant_cattle", {}),
+    ("¿Tengo recordatorios pendientes?", "get_all_reminders", {}),
+    ("¿Qué recordatorios están vencidos?", "get_overdue_reminders", {}),
+]
+
+
+def _legacy_text(result: Any, indent: str = "") -> str:
+    """Reproduce el formato anterior: encabezado + una línea decorada por campo"""
+    if isinstance(result, dict):
+        lines = []
+        for key, value in result.items():
+            if isinstance(value, (dict, list)):
+                lines.append(f"{indent}📌 {key.replace('_', ' ').capitalize()}:\n{_legacy_text(value, indent + '   ')}")
+            else:
+                lines.append(f"{indent}- {key.replace('_', ' ').capitalize()}: {value}\n")
+        return "".join(lines)
+    if isinstance(result, list):
+        return "".join(_legacy_text(item, indent) + "\n" for item in result)
+    return f"{indent}{result}\n"
+
+
+def _second_call(client: genai.Client, model: str, config, message: str, tool_name: str, args: Dict, response: Dict) -> float:
+    """Ejecuta solo la segunda llamada y devuelve su latencia en ms"""
+    contents = [
+        types.Content(role="user", parts=[types.Part.from_text(message)]),
+        types.Content(role="model", parts=[types.Part(function_call=types.FunctionCall(name=tool_name, args=args))]),
+        types.Content(role="tool", parts=[types.Part.from_function_response(name=tool_name, response=response)]),
+    ]
+    start = time.perf_counter()
+    client.models.generate_content(model=model, contents=contents, config=config)
+    return (time.perf_counter() - start) * 1000
+
+
+def run(repeat: int) -> Dict[str, Any]:
+    db = SessionLocal()
+    try:
+        agent = AgentService(db)
+        tools = LivestockTools(db)
+        config = types.GenerateContentConfig(
+            system_instruction=agent._get_system_prompt(),
+            temperature=0.2
+        )
+        report = []
+
+        for message, tool_name, args in CASES:
+            tool: Callable = getattr(tools, tool_name)
+            result = tool(**args)
+
+            variants = {
+                "before": {"result": _legacy_text(result)},
+                "after": {"result": result},
+            }
+            row: Dict[str, Any] = {"tool": tool_name}
+            for label, response in variants.items():
+                payload = serialize(response)
+                tokens = agent.client.models.count_tokens(model=agent.model_name, contents=payload).total_tokens
+                latencies = [
+                    _second_call(agent.client, agent.model_name, config, message, tool_name, args, response)
+                    for _ in range(repeat)
+                ]
+                row[label] = {
+                    "bytes": len(payload.encode("utf-8")),
+                    "tokens": tokens,
+                    "second_call_ms_median": round(statistics.median(latencies), 1),
+                }
+            row["token_reduction_pct"] = round(
+                100 * (1 - row["after"]["tokens"] / row["before"]["tokens"]), 1
+            ) if row["before"]["tokens"] else 0.0
+            report.append(row)
+            print(f"{tool_name}: {row['before']['tokens']} -> {row['after']['tokens']} tokens")
+
+        return {"model": agent.model_name, "cases": report}
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de payloads de herramientas")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones de la segunda llamada por caso")
+    parser.add_argument("--output", default="bench_tool_payloads.json", help="Archivo JSON de resultados")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ Resultados guardados en {args.output}")
@@ -1,3 +1,5 @@
+from uuid import UUID
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -5,6 +7,17 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     DATABASE_URL: str
     GOOGLE_API_KEY: str
+    # Rancho (id de usuario en auth-service) dueño del ganado y recordatorios que crea el asistente
+    OWNER_ID: UUID
+
+    @field_validator("OWNER_ID")
+    @classmethod
+    def check_owner_id(cls, value: UUID) -> UUID:
+        # Con el UUID nulo las filas no aparecerían en ninguna vista por dueño de core-service
+        if value.int == 0:
+            raise ValueError("OWNER_ID debe ser el id de un usuario real de auth-service")
+        return value
+
     model_config = SettingsConfigDict(
         env_file=".env", 
         env_ignore_empty=True,
@@ -1,12 +1,12 @@
 """
 Script para inicializar la base de datos creando todas las tablas
 """
-from src.infrastructure.database import engine, Base
-from src.models import Cattle, HealthEvent, HeatEventModel, Reminder
+from bovara_data import Base
+from src.infrastructure.database import engine
 
 
 def init_db():
-    """Crea todas las tablas en la base de datos"""
+    """Crea todas las tablas en la base de datos (mismo esquema que core-service)"""
     print("Creando tablas en la base de datos...")
     Base.metadata.create_all(bind=engine)
     print("✅ Tablas creadas exitosamente!")
@@ -1,12 +1,13 @@
 # src/main.py
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from bovara_ops import ReadinessProbe, health_router, sql_check, setup_metrics, setup_tracing, setup_logging, instrument_engine
 from src.core.config import settings
-from src.infrastructure.database import engine, Base
+from bovara_data import Base
+from src.infrastructure.database import engine
 from src.api.routes import chat
 
-from src.models import Cattle, HealthEvent, HeatEventModel, Reminder
-
+# Mismo esquema que core-service (mapeos de bovara_data)
 Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
@@ -24,8 +25,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Métricas (/metrics) y trazas distribuidas
+setup_metrics(app, "chatbot-service")
+setup_tracing(app, "chatbot-service")
+instrument_engine(engine)
+
+
+# Logging estructurado (JSON, asíncrono y muestreado por petición)
+setup_logging("chatbot-service", app)
+
+# Health checks (readiness cacheada, refrescada en segundo plano)
+probe = ReadinessProbe(service="chatbot-service")
+probe.add_check("database", sql_check(engine))
+app.add_event_handler("startup", probe.start)
+app.add_event_handler("shutdown", probe.stop)
+
 # Incluir routers
 app.include_router(chat.router, prefix=settings.API_V1_STR)
+app.include_router(health_router(probe))
 
 @app.get("/")
 def root():
@@ -1,5 +0,0 @@
-from src.infrastructure.database import Base
-from src.models.cattle import Cattle, GenderEnum
-from src.models.health_event import HealthEvent, EventTypeEnum, AdministrationRouteEnum
-from src.models.heat_event import HeatEventModel
-from src.models.reminder import Reminder
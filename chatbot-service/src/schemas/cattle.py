@@ -2,13 +2,9 @@
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import date, datetime
 from typing import Optional
-from enum import Enum
 from uuid import UUID
 
-
-class GenderEnum(str, Enum):
-    male = "male"
-    female = "female"
+from bovara_data import GenderEnum
 
 
 class CattleBase(BaseModel):
@@ -2,27 +2,9 @@
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import date, datetime
 from typing import Optional
-from enum import Enum
 from uuid import UUID
 
-
-class EventTypeEnum(str, Enum):
-    vaccine = "vaccine"
-    treatment = "treatment"
-    checkup = "checkup"
-    surgery = "surgery"
-    injury = "injury"
-    illness = "illness"
-    other = "other"
-
-
-class AdministrationRouteEnum(str, Enum):
-    oral = "oral"
-    intramuscular = "intramuscular"
-    subcutaneous = "subcutaneous"
-    intravenous = "intravenous"
-    topical = "topical"
-    other = "other"
+from bovara_data import AdministrationRouteEnum, EventTypeEnum
 
 
 class HealthEventBase(BaseModel):
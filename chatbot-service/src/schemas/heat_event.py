@@ -8,9 +8,9 @@ from uuid import UUID
 class HeatEventBase(BaseModel):
     heat_date: date
     allows_mounting: Optional[bool] = None
-    vaginal_discharge: Optional[str] = Field(None, max_length=200)
-    vulva_swelling: Optional[str] = Field(None, max_length=200)
-    comportamiento: Optional[str] = Field(None, max_length=500)
+    vaginal_discharge: Optional[str] = Field(None, max_length=20)
+    vulva_swelling: Optional[str] = Field(None, max_length=20)
+    comportamiento: Optional[str] = Field(None, max_length=30)
     was_inseminated: bool = False
     insemination_date: Optional[date] = None
     pregnancy_confirmed: Optional[bool] = None
@@ -23,9 +23,9 @@ class HeatEventCreate(HeatEventBase):
 class HeatEventUpdate(BaseModel):
     heat_date: Optional[date] = None
     allows_mounting: Optional[bool] = None
-    vaginal_discharge: Optional[str] = Field(None, max_length=200)
-    vulva_swelling: Optional[str] = Field(None, max_length=200)
-    comportamiento: Optional[str] = Field(None, max_length=500)
+    vaginal_discharge: Optional[str] = Field(None, max_length=20)
+    vulva_swelling: Optional[str] = Field(None, max_length=20)
+    comportamiento: Optional[str] = Field(None, max_length=30)
     was_inseminated: Optional[bool] = None
     insemination_date: Optional[date] = None
     pregnancy_confirmed: Optional[bool] = None
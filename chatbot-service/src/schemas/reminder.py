@@ -2,23 +2,9 @@
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import date, datetime
 from typing import Optional
-from enum import Enum
 from uuid import UUID
 
-
-class ReminderTypeEnum(str, Enum):
-    vaccine = "vaccine"
-    checkup = "checkup"
-    treatment = "treatment"
-    feeding = "feeding"
-    breeding = "breeding"
-    other = "other"
-
-
-class ReminderStatusEnum(str, Enum):
-    pending = "pending"
-    completed = "completed"
-    cancelled = "cancelled"
+from bovara_data import ReminderStatusEnum, ReminderTypeEnum
 
 
 class ReminderBase(BaseModel):
@@ -27,7 +13,6 @@ class ReminderBase(BaseModel):
     reminder_date: date
     reminder_type: ReminderTypeEnum
     cattle_id: Optional[UUID] = None
-    health_event_id: Optional[UUID] = None
 
 
 class ReminderCreate(ReminderBase):
@@ -40,14 +25,12 @@ class ReminderUpdate(BaseModel):
     reminder_date: Optional[date] = None
     reminder_type: Optional[ReminderTypeEnum] = None
     cattle_id: Optional[UUID] = None
-    health_event_id: Optional[UUID] = None
     status: Optional[ReminderStatusEnum] = None
 
 
 class ReminderResponse(ReminderBase):
     id: UUID
     status: ReminderStatusEnum
-    completed_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
     
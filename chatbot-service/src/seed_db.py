@@ -5,10 +5,12 @@ from datetime import date, datetime, timedelta
 import uuid
 from sqlalchemy.orm import Session
 
+from bovara_data import (
+    Cattle, HealthEvent, HeatEvent, Reminder,
+    GenderEnum, EventTypeEnum, AdministrationRouteEnum, ReminderTypeEnum, ReminderStatusEnum
+)
+from src.core.config import settings
 from src.infrastructure.database import SessionLocal
-from src.models import Cattle, HealthEvent, HeatEventModel, Reminder
-from src.models.cattle import GenderEnum
-from src.models.health_event import EventTypeEnum, AdministrationRouteEnum
 
 
 def create_sample_data():
@@ -28,6 +30,7 @@ def create_sample_data():
         
         cattle_1 = Cattle(
             id=uuid.uuid4(),
+            owner_id=settings.OWNER_ID,
             name="Margarita",
             lote="LOTE-001",
             breed="Holstein",
@@ -39,6 +42,7 @@ def create_sample_data():
         
         cattle_2 = Cattle(
             id=uuid.uuid4(),
+            owner_id=settings.OWNER_ID,
             name="Bella",
             lote="LOTE-002",
             breed="Jersey",
@@ -50,6 +54,7 @@ def create_sample_data():
         
         cattle_3 = Cattle(
             id=uuid.uuid4(),
+            owner_id=settings.OWNER_ID,
             name="Toro Max",
             lote="LOTE-003",
             breed="Angus",
@@ -60,6 +65,7 @@ def create_sample_data():
         
         cattle_4 = Cattle(
             id=uuid.uuid4(),
+            owner_id=settings.OWNER_ID,
             lote="LOTE-004",
             name="Luna",
             breed="Simmental",
@@ -133,31 +139,31 @@ def create_sample_data():
         # ==================== HEAT EVENTS ====================
         print("\n🔥 Creando eventos de celo...")
         
-        heat_event_1 = HeatEventModel(
+        heat_event_1 = HeatEvent(
             id=uuid.uuid4(),
             cattle_id=cattle_1.id,
             heat_date=date(2024, 11, 20),
             allows_mounting=True,
             vaginal_discharge="Mucoso transparente",
             vulva_swelling="Moderado",
-            comportamiento="Inquieta, busca montar otras vacas",
+            comportamiento="Inquieta, monta otras vacas",
             was_inseminated=True,
             insemination_date=date(2024, 11, 21),
             pregnancy_confirmed=True
         )
         
-        heat_event_2 = HeatEventModel(
+        heat_event_2 = HeatEvent(
             id=uuid.uuid4(),
             cattle_id=cattle_2.id,
             heat_date=date(2024, 12, 5),
             allows_mounting=True,
             vaginal_discharge="Mucoso claro",
             vulva_swelling="Leve",
-            comportamiento="Nerviosa, mugidos frecuentes",
+            comportamiento="Nerviosa, muge seguido",
             was_inseminated=False
         )
         
-        heat_event_3 = HeatEventModel(
+        heat_event_3 = HeatEvent(
             id=uuid.uuid4(),
             cattle_id=cattle_4.id,
             heat_date=date(2024, 11, 10),
@@ -180,53 +186,56 @@ def create_sample_data():
         
         reminder_1 = Reminder(
             id=uuid.uuid4(),
+            user_id=settings.OWNER_ID,
             cattle_id=cattle_1.id,
-            health_event_id=health_event_1.id,
             title="Vacuna de refuerzo - Margarita",
             description="Aplicar segunda dosis de Aftovacuna",
             reminder_date=date(2025, 4, 1),
-            reminder_type="vaccine",
-            status="pending"
+            reminder_type=ReminderTypeEnum.vaccine,
+            status=ReminderStatusEnum.pending
         )
         
         reminder_2 = Reminder(
             id=uuid.uuid4(),
+            user_id=settings.OWNER_ID,
             cattle_id=cattle_1.id,
             title="Chequeo de preñez - Margarita",
             description="Confirmar embarazo después de inseminación",
             reminder_date=date(2025, 1, 20),
-            reminder_type="checkup",
-            status="pending"
+            reminder_type=ReminderTypeEnum.checkup,
+            status=ReminderStatusEnum.pending
         )
         
         reminder_3 = Reminder(
             id=uuid.uuid4(),
+            user_id=settings.OWNER_ID,
             cattle_id=cattle_2.id,
-            health_event_id=health_event_3.id,
             title="Seguimiento tratamiento - Bella",
             description="Revisar evolución de mastitis",
             reminder_date=date(2024, 12, 15),
-            reminder_type="checkup",
-            status="pending"
+            reminder_type=ReminderTypeEnum.checkup,
+            status=ReminderStatusEnum.pending
         )
         
         reminder_4 = Reminder(
             id=uuid.uuid4(),
+            user_id=settings.OWNER_ID,
             cattle_id=cattle_4.id,
             title="Verificar preñez - Luna",
             description="Chequeo post-inseminación",
             reminder_date=date(2025, 1, 10),
-            reminder_type="checkup",
-            status="pending"
+            reminder_type=ReminderTypeEnum.checkup,
+            status=ReminderStatusEnum.pending
         )
         
         reminder_5 = Reminder(
             id=uuid.uuid4(),
+            user_id=settings.OWNER_ID,
             title="Revisar inventario de medicamentos",
             description="Verificar stock de vacunas y antibióticos",
             reminder_date=date(2024, 12, 20),
-            reminder_type="other",
-            status="pending"
+            reminder_type=ReminderTypeEnum.other,
+            status=ReminderStatusEnum.pending
         )
         
         db.add_all([reminder_1, reminder_2, reminder_3, reminder_4, reminder_5])
@@ -240,7 +249,7 @@ def create_sample_data():
         print(f"\n📊 Resumen:")
         print(f"   • {db.query(Cattle).count()} cabezas de ganado")
         print(f"   • {db.query(HealthEvent).count()} eventos de salud")
-        print(f"   • {db.query(HeatEventModel).count()} eventos de celo")
+        print(f"   • {db.query(HeatEvent).count()} eventos de celo")
         print(f"   • {db.query(Reminder).count()} recordatorios")
         
     except Exception as e:
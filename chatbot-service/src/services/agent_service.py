@@ -1,12 +1,18 @@
 # src/services/agent_service.py
+import logging
 import os
 from typing import Dict, Any, List
 from sqlalchemy.orm import Session
 from google import genai
 from google.genai import types
 
+from bovara_ops import time_llm, time_tool
+
 from src.core.config import settings
 from src.services.tools import cattle_tools, health_tools, heat_tools, reminder_tools
+from src.services.tools.records import serialize
+
+logger = logging.getLogger(__name__)
 
 
 class LivestockTools:
@@ -100,6 +106,7 @@ class AgentService:
         
 Usa las herramientas disponibles para responder a las preguntas del usuario.
 Si el usuario menciona un número de lote (ej: "vaca 504"), asume que es "LOTE-504".
+Las herramientas devuelven registros JSON compactos (fechas ISO, campos vacíos omitidos); redacta tú la respuesta final en lenguaje natural.
 NO uses emojis. Sé directo y profesional.
 """
 
@@ -138,25 +145,29 @@ NO uses emojis. Sé directo y profesional.
             )
 
             # 3. Primera llamada (Usuario -> Modelo)
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=user_message,
-                config=config
-            )
+            with time_llm(self.model_name, "tool_selection"):
+                response = self.client.models.generate_content(
+                    model=self.model_name,
+                    contents=user_message,
+                    config=config
+                )
 
             # 4. Verificar si hay llamadas a función
             tool_used_name = None
             tool_result_str = None
             tool_params = None
             
-            # Debug: Imprimir respuesta cruda para diagnóstico
-            print(f"DEBUG: Response candidates: {len(response.candidates)}")
-            if response.candidates:
-                print(f"DEBUG: Candidate 0 parts: {len(response.candidates[0].content.parts)}")
-                for i, part in enumerate(response.candidates[0].content.parts):
-                    print(f"DEBUG: Part {i} has function_call: {part.function_call is not None}")
-                    if part.function_call:
-                        print(f"DEBUG: Function call name: {part.function_call.name}")
+            # Debug: resumen de la respuesta cruda (solo se construye con DEBUG activo)
+            if logger.isEnabledFor(logging.DEBUG) and response.candidates:
+                parts = response.candidates[0].content.parts or []
+                logger.debug(
+                    "Respuesta del modelo",
+                    extra={
+                        "candidates": len(response.candidates),
+                        "parts": len(parts),
+                        "function_calls": [part.function_call.name for part in parts if part.function_call]
+                    }
+                )
 
             # Verificar function_calls en la respuesta (SDK v0.2+)
             # A veces response.function_calls puede estar vacío pero candidates[0].content.parts[0].function_call existe
@@ -174,17 +185,18 @@ NO uses emojis. Sé directo y profesional.
                 tool_name = function_call.name
                 tool_args = function_call.args
                 
-                print(f"DEBUG: Executing tool {tool_name} with args {tool_args}")
+                logger.debug("Ejecutando herramienta", extra={"tool": tool_name, "tool_args": tool_args})
                 
                 tool_used_name = tool_name
                 tool_params = tool_args
 
                 if tool_name in tool_map:
                     try:
-                        result = tool_map[tool_name](**tool_args)
-                        tool_result_str = str(result)
+                        with time_tool(tool_name):
+                            result = tool_map[tool_name](**tool_args)
                     except Exception as e:
-                        tool_result_str = f"Error al ejecutar herramienta: {str(e)}"
+                        result = {"error": f"Error al ejecutar herramienta: {str(e)}"}
+                    tool_result_str = serialize(result)
                     
                     # 5. Segunda llamada (Resultado -> Modelo)
                     from google.genai.types import Content, Part
@@ -192,17 +204,18 @@ NO uses emojis. Sé directo y profesional.
                     user_content = Content(role="user", parts=[Part.from_text(user_message)])
                     model_content = response.candidates[0].content
                     
-                    # Construir respuesta de herramienta correctamente
+                    # Construir respuesta de herramienta con el registro estructurado (sin re-serializar)
                     function_content = Content(role="tool", parts=[Part.from_function_response(
                         name=tool_name,
-                        response={"result": tool_result_str}
+                        response={"result": result}
                     )])
                     
-                    final_response = self.client.models.generate_content(
-                        model=self.model_name,
-                        contents=[user_content, model_content, function_content],
-                        config=config
-                    )
+                    with time_llm(self.model_name, "final_answer"):
+                        final_response = self.client.models.generate_content(
+                            model=self.model_name,
+                            contents=[user_content, model_content, function_content],
+                            config=config
+                        )
                     
                     return {
                         "response": final_response.text,
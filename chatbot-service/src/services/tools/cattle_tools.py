@@ -1,20 +1,36 @@
 # src/services/tools/cattle_tools.py
-from typing import List, Optional
+from typing import Any, Dict
 from datetime import date
 from sqlalchemy.orm import Session
 
 from src.repositories import CattleRepository
-from src.schemas.cattle import CattleResponse, CattleCreate, GenderEnum
+from src.schemas.cattle import CattleCreate, GenderEnum
+from src.services.tools.records import record
 
 
-def create_cattle_tool(db: Session, name: str, lote: str, gender: str, breed: str = None, weight: float = None, birth_date: str = None) -> str:
+def _age_years(birth_date: date) -> int:
+    return (date.today() - birth_date).days // 365
+
+
+def _cattle_record(cattle) -> Dict[str, Any]:
+    return record(
+        name=cattle.name,
+        lote=cattle.lote,
+        breed=cattle.breed,
+        gender=cattle.gender,
+        weight_kg=cattle.weight,
+        age_years=_age_years(cattle.birth_date) if cattle.birth_date else None,
+    )
+
+
+def create_cattle_tool(db: Session, name: str, lote: str, gender: str, breed: str = None, weight: float = None, birth_date: str = None) -> Dict[str, Any]:
     """Registra un nuevo ganado en la base de datos"""
     try:
         # Validar género
         try:
             gender_enum = GenderEnum(gender.lower())
         except ValueError:
-            return f"Error: El género debe ser 'male' o 'female'. Recibido: {gender}"
+            return {"error": f"El género debe ser 'male' o 'female'. Recibido: {gender}"}
 
         # Convertir fecha si existe
         birth_date_obj = None
@@ -22,7 +38,7 @@ def create_cattle_tool(db: Session, name: str, lote: str, gender: str, breed: st
             try:
                 birth_date_obj = date.fromisoformat(birth_date)
             except ValueError:
-                return f"Error: La fecha de nacimiento debe tener formato YYYY-MM-DD. Recibido: {birth_date}"
+                return {"error": f"La fecha de nacimiento debe tener formato YYYY-MM-DD. Recibido: {birth_date}"}
 
         cattle_data = CattleCreate(
             name=name,
@@ -32,95 +48,61 @@ def create_cattle_tool(db: Session, name: str, lote: str, gender: str, breed: st
             weight=weight,
             birth_date=birth_date_obj
         )
-        
+
         repo = CattleRepository(db)
-        
+
         # Verificar si el lote ya existe
         if repo.get_by_lote(lote):
-            return f"Error: Ya existe un ganado con el lote '{lote}'."
-            
+            return {"error": f"Ya existe un ganado con el lote '{lote}'."}
+
         new_cattle = repo.create(cattle_data)
-        
-        return f"✅ Ganado registrado exitosamente:\n- Nombre: {new_cattle.name}\n- Lote: {new_cattle.lote}\n- ID: {new_cattle.id}"
+
+        return {"created": record(id=new_cattle.id, name=new_cattle.name, lote=new_cattle.lote)}
     except Exception as e:
-        return f"Error al crear ganado: {str(e)}"
+        return {"error": f"Error al crear ganado: {str(e)}"}
 
 
-def get_all_cattle_tool(db: Session, limit: int = 50) -> str:
+def get_all_cattle_tool(db: Session, limit: int = 50) -> Dict[str, Any]:
     """Obtiene información de todo el ganado registrado"""
     repo = CattleRepository(db)
     cattle_list = repo.get_all(limit=limit)
-    
-    if not cattle_list:
-        return "No hay ganado registrado en la base de datos."
-    
-    result = f"Total de ganado: {repo.count()}\n\n"
-    for cattle in cattle_list:
-        result += f"- {cattle.name} (Lote: {cattle.lote})\n"
-        result += f"  Raza: {cattle.breed or 'No especificada'}\n"
-        result += f"  Género: {cattle.gender.value}\n"
-        result += f"  Peso: {cattle.weight or 'No registrado'} kg\n"
-        if cattle.birth_date:
-            age = (date.today() - cattle.birth_date).days // 365
-            result += f"  Edad: {age} años\n"
-        result += "\n"
-    
-    return result
-
-
-def search_cattle_by_name_tool(db: Session, name: str) -> str:
+
+    return {
+        "total": repo.count() if cattle_list else 0,
+        "cattle": [_cattle_record(cattle) for cattle in cattle_list],
+    }
+
+
+def search_cattle_by_name_tool(db: Session, name: str) -> Dict[str, Any]:
     """Busca ganado por nombre"""
     repo = CattleRepository(db)
     cattle_list = repo.search_by_name(name, limit=10)
-    
-    if not cattle_list:
-        return f"No se encontró ningún ganado con el nombre '{name}'."
-    
-    result = f"Ganado encontrado con nombre similar a '{name}':\n\n"
-    for cattle in cattle_list:
-        result += f"- {cattle.name} (Lote: {cattle.lote})\n"
-        result += f"  Raza: {cattle.breed}\n"
-        result += f"  Género: {cattle.gender.value}\n"
-        result += f"  Peso: {cattle.weight} kg\n"
-        result += "\n"
-    
-    return result
-
-
-def get_cattle_by_lote_tool(db: Session, lote: str) -> str:
+
+    return {"query": name, "cattle": [_cattle_record(cattle) for cattle in cattle_list]}
+
+
+def get_cattle_by_lote_tool(db: Session, lote: str) -> Dict[str, Any]:
     """Obtiene información de un ganado específico por su lote"""
     repo = CattleRepository(db)
     cattle = repo.get_by_lote(lote)
-    
+
     if not cattle:
-        return f"No se encontró ganado con el lote '{lote}'."
-    
-    result = f"Información del ganado {cattle.name}:\n"
-    result += f"- Lote: {cattle.lote}\n"
-    result += f"- Raza: {cattle.breed or 'No especificada'}\n"
-    result += f"- Género: {cattle.gender.value}\n"
-    result += f"- Peso: {cattle.weight or 'No registrado'} kg\n"
-    
-    if cattle.birth_date:
-        age = (date.today() - cattle.birth_date).days // 365
-        result += f"- Edad: {age} años (Fecha de nacimiento: {cattle.birth_date})\n"
-    
-    if cattle.fecha_ultimo_parto:
-        result += f"- Último parto: {cattle.fecha_ultimo_parto}\n"
-    
-    return result
-
-
-def get_cattle_by_gender_tool(db: Session, gender: str) -> str:
+        return {"error": f"No se encontró ganado con el lote '{lote}'."}
+
+    return {
+        "cattle": {
+            **_cattle_record(cattle),
+            **record(birth_date=cattle.birth_date, last_birth=cattle.fecha_ultimo_parto),
+        }
+    }
+
+
+def get_cattle_by_gender_tool(db: Session, gender: str) -> Dict[str, Any]:
     """Obtiene ganado filtrado por género (male o female)"""
     repo = CattleRepository(db)
     cattle_list = repo.get_by_gender(gender, limit=50)
-    
-    if not cattle_list:
-        return f"No se encontró ganado de género '{gender}'."
-    
-    result = f"Ganado de género {gender}:\n\n"
-    for cattle in cattle_list:
-        result += f"- {cattle.name} (Lote: {cattle.lote}, Raza: {cattle.breed})\n"
-    
-    return result
+
+    return {
+        "gender": gender,
+        "cattle": [record(name=c.name, lote=c.lote, breed=c.breed) for c in cattle_list],
+    }
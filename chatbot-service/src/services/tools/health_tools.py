@@ -1,136 +1,112 @@
 # src/services/tools/health_tools.py
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import date, timedelta
 from sqlalchemy.orm import Session
 
 from src.repositories import HealthEventRepository, CattleRepository
+from bovara_data import EventTypeEnum
+from src.services.tools.records import record
 
 
-def get_health_events_by_cattle_tool(db: Session, lote: str) -> str:
+# Dosis por respuesta; `total` indica cuántas hay en realidad
+DOSES_LIMIT = 50
+ALL_DOSES_LIMIT = 100
+
+
+def _dose_record(event, current_date: date) -> Dict[str, Any]:
+    return record(
+        name=event.cattle.name,
+        lote=event.cattle.lote,
+        date=event.next_dose_date,
+        days=(event.next_dose_date - current_date).days,
+        type=event.event_type,
+        medicine=event.medicine_name,
+        dosage=event.dosage,
+    )
+
+
+def get_health_events_by_cattle_tool(db: Session, lote: str) -> Dict[str, Any]:
     """Obtiene el historial de eventos de salud de un ganado por su lote"""
     cattle_repo = CattleRepository(db)
     cattle = cattle_repo.get_by_lote(lote)
-    
+
     if not cattle:
-        return f"No se encontró ganado con el lote '{lote}'."
-    
+        return {"error": f"No se encontró ganado con el lote '{lote}'."}
+
     health_repo = HealthEventRepository(db)
     events = health_repo.get_by_cattle_id(cattle.id, limit=20)
-    
-    if not events:
-        return f"El ganado {cattle.name} (Lote: {lote}) no tiene eventos de salud registrados."
-    
-    result = f"Historial de salud de {cattle.name} (Lote: {lote}):\n\n"
-    for event in events:
-        result += f"📅 {event.application_date} - {event.event_type.value.upper()}\n"
-        if event.disease_name:
-            result += f"   Enfermedad: {event.disease_name}\n"
-        if event.medicine_name:
-            result += f"   Medicamento: {event.medicine_name}\n"
-        if event.dosage:
-            result += f"   Dosis: {event.dosage}\n"
-        if event.next_dose_date:
-            result += f"   Próxima dosis: {event.next_dose_date}\n"
-        if event.veterinarian_name:
-            result += f"   Veterinario: {event.veterinarian_name}\n"
-        if event.notes:
-            result += f"   Notas: {event.notes}\n"
-        result += "\n"
-    
-    return result
-
-
-def get_upcoming_vaccines_tool(db: Session, days: int = 30) -> str:
+
+    return {
+        "name": cattle.name,
+        "lote": lote,
+        "events": [
+            record(
+                date=event.application_date,
+                type=event.event_type,
+                disease=event.disease_name,
+                medicine=event.medicine_name,
+                dosage=event.dosage,
+                next_dose=event.next_dose_date,
+                vet=event.veterinarian_name,
+                notes=event.notes,
+            )
+            for event in events
+        ],
+    }
+
+
+def get_upcoming_vaccines_tool(db: Session, days: int = 30) -> Dict[str, Any]:
     """Obtiene las vacunas próximas a aplicar en los próximos X días"""
     health_repo = HealthEventRepository(db)
-    cattle_repo = CattleRepository(db)
-    
+
     current_date = date.today()
-    events = health_repo.get_upcoming_doses(current_date, limit=50)
-    
-    # Filtrar solo las que están dentro del rango de días
-    upcoming = [e for e in events if e.next_dose_date <= current_date + timedelta(days=days)]
-    
-    if not upcoming:
-        return f"No hay vacunas programadas para los próximos {days} días."
-    
-    result = f"Vacunas y tratamientos programados para los próximos {days} días:\n\n"
-    for event in upcoming:
-        cattle = cattle_repo.get_by_id(event.cattle_id)
-        days_remaining = (event.next_dose_date - current_date).days
-        
-        result += f"📌 {cattle.name} (Lote: {cattle.lote})\n"
-        result += f"   Fecha: {event.next_dose_date} ({days_remaining} días)\n"
-        result += f"   Tipo: {event.event_type.value}\n"
-        if event.medicine_name:
-            result += f"   Medicamento: {event.medicine_name}\n"
-        if event.dosage:
-            result += f"   Dosis: {event.dosage}\n"
-        result += "\n"
-    
-    return result
-
-
-def get_last_vaccine_tool(db: Session, lote: str, vaccine_name: Optional[str] = None) -> str:
+    end_date = current_date + timedelta(days=days)
+    upcoming = health_repo.get_doses_in_range(current_date, end_date, limit=DOSES_LIMIT)
+    # Solo se cuenta si la página se llenó
+    total = len(upcoming) if len(upcoming) < DOSES_LIMIT else health_repo.count_doses_in_range(current_date, end_date)
+
+    return {
+        "days": days,
+        "total": total,
+        "truncated": total > len(upcoming),
+        "doses": [_dose_record(event, current_date) for event in upcoming],
+    }
+
+
+def get_last_vaccine_tool(db: Session, lote: str, vaccine_name: Optional[str] = None) -> Dict[str, Any]:
     """Obtiene la última vacuna aplicada a un ganado específico"""
     cattle_repo = CattleRepository(db)
     cattle = cattle_repo.get_by_lote(lote)
-    
+
     if not cattle:
-        return f"No se encontró ganado con el lote '{lote}'."
-    
+        return {"error": f"No se encontró ganado con el lote '{lote}'."}
+
     health_repo = HealthEventRepository(db)
-    events = health_repo.get_by_cattle_id(cattle.id, limit=50)
-    
-    # Filtrar solo vacunas
-    from src.models.health_event import EventTypeEnum
-    vaccines = [e for e in events if e.event_type == EventTypeEnum.vaccine]
-    
-    if vaccine_name:
-        vaccines = [v for v in vaccines if vaccine_name.lower() in (v.medicine_name or '').lower()]
-    
-    if not vaccines:
-        msg = f"vacuna {vaccine_name}" if vaccine_name else "vacunas"
-        return f"El ganado {cattle.name} (Lote: {lote}) no tiene {msg} registradas."
-    
-    last_vaccine = vaccines[0]  # Ya están ordenadas por fecha descendente
-    
-    result = f"Última vacuna de {cattle.name} (Lote: {lote}):\n"
-    result += f"- Fecha de aplicación: {last_vaccine.application_date}\n"
-    result += f"- Vacuna: {last_vaccine.medicine_name or 'No especificada'}\n"
-    if last_vaccine.disease_name:
-        result += f"- Para: {last_vaccine.disease_name}\n"
-    if last_vaccine.next_dose_date:
-        result += f"- Próxima dosis: {last_vaccine.next_dose_date}\n"
-    if last_vaccine.veterinarian_name:
-        result += f"- Veterinario: {last_vaccine.veterinarian_name}\n"
-    
-    return result
-
-
-def get_all_upcoming_vaccines_tool(db: Session) -> str:
+    last_vaccine = health_repo.get_last_by_type(cattle.id, EventTypeEnum.vaccine, medicine_name=vaccine_name)
+
+    return {
+        "name": cattle.name,
+        "lote": lote,
+        "last_vaccine": record(
+            date=last_vaccine.application_date,
+            medicine=last_vaccine.medicine_name,
+            disease=last_vaccine.disease_name,
+            next_dose=last_vaccine.next_dose_date,
+            vet=last_vaccine.veterinarian_name,
+        ) if last_vaccine else None,
+    }
+
+
+def get_all_upcoming_vaccines_tool(db: Session) -> Dict[str, Any]:
     """Obtiene TODAS las próximas vacunas/dosis pendientes de todo el ganado"""
     health_repo = HealthEventRepository(db)
-    cattle_repo = CattleRepository(db)
-    
+
     current_date = date.today()
-    events = health_repo.get_upcoming_doses(current_date, limit=100)
-    
-    if not events:
-        return "No hay vacunas o dosis pendientes programadas."
-    
-    result = f"Todas las vacunas y dosis pendientes:\n\n"
-    for event in events:
-        cattle = cattle_repo.get_by_id(event.cattle_id)
-        days_remaining = (event.next_dose_date - current_date).days
-        
-        result += f"📌 {cattle.name} (Lote: {cattle.lote})\n"
-        result += f"   Fecha programada: {event.next_dose_date} (en {days_remaining} días)\n"
-        result += f"   Tipo: {event.event_type.value}\n"
-        if event.medicine_name:
-            result += f"   Medicamento: {event.medicine_name}\n"
-        if event.dosage:
-            result += f"   Dosis: {event.dosage}\n"
-        result += "\n"
-    
-    return result
+    events = health_repo.get_upcoming_doses(current_date, limit=ALL_DOSES_LIMIT, with_cattle=True)
+    total = len(events) if len(events) < ALL_DOSES_LIMIT else health_repo.count_upcoming_doses(current_date)
+
+    return {
+        "total": total,
+        "truncated": total > len(events),
+        "doses": [_dose_record(event, current_date) for event in events],
+    }
@@ -0,0 +1,25 @@
+# src/services/tools/records.py
+import json
+from datetime import date
+from enum import Enum
+from typing import Any, Dict
+from uuid import UUID
+
+
+def _plain(value: Any) -> Any:
+    """Convierte fechas, UUID y enums a tipos JSON simples"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, UUID)):
+        return str(value)
+    return value
+
+
+def record(**fields) -> Dict[str, Any]:
+    """Crea un registro compacto omitiendo los campos vacíos"""
+    return {key: _plain(value) for key, value in fields.items() if value is not None}
+
+
+def serialize(result: Any) -> str:
+    """Serializa el resultado de una herramienta una sola vez, sin espacios"""
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":"), default=str)
@@ -10,8 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from src.infrastructure.database import Base
-from src.infrastructure.models.cattle import CattleModel
-from src.infrastructure.models.ranch import RanchModel
+import src.infrastructure.models  # noqa: F401  registra todas las tablas en Base.metadata
 
 config = context.config
 
@@ -0,0 +1,62 @@
+"""Per-animal health event counters
+
+Revision ID: 5e0c3a7b91d4
+Revises: b41e7d2a9c55
+Create Date: 2026-10-19 15:40:11.207314
+
+ml-service (clustering) agrupaba cattle LEFT JOIN health_events completo en
+cada entrenamiento / listado de clusters, y por animal en cada predicción.
+cattle_health_stats guarda esos conteos ya calculados; core-service los
+mantiene en la misma transacción en la que crea, actualiza o borra un evento
+(HealthEventRepository -> HealthStatsRepository.apply), así que la lectura es
+un join 1:1 por clave primaria.
+
+La tabla se rellena aquí con el conteo actual. Las cargas masivas que escriben
+health_events sin pasar por el servicio (COPY, scripts de carga) deben llamar
+después a HealthStatsRepository.rebuild().
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0c3a7b91d4'
+down_revision: Union[str, None] = 'b41e7d2a9c55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'cattle_health_stats',
+        sa.Column('cattle_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('total_eventos', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('total_vacunas', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('total_tratamientos', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('total_enfermedades', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['cattle_id'], ['cattle.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('cattle_id'),
+    )
+
+    op.execute("""
+        INSERT INTO cattle_health_stats
+            (cattle_id, total_eventos, total_vacunas, total_tratamientos, total_enfermedades, updated_at)
+        SELECT
+            c.id,
+            COUNT(he.id),
+            COUNT(CASE WHEN he.event_type = 'vaccine' THEN 1 END),
+            COUNT(CASE WHEN he.event_type = 'treatment' THEN 1 END),
+            COUNT(CASE WHEN he.event_type = 'illness' THEN 1 END),
+            now()
+        FROM cattle c
+        LEFT JOIN health_events he ON c.id = he.cattle_id
+        GROUP BY c.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('cattle_health_stats')
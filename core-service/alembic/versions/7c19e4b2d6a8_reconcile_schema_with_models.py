@@ -0,0 +1,236 @@
+"""Reconcile schema with the current models
+
+Revision ID: 7c19e4b2d6a8
+Revises: 1c6d8ff59306
+Create Date: 2026-10-19 09:40:12.506311
+
+Las dos primeras revisiones se generaron con un modelo anterior (ranches,
+cattle.lot / tag_number, enums en mayúsculas) y no creaban heat_events. Esta
+revisión lleva ese esquema al de los modelos (bovara_data.models):
+
+- cattle: lot -> lote, last_birth_date -> fecha_ultimo_parto, gender como
+  genderenum; se eliminan ranch_id, tag_number, status, reproductive_status
+  (y la tabla ranches).
+- health_events / reminders: enums con los valores del modelo, longitudes del
+  modelo; reminders pierde health_event_id / completed_at y su FK a cattle pasa
+  a ON DELETE SET NULL.
+- heat_events: se crea.
+
+Los índices los crea la siguiente revisión (b41e7d2a9c55).
+
+El downgrade vuelve a la estructura de 1c6d8ff59306, pero los datos eliminados
+no se pueden recuperar: ranches se recrea vacía, y las columnas que se
+eliminaron vuelven como nullable y vacías (tag_number, ranch_id, status,
+reproductive_status, health_event_id y completed_at). Por la misma razón,
+birth_date, breed, disease_name, medicine_name y administration_route siguen
+siendo nullable. Los valores de enum que no existían antes se asignan al más
+cercano (o a NULL), y cada conversión se registra en el log de alembic.
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c19e4b2d6a8'
+down_revision: Union[str, None] = '1c6d8ff59306'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _retype_enum(table: str, column: str, old_type: str, new_type: str, values: Sequence[str], mapping: str) -> None:
+    """Crea `new_type` y convierte la columna con la expresión `mapping` (sobre el texto del valor)"""
+    labels = ", ".join(f"'{v}'" for v in values)
+    op.execute(f"CREATE TYPE {new_type} AS ENUM ({labels})")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {new_type} USING ({mapping})::{new_type}")
+    if old_type:
+        op.execute(f"DROP TYPE {old_type}")
+
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def _log_lossy(table: str, column: str, values: Sequence[str], target: str) -> None:
+    """Registra cuántas filas pierden su valor de enum en el downgrade"""
+    labels = ", ".join(f"'{v}'" for v in values)
+    count = op.get_bind().execute(
+        sa.text(f"SELECT COUNT(*) FROM {table} WHERE {column}::text IN ({labels})")
+    ).scalar()
+    if count:
+        logger.warning("%s.%s: %d filas con %s pasan a %s", table, column, count, labels, target)
+
+
+def upgrade() -> None:
+    # ==================== cattle ====================
+    op.alter_column('cattle', 'lot', new_column_name='lote')
+    op.alter_column('cattle', 'last_birth_date', new_column_name='fecha_ultimo_parto')
+    op.alter_column('cattle', 'birth_date', nullable=True)
+    op.alter_column('cattle', 'breed', nullable=True)
+    op.drop_column('cattle', 'tag_number')
+    op.drop_column('cattle', 'ranch_id')
+    op.drop_column('cattle', 'status')
+    op.drop_column('cattle', 'reproductive_status')
+    op.execute("DROP TYPE IF EXISTS cattlestatus")
+    op.execute("DROP TYPE IF EXISTS reproductivestatus")
+    _retype_enum(
+        'cattle', 'gender', None, 'genderenum', ['male', 'female'],
+        "CASE lower(gender) WHEN 'm' THEN 'male' WHEN 'macho' THEN 'male' "
+        "WHEN 'f' THEN 'female' WHEN 'hembra' THEN 'female' ELSE lower(gender) END"
+    )
+
+    op.drop_index('ix_ranches_owner_id', table_name='ranches')
+    op.drop_table('ranches')
+
+    # ==================== health_events ====================
+    _retype_enum(
+        'health_events', 'event_type', 'eventtype', 'eventtypeenum',
+        ['vaccine', 'treatment', 'checkup', 'surgery', 'injury', 'illness', 'other'],
+        "CASE event_type::text WHEN 'VACCINATION' THEN 'vaccine' ELSE lower(event_type::text) END"
+    )
+    _retype_enum(
+        'health_events', 'administration_route', 'administrationroute', 'administrationrouteenum',
+        ['oral', 'intramuscular', 'subcutaneous', 'intravenous', 'topical', 'other'],
+        "CASE administration_route::text WHEN 'SUBCUTANEA' THEN 'subcutaneous' "
+        "WHEN 'INTRAVENOSA' THEN 'intravenous' ELSE lower(administration_route::text) END"
+    )
+    op.alter_column('health_events', 'administration_route', nullable=True)
+    op.alter_column('health_events', 'disease_name', type_=sa.String(length=100), nullable=True,
+                    postgresql_using='left(disease_name, 100)')
+    op.alter_column('health_events', 'medicine_name', type_=sa.String(length=100), nullable=True,
+                    postgresql_using='left(medicine_name, 100)')
+    op.alter_column('health_events', 'dosage', type_=sa.String(length=50),
+                    postgresql_using='left(dosage, 50)')
+    op.alter_column('health_events', 'veterinarian_name', type_=sa.String(length=100),
+                    postgresql_using='left(veterinarian_name, 100)')
+
+    # ==================== reminders ====================
+    _retype_enum(
+        'reminders', 'reminder_type', 'remindertype', 'remindertypeenum',
+        ['vaccine', 'checkup', 'treatment', 'feeding', 'breeding', 'other'],
+        "CASE reminder_type::text WHEN 'GENERAL' THEN 'other' ELSE lower(reminder_type::text) END"
+    )
+    _retype_enum(
+        'reminders', 'status', 'reminderstatus', 'reminderstatusenum',
+        ['pending', 'completed', 'cancelled'],
+        "lower(status::text)"
+    )
+    op.alter_column('reminders', 'title', type_=sa.String(length=200), postgresql_using='left(title, 200)')
+    op.drop_index('ix_reminders_health_event_id', table_name='reminders')
+    op.drop_column('reminders', 'health_event_id')
+    op.drop_column('reminders', 'completed_at')
+    op.drop_constraint('reminders_cattle_id_fkey', 'reminders', type_='foreignkey')
+    op.create_foreign_key(
+        'reminders_cattle_id_fkey', 'reminders', 'cattle', ['cattle_id'], ['id'], ondelete='SET NULL'
+    )
+
+    # ==================== heat_events ====================
+    op.create_table(
+        'heat_events',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('cattle_id', sa.UUID(), nullable=False),
+        sa.Column('heat_date', sa.Date(), nullable=False),
+        sa.Column('allows_mounting', sa.Boolean(), nullable=True),
+        sa.Column('vaginal_discharge', sa.String(length=20), nullable=True),
+        sa.Column('vulva_swelling', sa.String(length=20), nullable=True),
+        sa.Column('comportamiento', sa.String(length=30), nullable=True),
+        sa.Column('was_inseminated', sa.Boolean(), nullable=True),
+        sa.Column('insemination_date', sa.Date(), nullable=True),
+        sa.Column('pregnancy_confirmed', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['cattle_id'], ['cattle.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    # ==================== heat_events ====================
+    count = op.get_bind().execute(sa.text("SELECT COUNT(*) FROM heat_events")).scalar()
+    if count:
+        logger.warning("heat_events: se eliminan %d celos (la tabla no existía en 1c6d8ff59306)", count)
+    op.drop_table('heat_events')
+
+    # ==================== reminders ====================
+    op.drop_constraint('reminders_cattle_id_fkey', 'reminders', type_='foreignkey')
+    op.create_foreign_key(
+        'reminders_cattle_id_fkey', 'reminders', 'cattle', ['cattle_id'], ['id'], ondelete='CASCADE'
+    )
+    op.add_column('reminders', sa.Column('completed_at', sa.DateTime(), nullable=True))
+    op.add_column('reminders', sa.Column('health_event_id', sa.UUID(), nullable=True))
+    op.create_foreign_key(
+        'reminders_health_event_id_fkey', 'reminders', 'health_events', ['health_event_id'], ['id'],
+        ondelete='SET NULL'
+    )
+    op.create_index('ix_reminders_health_event_id', 'reminders', ['health_event_id'], unique=False)
+    op.alter_column('reminders', 'title', type_=sa.String(length=255))
+    _retype_enum(
+        'reminders', 'status', 'reminderstatusenum', 'reminderstatus',
+        ['PENDING', 'COMPLETED', 'CANCELLED'],
+        "upper(status::text)"
+    )
+    _log_lossy('reminders', 'reminder_type', ['feeding', 'breeding', 'other'], "'GENERAL'")
+    _retype_enum(
+        'reminders', 'reminder_type', 'remindertypeenum', 'remindertype',
+        ['VACCINE', 'CHECKUP', 'TREATMENT', 'GENERAL'],
+        "CASE WHEN reminder_type::text IN ('vaccine', 'checkup', 'treatment') "
+        "THEN upper(reminder_type::text) ELSE 'GENERAL' END"
+    )
+
+    # ==================== health_events ====================
+    op.alter_column('health_events', 'veterinarian_name', type_=sa.String(length=255))
+    op.alter_column('health_events', 'dosage', type_=sa.String(length=100))
+    op.alter_column('health_events', 'medicine_name', type_=sa.String(length=255))
+    op.alter_column('health_events', 'disease_name', type_=sa.String(length=255))
+    _log_lossy('health_events', 'administration_route', ['topical', 'other'], 'NULL')
+    _retype_enum(
+        'health_events', 'administration_route', 'administrationrouteenum', 'administrationroute',
+        ['SUBCUTANEA', 'INTRAMUSCULAR', 'ORAL', 'INTRAVENOSA'],
+        "CASE administration_route::text WHEN 'subcutaneous' THEN 'SUBCUTANEA' "
+        "WHEN 'intravenous' THEN 'INTRAVENOSA' WHEN 'intramuscular' THEN 'INTRAMUSCULAR' "
+        "WHEN 'oral' THEN 'ORAL' END"
+    )
+    _log_lossy('health_events', 'event_type', ['surgery', 'injury', 'other'], "'TREATMENT' / 'ILLNESS' / 'CHECKUP'")
+    _retype_enum(
+        'health_events', 'event_type', 'eventtypeenum', 'eventtype',
+        ['VACCINATION', 'TREATMENT', 'CHECKUP', 'ILLNESS'],
+        "CASE event_type::text WHEN 'vaccine' THEN 'VACCINATION' WHEN 'surgery' THEN 'TREATMENT' "
+        "WHEN 'injury' THEN 'ILLNESS' WHEN 'other' THEN 'CHECKUP' ELSE upper(event_type::text) END"
+    )
+
+    # ==================== cattle ====================
+    op.create_table(
+        'ranches',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('owner_id', sa.UUID(), nullable=False),
+        sa.Column('name', sa.String(length=200), nullable=False),
+        sa.Column('location', sa.String(length=500), nullable=True),
+        sa.Column('size_hectares', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_ranches_owner_id', 'ranches', ['owner_id'], unique=False)
+
+    op.execute("ALTER TABLE cattle ALTER COLUMN gender TYPE VARCHAR(20) USING gender::text")
+    op.execute("DROP TYPE genderenum")
+    op.execute("CREATE TYPE reproductivestatus AS ENUM ('EMPTY', 'PREGNANT', 'LACTATING', 'DRY')")
+    op.execute("CREATE TYPE cattlestatus AS ENUM ('ACTIVE', 'SOLD', 'DECEASED', 'QUARANTINE')")
+    op.add_column('cattle', sa.Column(
+        'reproductive_status',
+        sa.Enum('EMPTY', 'PREGNANT', 'LACTATING', 'DRY', name='reproductivestatus'),
+        nullable=True,
+    ))
+    op.add_column('cattle', sa.Column(
+        'status', sa.Enum('ACTIVE', 'SOLD', 'DECEASED', 'QUARANTINE', name='cattlestatus'), nullable=True
+    ))
+    op.add_column('cattle', sa.Column('ranch_id', sa.UUID(), nullable=True))
+    op.create_foreign_key('cattle_ranch_id_fkey', 'cattle', 'ranches', ['ranch_id'], ['id'])
+    op.add_column('cattle', sa.Column('tag_number', sa.String(length=50), nullable=True))
+    op.alter_column('cattle', 'fecha_ultimo_parto', new_column_name='last_birth_date')
+    op.alter_column('cattle', 'lote', new_column_name='lot')
+
+    # Índices que b41e7d2a9c55 eliminó por referirse a estas columnas
+    op.create_index('ix_cattle_tag_number', 'cattle', ['tag_number'], unique=True)
+    op.create_index('ix_cattle_lot', 'cattle', ['lot'], unique=False)
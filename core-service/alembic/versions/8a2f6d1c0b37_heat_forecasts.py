@@ -0,0 +1,78 @@
+"""Precomputed per-animal heat forecasts
+
+Revision ID: 8a2f6d1c0b37
+Revises: 5e0c3a7b91d4
+Create Date: 2026-10-19 17:05:48.611902
+
+ml-service calculaba el pronóstico de celo desde cero en cada
+GET /forecasting/predict/{cattle_id}. heat_forecasts guarda el último
+pronóstico por vaca (fechas, valores RF/XGB, confianza y versión del modelo):
+
+- core-service marca la fila como `stale` en la misma transacción en la que
+  crea, actualiza o borra un celo (HeatEventRepository -> HeatForecastRepository).
+- ml-service recalcula en segundo plano las filas `stale` (ForecastRefresher) y
+  todas las vacas tras reentrenar; /predict se vuelve una lectura por PK.
+- Cada invalidación incrementa `revision`. ml-service calcula sin bloquear la
+  fila (reserva el lote con `claimed_at`) y guarda solo si la revisión no cambió,
+  de modo que core-service nunca espera a un cálculo en curso.
+- ix_heat_forecasts_owner_id_predicted_date sirve el calendario de un rancho
+  ("quién entra en celo esta semana"); toda consulta de calendario filtra por
+  dueño, así que no hay índice solo por predicted_date.
+
+La tabla se crea con todas las hembras con celos marcadas como `stale`, de
+modo que el primer ciclo del refresco la rellena.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a2f6d1c0b37'
+down_revision: Union[str, None] = '5e0c3a7b91d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'heat_forecasts',
+        sa.Column('cattle_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('last_heat_date', sa.Date(), nullable=True),
+        sa.Column('predicted_date', sa.Date(), nullable=True),
+        sa.Column('predicted_days_rf', sa.Float(), nullable=True),
+        sa.Column('predicted_days_xgb', sa.Float(), nullable=True),
+        sa.Column('predicted_days_avg', sa.Float(), nullable=True),
+        sa.Column('model_confidence', sa.String(length=10), nullable=True),
+        sa.Column('total_heat_records', sa.Integer(), nullable=True),
+        sa.Column('model_version', sa.String(length=32), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('stale', sa.Boolean(), server_default=sa.text('true'), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=True),
+        sa.Column('revision', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+        sa.Column('claimed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['cattle_id'], ['cattle.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('cattle_id'),
+    )
+    op.create_index('ix_heat_forecasts_owner_id_predicted_date', 'heat_forecasts', ['owner_id', 'predicted_date'], unique=False)
+    op.create_index(
+        'ix_heat_forecasts_stale', 'heat_forecasts', ['cattle_id'], unique=False,
+        postgresql_where=sa.text('stale IS true'),
+    )
+
+    op.execute("""
+        INSERT INTO heat_forecasts (cattle_id, owner_id, stale)
+        SELECT c.id, c.owner_id, true
+        FROM cattle c
+        WHERE c.gender = 'female'
+          AND EXISTS (SELECT 1 FROM heat_events he WHERE he.cattle_id = c.id)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_heat_forecasts_stale', table_name='heat_forecasts')
+    op.drop_index('ix_heat_forecasts_owner_id_predicted_date', table_name='heat_forecasts')
+    op.drop_table('heat_forecasts')
@@ -0,0 +1,117 @@
+"""Indexes matching repository query patterns
+
+Revision ID: b41e7d2a9c55
+Revises: 7c19e4b2d6a8
+Create Date: 2026-10-19 10:12:03.418220
+
+Cada índice sirve a una consulta de repositorio (core-service, bovara_data / chatbot,
+ml-service):
+
+- heat_events WHERE cattle_id = $1 ORDER BY heat_date
+  (core, chatbot, ml-service historial)               -> ix_heat_events_cattle_id_heat_date
+- heat_events WHERE was_inseminated AND pregnancy_confirmed IS NULL
+  AND insemination_date <= $1 (chatbot)               -> ix_heat_events_pending_pregnancy (parcial)
+- heat_events WHERE pregnancy_confirmed ORDER BY insemination_date DESC
+  (chatbot)                                           -> ix_heat_events_confirmed_pregnancy (parcial)
+- health_events WHERE cattle_id = $1 [AND event_type = $2] ORDER BY application_date
+  (core, chatbot)                                     -> ix_health_events_cattle_id_event_type
+- health_events WHERE next_dose_date BETWEEN $1 AND $2 (próximas dosis)
+                                                      -> ix_health_events_next_dose_date (parcial)
+- reminders WHERE status = $1 AND reminder_date <op> $2 ORDER BY reminder_date
+                                                      -> ix_reminders_status_reminder_date
+- reminders WHERE cattle_id = $1 ORDER BY reminder_date -> ix_reminders_cattle_id_reminder_date
+- reminders WHERE user_id = $1 ORDER BY reminder_date   -> ix_reminders_user_id_reminder_date
+
+Mediciones (Postgres 16, hato de 100k de benchmarks/seed.py: 400k health_events,
+676k heat_events, 100k reminders; mediana de 15 ejecuciones con y sin el índice):
+
+    ix_heat_events_cattle_id_heat_date      0.5 ms   vs  52 ms (parallel seq scan)
+    ix_heat_events_pending_pregnancy        0.1 ms   vs  71 ms (parallel seq scan)
+    ix_heat_events_confirmed_pregnancy      0.6 ms   vs  80 ms (parallel seq scan)
+    ix_health_events_next_dose_date         0.5 ms   vs  49 ms (parallel seq scan)
+    ix_health_events_cattle_id_event_type   0.3 ms   vs  34 ms (parallel seq scan)
+    ix_reminders_cattle_id_reminder_date    0.2 ms   vs 4.8 ms (seq scan)
+    ix_reminders_user_id_reminder_date      0.1 ms   vs 4.6 ms (seq scan, otro usuario)
+    ix_reminders_status_reminder_date       0.9 ms   vs 1.3 ms (ix_reminders_reminder_date
+                                                              + filtro, estado 'cancelled')
+
+No se crean:
+
+- ix_health_events_cattle_id_application_date: con el índice anterior (mismo prefijo
+  cattle_id) el planner no lo elegía nunca y quitarlo no cambia la latencia
+  (0.28 ms vs 0.29 ms); solo añadía coste de escritura.
+- cattle.gender: con dos valores (~50% de filas cada uno) el planner prefiere el seq
+  scan y el índice solo añadiría coste de escritura.
+
+La columna cattle.lot pasa a `lote` en 7c19e4b2d6a8; aquí se sustituye su índice por
+ix_cattle_lote (único) y se eliminan los de una sola columna que quedan cubiertos por
+el prefijo de un índice compuesto.
+
+Los planes se verifican con tests/test_query_plans.py (EXPLAIN de cada consulta de
+repositorio con la configuración por defecto del planner).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41e7d2a9c55'
+down_revision: Union[str, None] = '7c19e4b2d6a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Índices obsoletos (columnas que ya no existen en el modelo)
+    op.drop_index('ix_cattle_lot', table_name='cattle', if_exists=True)
+    op.drop_index('ix_cattle_tag_number', table_name='cattle', if_exists=True)
+
+    # Cubiertos por el prefijo de los índices compuestos
+    op.drop_index('ix_health_events_cattle_id', table_name='health_events', if_exists=True)
+    op.drop_index('ix_reminders_cattle_id', table_name='reminders', if_exists=True)
+    op.drop_index('ix_reminders_status', table_name='reminders', if_exists=True)
+    op.drop_index('ix_reminders_user_id', table_name='reminders', if_exists=True)
+
+    op.create_index('ix_cattle_lote', 'cattle', ['lote'], unique=True, if_not_exists=True)
+
+    op.create_index('ix_heat_events_cattle_id_heat_date', 'heat_events', ['cattle_id', 'heat_date'], unique=False, if_not_exists=True)
+    op.create_index(
+        'ix_heat_events_pending_pregnancy', 'heat_events', ['insemination_date'], unique=False,
+        postgresql_where=sa.text('was_inseminated IS true AND pregnancy_confirmed IS NULL'),
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_heat_events_confirmed_pregnancy', 'heat_events', ['insemination_date'], unique=False,
+        postgresql_where=sa.text('pregnancy_confirmed IS true'),
+        if_not_exists=True,
+    )
+
+    op.create_index('ix_health_events_cattle_id_event_type', 'health_events', ['cattle_id', 'event_type', 'application_date'], unique=False, if_not_exists=True)
+    op.create_index(
+        'ix_health_events_next_dose_date', 'health_events', ['next_dose_date'], unique=False,
+        postgresql_where=sa.text('next_dose_date IS NOT NULL'),
+        if_not_exists=True,
+    )
+
+    op.create_index('ix_reminders_status_reminder_date', 'reminders', ['status', 'reminder_date'], unique=False, if_not_exists=True)
+    op.create_index('ix_reminders_cattle_id_reminder_date', 'reminders', ['cattle_id', 'reminder_date'], unique=False, if_not_exists=True)
+    op.create_index('ix_reminders_user_id_reminder_date', 'reminders', ['user_id', 'reminder_date'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reminders_user_id_reminder_date', table_name='reminders', if_exists=True)
+    op.drop_index('ix_reminders_cattle_id_reminder_date', table_name='reminders', if_exists=True)
+    op.drop_index('ix_reminders_status_reminder_date', table_name='reminders', if_exists=True)
+    op.drop_index('ix_health_events_next_dose_date', table_name='health_events', if_exists=True)
+    op.drop_index('ix_health_events_cattle_id_event_type', table_name='health_events', if_exists=True)
+    op.drop_index('ix_heat_events_confirmed_pregnancy', table_name='heat_events', if_exists=True)
+    op.drop_index('ix_heat_events_pending_pregnancy', table_name='heat_events', if_exists=True)
+    op.drop_index('ix_heat_events_cattle_id_heat_date', table_name='heat_events', if_exists=True)
+    op.drop_index('ix_cattle_lote', table_name='cattle', if_exists=True)
+
+    op.create_index('ix_reminders_user_id', 'reminders', ['user_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_reminders_status', 'reminders', ['status'], unique=False, if_not_exists=True)
+    op.create_index('ix_reminders_cattle_id', 'reminders', ['cattle_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_health_events_cattle_id', 'health_events', ['cattle_id'], unique=False, if_not_exists=True)
@@ -1,15 +1,29 @@
-import random
-import uuid
-from datetime import datetime, timedelta, date
-from faker import Faker
-import pandas as pd
+# generate_synthetic_data.py
+"""
+Generador de datos sintéticos (ganado, eventos de salud, celos y recordatorios).
+
+El muestreo es vectorizado con NumPy y determinista a partir de una semilla:
+cada bloque de `chunk_size` animales usa su propio generador derivado de
+(seed, índice de bloque), así que la misma configuración produce siempre los
+mismos datos, IDs incluidos. Los bloques se escriben en CSV o Parquet a medida
+que se generan; la memoria depende del tamaño de bloque, no del hato.
 
-fake = Faker(['es_MX'])
+Uso:
+    python generate_synthetic_data.py                          # 90 animales → synthetic_*.csv
+    python generate_synthetic_data.py --cattle 1000000 --format parquet --output-dir data/1m
+    python generate_synthetic_data.py --cattle 50000 --seed 7 --end-date 2025-12-14 --cycle-min 18 --cycle-max 24
+"""
+import argparse
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
-# Configuración
-NUM_CATTLE = 90
-NUM_HEALTH_EVENTS = 400
-USER_ID = str(uuid.uuid4())
 
 # Razas comunes en México
 BREEDS = [
@@ -25,6 +39,7 @@ CATTLE_NAMES = [
 ]
 
 EVENT_TYPES = ['vaccine', 'treatment', 'checkup', 'surgery', 'injury', 'illness', 'other']
+EVENT_TYPE_WEIGHTS = [40, 30, 20, 3, 3, 3, 1]
 ADMIN_ROUTES = ['oral', 'intramuscular', 'subcutaneous', 'intravenous', 'topical', 'other']
 
 # Enfermedades y medicinas comunes
@@ -43,149 +58,342 @@ VETERINARIANS = [
     'Dra. Hernández Ruiz', 'Dr. López González', None
 ]
 
+NOTES = [
+    'Animal tranquilo durante la aplicación',
+    'Revisar evolución en la próxima visita',
+    'Se observó leve inflamación en la zona',
+    'Buena respuesta al tratamiento',
+    'Requiere seguimiento del veterinario',
+]
 
-def generate_cattle_data():
-    """Generar datos sintéticos de ganado"""
-    cattle_data = []
-    
-    for i in range(NUM_CATTLE):
-        gender = random.choice(['male', 'female'])
-        birth_date = fake.date_between(start_date='-8y', end_date='-6m')
-        
-        # Solo hembras tienen fecha_ultimo_parto
-        fecha_ultimo_parto = None
-        if gender == 'female' and random.random() > 0.3:
-            # 70% de hembras tienen historial de parto
-            min_parto_date = birth_date + timedelta(days=730)  # Mínimo 2 años después de nacer
-            max_parto_date = date.today() - timedelta(days=60)  # Hace mínimo 60 días
-            
-            # Solo asignar si la vaca es lo suficientemente vieja
-            if min_parto_date <= max_parto_date:
-                fecha_ultimo_parto = fake.date_between(
-                    start_date=min_parto_date,
-                    end_date=max_parto_date
-                )
-        
-        cattle = {
-            'id': str(uuid.uuid4()),
-            'owner_id': USER_ID,
-            'name': random.choice(CATTLE_NAMES) + f' {i+1}',
-            'lote': f'L{1000 + i}',
-            'breed': random.choice(BREEDS),
-            'gender': gender,
-            'birth_date': birth_date,
-            'weight': round(random.uniform(250, 650), 2) if random.random() > 0.1 else None,
-            'fecha_ultimo_parto': fecha_ultimo_parto,
-            'created_at': datetime.utcnow(),
-            'updated_at': datetime.utcnow()
-        }
-        
-        cattle_data.append(cattle)
-    
-    return cattle_data
-
-
-def generate_health_events(cattle_data):
-    """Generar eventos de salud distribuidos"""
-    health_events = []
-    
-    # Distribución: 30% sanos, 50% normales, 20% alta atención
-    num_healthy = int(NUM_CATTLE * 0.30)
-    num_normal = int(NUM_CATTLE * 0.50)
-    num_high_care = NUM_CATTLE - num_healthy - num_normal
-    
-    cattle_distribution = (
-        [(c, random.randint(0, 1)) for c in cattle_data[:num_healthy]] +
-        [(c, random.randint(2, 5)) for c in cattle_data[num_healthy:num_healthy + num_normal]] +
-        [(c, random.randint(6, 15)) for c in cattle_data[num_healthy + num_normal:]]
+# Síntomas de celo
+VAGINAL_DISCHARGE = ['seco', 'turbio', 'cristalino']
+VULVA_SWELLING = ['normal', 'leve', 'alta']
+COMPORTAMIENTO = ['mugido', 'nerviosismo', 'monta_a_otras', 'inquietud', 'olfatea', 'lame_genitales']
+
+REMINDER_TITLES = {
+    'vaccine': 'Aplicar vacuna',
+    'checkup': 'Revisión veterinaria',
+    'treatment': 'Continuar tratamiento',
+    'feeding': 'Ajustar alimentación',
+    'breeding': 'Revisar celo / inseminación',
+    'other': 'Pendiente general',
+}
+REMINDER_TYPES = list(REMINDER_TITLES)
+
+TABLES = ['cattle', 'health_events', 'heat_events', 'reminders']
+DATE_COLUMNS = {
+    'birth_date', 'fecha_ultimo_parto', 'application_date', 'next_dose_date',
+    'treatment_end_date', 'heat_date', 'insemination_date', 'reminder_date',
+}
+
+
+@dataclass
+class GeneratorConfig:
+    """Cardinalidades y distribuciones del hato sintético"""
+
+    n_cattle: int = 90
+    seed: int = 42
+    chunk_size: int = 100_000
+    end_date: date = field(default_factory=date.today)
+    female_ratio: float = 0.5
+    # (fracción de animales, mínimo, máximo de eventos de salud): sanos, normales, alta atención
+    health_tiers: List[Tuple[float, int, int]] = field(
+        default_factory=lambda: [(0.30, 0, 1), (0.50, 2, 5), (0.20, 6, 15)]
+    )
+    # Ciclo estral: base uniforme en [cycle_min, cycle_max] por vaca, ± cycle_jitter por ciclo
+    cycle_min: int = 19
+    cycle_max: int = 23
+    cycle_jitter: int = 2
+    heat_history_days: Tuple[int, int] = (180, 365)
+    insemination_rate: float = 0.3
+    pregnancy_rate: float = 0.7
+    reminders_per_animal: float = 1.0
+    owner_id: Optional[str] = None
+
+    def __post_init__(self):
+        if self.cycle_min - self.cycle_jitter < 1 or self.cycle_max < self.cycle_min:
+            raise ValueError("Distribución de ciclo inválida: requiere 1 <= cycle_min - cycle_jitter y cycle_min <= cycle_max")
+        if abs(sum(tier[0] for tier in self.health_tiers) - 1) > 1e-6:
+            raise ValueError("Las fracciones de health_tiers deben sumar 1")
+
+
+def _uuid4(rng: np.random.Generator, n: int) -> np.ndarray:
+    """UUID v4 deterministas a partir del generador"""
+    raw = rng.integers(0, 256, size=(n, 16), dtype=np.uint8)
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    h = raw.tobytes().hex()
+    return np.array(
+        [f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+         for i in range(0, 32 * n, 32)],
+        dtype=object,
     )
-    
-    for cattle, num_events in cattle_distribution:
-        for _ in range(num_events):
-            # Tipo de evento con distribución realista
-            event_type = random.choices(
-                EVENT_TYPES,
-                weights=[40, 30, 20, 3, 3, 3, 1],
-                k=1
-            )[0]
-            
-            # Fecha del evento
-            application_date = fake.date_between(
-                start_date=cattle['birth_date'] + timedelta(days=30),
-                end_date='today'
-            )
-            
-            # Campos opcionales según tipo
-            disease_name = random.choice(DISEASES) if event_type in ['illness', 'treatment'] else None
-            medicine_name = random.choice(MEDICINES) if event_type in ['vaccine', 'treatment'] else None
-            administration_route = random.choice(ADMIN_ROUTES) if medicine_name else None
-            
-            # Próxima dosis solo para vacunas
-            next_dose_date = None
-            if event_type == 'vaccine' and random.random() > 0.4:
-                next_dose_date = application_date + timedelta(days=random.randint(30, 180))
-            
-            # Fecha fin de tratamiento
-            treatment_end_date = None
-            if event_type == 'treatment' and random.random() > 0.5:
-                treatment_end_date = application_date + timedelta(days=random.randint(7, 30))
-            
-            event = {
-                'id': str(uuid.uuid4()),
-                'cattle_id': cattle['id'],
-                'event_type': event_type,
-                'disease_name': disease_name,
-                'medicine_name': medicine_name,
-                'application_date': application_date,
-                'administration_route': administration_route,
-                'next_dose_date': next_dose_date,
-                'treatment_end_date': treatment_end_date,
-                'dosage': f'{random.randint(1, 10)} ml' if medicine_name else None,
-                'veterinarian_name': random.choice(VETERINARIANS),
-                'notes': fake.sentence() if random.random() > 0.7 else None,
-                'created_at': datetime.utcnow(),
-                'updated_at': datetime.utcnow()
-            }
-            
-            health_events.append(event)
-    
-    return health_events
-
-
-def save_to_csv():
-    """Generar y guardar datasets"""
-    print("Generando datos de ganado...")
-    cattle_data = generate_cattle_data()
-    
-    print("Generando eventos de salud...")
-    health_events = generate_health_events(cattle_data)
-    
-    # Convertir a DataFrames
-    df_cattle = pd.DataFrame(cattle_data)
-    df_health = pd.DataFrame(health_events)
-    
-    # Guardar CSVs
-    df_cattle.to_csv('synthetic_cattle.csv', index=False)
-    df_health.to_csv('synthetic_health_events.csv', index=False)
-    
-    print(f"\n✅ Dataset generado:")
-    print(f"   - {len(cattle_data)} registros de ganado")
-    print(f"   - {len(health_events)} eventos de salud")
-    print(f"   - USER_ID: {USER_ID}")
-    print(f"\nArchivos creados:")
-    print(f"   - synthetic_cattle.csv")
-    print(f"   - synthetic_health_events.csv")
-    
-    # Estadísticas
-    print(f"\nDistribución de eventos por animal:")
-    events_per_cattle = df_health.groupby('cattle_id').size()
-    print(f"   - Promedio: {events_per_cattle.mean():.2f}")
-    print(f"   - Mínimo: {events_per_cattle.min()}")
-    print(f"   - Máximo: {events_per_cattle.max()}")
-    
-    print(f"\nDistribución por tipo de evento:")
-    print(df_health['event_type'].value_counts())
+
+
+def _choice(rng: np.random.Generator, values: list, n: int, p=None) -> np.ndarray:
+    return np.array(values, dtype=object)[rng.choice(len(values), size=n, p=p)]
+
+
+def _days(values) -> np.ndarray:
+    return np.asarray(values).astype("timedelta64[D]")
+
+
+def _between(rng: np.random.Generator, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """Fecha uniforme en [low, high] por fila"""
+    span = (high - low).astype(np.int64) + 1
+    return low + _days((rng.random(len(low)) * span).astype(np.int64))
+
+
+def _nullable(mask: np.ndarray, values: np.ndarray) -> np.ndarray:
+    if values.dtype.kind == "M":
+        return np.where(mask, values, np.datetime64("NaT"))
+    return np.where(mask, values, None)
+
+
+def _cattle(cfg: GeneratorConfig, rng: np.random.Generator, offset: int, n: int, end, stamp) -> pd.DataFrame:
+    index = offset + np.arange(n)
+    gender = np.where(rng.random(n) < cfg.female_ratio, 'female', 'male').astype(object)
+    birth_date = end - _days(rng.integers(182, 8 * 365 + 1, n))
+
+    # 70% de las hembras con edad suficiente tienen historial de parto
+    first_calving = birth_date + _days(730)
+    last_possible = end - _days(60)
+    has_calving = (gender == 'female') & (rng.random(n) > 0.3) & (first_calving <= last_possible)
+    calving = _between(rng, first_calving, np.maximum(first_calving, last_possible))
+
+    weight = np.round(rng.uniform(250, 650, n), 2)
+    weight[rng.random(n) <= 0.1] = np.nan
+
+    return pd.DataFrame({
+        'id': _uuid4(rng, n),
+        'owner_id': cfg.owner_id,
+        'name': _choice(rng, CATTLE_NAMES, n) + ' ' + (index + 1).astype(str).astype(object),
+        'lote': 'L' + (1000 + index).astype(str).astype(object),
+        'breed': _choice(rng, BREEDS, n),
+        'gender': gender,
+        'birth_date': birth_date,
+        'weight': weight,
+        'fecha_ultimo_parto': _nullable(has_calving, calving),
+        'created_at': stamp,
+        'updated_at': stamp,
+    })
+
+
+def _health_events(cfg: GeneratorConfig, rng: np.random.Generator, cattle: pd.DataFrame, end, stamp) -> pd.DataFrame:
+    n_cattle = len(cattle)
+    tiers = rng.choice(len(cfg.health_tiers), size=n_cattle, p=[t[0] for t in cfg.health_tiers])
+    low = np.array([t[1] for t in cfg.health_tiers])[tiers]
+    high = np.array([t[2] for t in cfg.health_tiers])[tiers]
+    counts = rng.integers(low, high + 1)
+
+    owner = np.repeat(np.arange(n_cattle), counts)
+    n = len(owner)
+    weights = np.array(EVENT_TYPE_WEIGHTS) / sum(EVENT_TYPE_WEIGHTS)
+    event_type = _choice(rng, EVENT_TYPES, n, p=weights)
+
+    birth = cattle['birth_date'].to_numpy().astype("datetime64[D]")[owner]
+    application_date = _between(rng, birth + _days(30), np.full(n, end))
+
+    is_vaccine = event_type == 'vaccine'
+    is_treatment = event_type == 'treatment'
+    disease = _nullable(is_treatment | (event_type == 'illness'), _choice(rng, DISEASES, n))
+    medicine = _nullable(is_vaccine | is_treatment, _choice(rng, MEDICINES, n))
+    has_medicine = medicine != None  # noqa: E711 (comparación elemento a elemento)
+
+    next_dose = application_date + _days(rng.integers(30, 181, n))
+    treatment_end = application_date + _days(rng.integers(7, 31, n))
+
+    return pd.DataFrame({
+        'id': _uuid4(rng, n),
+        'cattle_id': cattle['id'].to_numpy()[owner],
+        'event_type': event_type,
+        'disease_name': disease,
+        'medicine_name': medicine,
+        'application_date': application_date,
+        'administration_route': _nullable(has_medicine, _choice(rng, ADMIN_ROUTES, n)),
+        'next_dose_date': _nullable(is_vaccine & (rng.random(n) > 0.4), next_dose),
+        'treatment_end_date': _nullable(is_treatment & (rng.random(n) > 0.5), treatment_end),
+        'dosage': _nullable(has_medicine, rng.integers(1, 11, n).astype(str).astype(object) + ' ml'),
+        'veterinarian_name': _choice(rng, VETERINARIANS, n),
+        'notes': _nullable(rng.random(n) > 0.7, _choice(rng, NOTES, n)),
+        'created_at': stamp,
+        'updated_at': stamp,
+    })
+
+
+def _heat_events(cfg: GeneratorConfig, rng: np.random.Generator, cattle: pd.DataFrame, end, stamp) -> pd.DataFrame:
+    female_ids = cattle['id'].to_numpy()[cattle['gender'].to_numpy() == 'female']
+    n_females = len(female_ids)
+
+    history = rng.integers(cfg.heat_history_days[0], cfg.heat_history_days[1] + 1, n_females)
+    base_cycle = rng.integers(cfg.cycle_min, cfg.cycle_max + 1, n_females)
+    max_events = math.ceil(cfg.heat_history_days[1] / (cfg.cycle_min - cfg.cycle_jitter)) + 1
+
+    # Desfase de cada celo respecto al primero: suma acumulada de ciclos con variación
+    jitter = rng.integers(-cfg.cycle_jitter, cfg.cycle_jitter + 1, (n_females, max_events - 1))
+    offsets = np.zeros((n_females, max_events), dtype=np.int64)
+    offsets[:, 1:] = np.cumsum(base_cycle[:, None] + jitter, axis=1)
+    valid = offsets <= history[:, None]
+
+    owner = np.nonzero(valid)[0]
+    n = len(owner)
+    heat_date = (end - _days(history))[owner] + _days(offsets[valid])
+
+    inseminated = rng.random(n) < cfg.insemination_rate
+    pregnancy = pd.array(rng.random(n) < cfg.pregnancy_rate, dtype="boolean")
+    pregnancy[~inseminated] = pd.NA
+
+    return pd.DataFrame({
+        'id': _uuid4(rng, n),
+        'cattle_id': female_ids[owner],
+        'heat_date': heat_date,
+        'allows_mounting': rng.random(n) < 0.5,
+        'vaginal_discharge': _choice(rng, VAGINAL_DISCHARGE, n),
+        'vulva_swelling': _choice(rng, VULVA_SWELLING, n),
+        'comportamiento': _choice(rng, COMPORTAMIENTO, n),
+        'was_inseminated': inseminated,
+        'insemination_date': _nullable(inseminated, heat_date),
+        'pregnancy_confirmed': pregnancy,
+        'created_at': stamp,
+        'updated_at': stamp,
+    })
+
+
+def _reminders(cfg: GeneratorConfig, rng: np.random.Generator, cattle: pd.DataFrame, end, stamp) -> pd.DataFrame:
+    owner = np.repeat(np.arange(len(cattle)), rng.poisson(cfg.reminders_per_animal, len(cattle)))
+    n = len(owner)
+    reminder_type = _choice(rng, REMINDER_TYPES, n)
+    reminder_date = end + _days(rng.integers(-60, 91, n))
+
+    # Vencidos: mayormente completados; futuros: pendientes
+    past_status = _choice(rng, ['completed', 'cancelled', 'pending'], n, p=[0.8, 0.1, 0.1])
+    status = np.where(reminder_date < end, past_status, 'pending').astype(object)
+
+    return pd.DataFrame({
+        'id': _uuid4(rng, n),
+        'user_id': cfg.owner_id,
+        'cattle_id': cattle['id'].to_numpy()[owner],
+        'title': np.array([REMINDER_TITLES[t] for t in reminder_type], dtype=object),
+        'description': None,
+        'reminder_date': reminder_date,
+        'reminder_type': reminder_type,
+        'status': status,
+        'created_at': stamp,
+        'updated_at': stamp,
+    })
+
+
+def iter_chunks(cfg: GeneratorConfig) -> Iterator[Dict[str, pd.DataFrame]]:
+    """Genera el hato por bloques: {tabla: DataFrame} por cada `chunk_size` animales"""
+    if cfg.owner_id is None:
+        cfg.owner_id = str(_uuid4(np.random.default_rng([cfg.seed]), 1)[0])
+    end = np.datetime64(cfg.end_date, "D")
+    stamp = pd.Timestamp(cfg.end_date)
+
+    for chunk_index, offset in enumerate(range(0, cfg.n_cattle, cfg.chunk_size)):
+        rng = np.random.default_rng([cfg.seed, chunk_index])
+        n = min(cfg.chunk_size, cfg.n_cattle - offset)
+        cattle = _cattle(cfg, rng, offset, n, end, stamp)
+        yield {
+            'cattle': cattle,
+            'health_events': _health_events(cfg, rng, cattle, end, stamp),
+            'heat_events': _heat_events(cfg, rng, cattle, end, stamp),
+            'reminders': _reminders(cfg, rng, cattle, end, stamp),
+        }
+
+
+class _ChunkWriter:
+    """Escribe bloques sucesivos de una tabla en un único CSV o Parquet"""
+
+    def __init__(self, path: Path, fmt: str):
+        self.path = path
+        self.fmt = fmt
+        self.rows = 0
+        self._parquet = None
+        self._schema = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.fmt == 'csv':
+            df.to_csv(self.path, mode='w' if self.rows == 0 else 'a', header=self.rows == 0, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet is None:
+                # Esquema fijo para todo el fichero: fechas como date32 y columnas
+                # vacías en el primer bloque (tipo null) como string
+                self._schema = pa.schema([
+                    pa.field(f.name, pa.date32()) if f.name in DATE_COLUMNS
+                    else pa.field(f.name, pa.string()) if pa.types.is_null(f.type)
+                    else f
+                    for f in table.schema
+                ])
+                self._parquet = pq.ParquetWriter(self.path, self._schema)
+            self._parquet.write_table(table.cast(self._schema))
+        self.rows += len(df)
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+def write_dataset(cfg: GeneratorConfig, output_dir: Path, fmt: str = 'csv', tables: List[str] = TABLES) -> Dict[str, int]:
+    """Genera y escribe el dataset bloque a bloque. Returns filas escritas por tabla"""
+    if fmt == 'parquet':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError("--format parquet requiere el paquete 'pyarrow'") from e
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    writers = {t: _ChunkWriter(output_dir / f"synthetic_{t}.{fmt}", fmt) for t in tables}
+    try:
+        for chunk in iter_chunks(cfg):
+            for table, writer in writers.items():
+                writer.write(chunk[table])
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return {table: writer.rows for table, writer in writers.items()}
 
 
 if __name__ == "__main__":
-    save_to_csv()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generar datos sintéticos de ganado")
+    parser.add_argument("--cattle", type=int, default=90, help="Número de animales")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--output-dir", default=".")
+    parser.add_argument("--tables", default=",".join(TABLES), help="Tablas a escribir, separadas por comas")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date.today(),
+                        help="Fecha de referencia (fijarla para reproducir exactamente el dataset)")
+    parser.add_argument("--owner-id", help="owner_id / user_id de los registros (defecto: derivado de la semilla)")
+    parser.add_argument("--female-ratio", type=float, default=0.5)
+    parser.add_argument("--cycle-min", type=int, default=19)
+    parser.add_argument("--cycle-max", type=int, default=23)
+    parser.add_argument("--cycle-jitter", type=int, default=2)
+    parser.add_argument("--reminders-per-animal", type=float, default=1.0)
+    args = parser.parse_args()
+
+    config = GeneratorConfig(
+        n_cattle=args.cattle,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        end_date=args.end_date,
+        female_ratio=args.female_ratio,
+        cycle_min=args.cycle_min,
+        cycle_max=args.cycle_max,
+        cycle_jitter=args.cycle_jitter,
+        reminders_per_animal=args.reminders_per_animal,
+        owner_id=args.owner_id,
+    )
+
+    start = time.perf_counter()
+    rows = write_dataset(config, Path(args.output_dir), args.format, args.tables.split(","))
+
+    print(f"\n✅ Dataset generado en {time.perf_counter() - start:.1f}s (seed={config.seed}, end_date={config.end_date}):")
+    for table, count in rows.items():
+        print(f"   - {count} registros en {Path(args.output_dir) / f'synthetic_{table}.{args.format}'}")
+    print(f"   - USER_ID: {config.owner_id}")
@@ -6,9 +6,9 @@ import pandas as pd
 from datetime import datetime
 from uuid import UUID
 
+from bovara_data import Cattle, HealthEvent
 from src.infrastructure.database import SessionLocal
-from src.infrastructure.models.cattle import Cattle
-from src.infrastructure.models.health_event import HealthEvent
+from src.infrastructure.repositories.health_stats_repository import HealthStatsRepository
 
 
 def load_cattle_data(csv_path: str):
@@ -77,6 +77,9 @@ def load_health_events_data(csv_path: str):
             db.add(event)
             count += 1
         
+        # La carga no pasa por el servicio: recalcular los contadores de salud
+        db.flush()
+        HealthStatsRepository(db).rebuild()
         db.commit()
         print(f"✅ {count} eventos de salud insertados")
         
@@ -6,7 +6,7 @@ from datetime import date
 
 from src.infrastructure.repositories.health_event_repository import HealthEventRepository
 from src.infrastructure.repositories.cattle_repository import CattleRepository
-from src.infrastructure.models.health_event import HealthEvent
+from bovara_data import HealthEvent
 
 
 class HealthEventService:
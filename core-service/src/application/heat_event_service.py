@@ -2,7 +2,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from src.schemas.heat_event import HeatEventCreate, HeatEventUpdate
-from src.infrastructure.models.heat_event import HeatEventModel
+from bovara_data import HeatEvent
 from src.infrastructure.repositories.heat_event_repository import HeatEventRepository
 
 
@@ -10,18 +10,18 @@ class HeatEventService:
     def __init__(self, repository: HeatEventRepository):
         self.repository = repository
     
-    def create_heat_event(self, heat_event_data: HeatEventCreate) -> HeatEventModel:
+    def create_heat_event(self, heat_event_data: HeatEventCreate) -> HeatEvent:
         # ✅ Cambio: usar dict() en lugar de model_dump()
-        heat_event = HeatEventModel(**heat_event_data.dict())
+        heat_event = HeatEvent(**heat_event_data.dict())
         return self.repository.create(heat_event)
     
-    def get_heat_event(self, heat_event_id: UUID) -> Optional[HeatEventModel]:
+    def get_heat_event(self, heat_event_id: UUID) -> Optional[HeatEvent]:
         return self.repository.get_by_id(heat_event_id)
     
-    def get_heat_events_by_cattle(self, cattle_id: UUID) -> List[HeatEventModel]:
+    def get_heat_events_by_cattle(self, cattle_id: UUID) -> List[HeatEvent]:
         return self.repository.get_by_cattle_id(cattle_id)
     
-    def update_heat_event(self, heat_event_id: UUID, update_data: HeatEventUpdate) -> Optional[HeatEventModel]:
+    def update_heat_event(self, heat_event_id: UUID, update_data: HeatEventUpdate) -> Optional[HeatEvent]:
         heat_event = self.repository.get_by_id(heat_event_id)
         if not heat_event:
             return None
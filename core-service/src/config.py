@@ -6,6 +6,7 @@ class Settings(BaseSettings):
     auth_service_url: str = "http://localhost:8000"
     jwt_secret_key: str = "tu-clave-secreta-super-segura-cambiar-en-produccion-123456"
     jwt_algorithm: str = "HS256"
+    revocation_sync_interval: float = 5.0  # segundos entre sondeos de logouts en auth-service (0 = desactivado)
     
     class Config:
         env_file = ".env"
@@ -13,4 +14,3 @@ class Settings(BaseSettings):
 
 
 settings = Settings()
-print(f"🔑 JWT Secret Key cargada: {settings.jwt_secret_key}")
@@ -1,9 +1,12 @@
 # core-service/src/infrastructure/auth/dependencies.py
+import logging
 from fastapi import Depends, HTTPException, status
 from uuid import UUID
 
 from .auth_bearer import verify_token
 
+logger = logging.getLogger(__name__)
+
 class UserAuth:
     """Modelo simplificado de usuario para autenticación"""
     def __init__(self, id: UUID, email: str = ""):
@@ -24,10 +27,7 @@ def get_current_user(token_data: dict = Depends(verify_token)) -> UserAuth:
             )
         
         user_id = UUID(user_id_str)
-        user = UserAuth(id=user_id)
-        
-        print(f"✅ Usuario autenticado: {user_id}")
-        return user
+        return UserAuth(id=user_id)
     
     except ValueError:
         raise HTTPException(
@@ -37,7 +37,7 @@ def get_current_user(token_data: dict = Depends(verify_token)) -> UserAuth:
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error: {e}")
+        logger.warning("Error al procesar autenticación: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Error al procesar autenticación"
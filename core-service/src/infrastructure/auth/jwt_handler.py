@@ -1,12 +1,17 @@
 # core-service/src/infrastructure/auth/jwt_handler.py
+import logging
 import time
 from typing import Optional
 from jose import JWTError, jwt
 
+from .revocations import revocation_list
+
 # ⚠️ IMPORTANTE: Debe ser la MISMA clave que en Auth Service
 SECRET_KEY = "tu-clave-secreta-super-segura-cambiar-en-produccion-123456"
 ALGORITHM = "HS256"
 
+logger = logging.getLogger(__name__)
+
 def decode_token(token: str) -> Optional[dict]:
     """
     Decodifica y valida un token JWT
@@ -19,19 +24,25 @@ def decode_token(token: str) -> Optional[dict]:
         # Verificar expiración
         exp = payload.get("exp")
         if exp is None:
-            print("❌ Token sin fecha de expiración")
+            logger.info("Token sin fecha de expiración")
             return None
             
         if time.time() > exp:
-            print("❌ Token expirado")
+            logger.info("Token expirado")
+            return None
+        
+        # Revocado con /auth/logout en auth-service
+        jti = payload.get("jti")
+        if jti and revocation_list.is_revoked(jti):
+            logger.info("Token revocado")
             return None
         
         # Token válido
         return payload
         
     except JWTError as e:
-        print(f"❌ JWT Error: {e}")
+        logger.info("JWT inválido: %s", e)
         return None
     except Exception as e:
-        print(f"❌ Error decodificando token: {e}")
+        logger.warning("Error decodificando token: %s", e)
         return None
@@ -0,0 +1,82 @@
+# core-service/src/infrastructure/auth/revocations.py
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+import httpx
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """
+    Access tokens revocados en auth-service (logout), sincronizados por sondeo
+
+    core-service valida los JWT localmente; sin esta lista un token cerrado
+    con /auth/logout seguiría valiendo aquí hasta su expiración. Se consulta
+    GET /internal/revocations de auth-service cada `interval` segundos y se
+    guardan los jti hasta su `exp`.
+    """
+
+    def __init__(self, base_url: str, interval: float):
+        self._url = f"{base_url.rstrip('/')}/internal/revocations"
+        self._interval = interval
+        self._revoked: Dict[str, float] = {}
+        self._epoch: Optional[str] = None
+        self._cursor = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def is_revoked(self, jti: str) -> bool:
+        exp = self._revoked.get(jti)
+        return exp is not None and exp > time.time()
+
+    async def sync(self, client: httpx.AsyncClient) -> int:
+        """Trae las revocaciones nuevas; devuelve cuántas se añadieron"""
+        response = await client.get(self._url, params={"after": self._cursor})
+        response.raise_for_status()
+        data = response.json()
+
+        if data["epoch"] != self._epoch:
+            # auth-service se reinició: su cursor empezó de nuevo
+            self._epoch = data["epoch"]
+            if self._cursor:
+                self._cursor = 0
+                return await self.sync(client)
+
+        # Se sustituye el dict entero: los hilos que validan tokens nunca lo ven a medias
+        now = time.time()
+        revoked = {jti: exp for jti, exp in self._revoked.items() if exp > now}
+        revoked.update((item["jti"], item["exp"]) for item in data["revoked"])
+        self._revoked = revoked
+        self._cursor = data["cursor"]
+        return len(data["revoked"])
+
+    async def _loop(self) -> None:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            while True:
+                try:
+                    await self.sync(client)
+                except Exception as e:
+                    logger.warning("No se pudo sincronizar revocaciones con auth-service: %s", e)
+                await asyncio.sleep(self._interval)
+
+    async def start(self) -> None:
+        """Lanza el sondeo en segundo plano"""
+        if self._task is None and self._interval > 0:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Detiene el sondeo"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+revocation_list = RevocationList(settings.auth_service_url, settings.revocation_sync_interval)
@@ -1,8 +1,11 @@
 # src/infrastructure/database.py
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+# Base compartido con bovara_data (cattle, health_events, heat_events, reminders): las
+# tablas propias de core (cattle_health_stats, heat_forecasts) se declaran sobre él
+from bovara_data import Base
+
 # Import absoluto desde la raíz del proyecto
 import sys
 from pathlib import Path
@@ -17,7 +20,6 @@ engine = create_engine(
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
 
 def get_db():
     db = SessionLocal()
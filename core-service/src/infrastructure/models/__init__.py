@@ -1,8 +1,19 @@
 # src/infrastructure/models/__init__.py
-from src.infrastructure.models.cattle import Cattle, GenderEnum
-from src.infrastructure.models.health_event import HealthEvent, EventTypeEnum, AdministrationRouteEnum
-from src.infrastructure.models.reminder import Reminder, ReminderTypeEnum, ReminderStatusEnum
-from src.infrastructure.models.heat_event import HeatEventModel 
+# cattle, health_events, heat_events y reminders se mapean una sola vez, en bovara_data;
+# aquí solo se declaran las tablas propias de core-service (sobre el mismo Base)
+from bovara_data import (
+    Cattle,
+    GenderEnum,
+    HealthEvent,
+    EventTypeEnum,
+    AdministrationRouteEnum,
+    HeatEvent,
+    Reminder,
+    ReminderTypeEnum,
+    ReminderStatusEnum,
+)
+from src.infrastructure.models.cattle_health_stats import CattleHealthStats
+from src.infrastructure.models.heat_forecast import HeatForecast
 
 __all__ = [
     "Cattle",
@@ -10,8 +21,10 @@ __all__ = [
     "HealthEvent",
     "EventTypeEnum",
     "AdministrationRouteEnum",
+    "HeatEvent",
     "Reminder",
     "ReminderTypeEnum",
     "ReminderStatusEnum",
-    "HeatEventModel" 
+    "CattleHealthStats",
+    "HeatForecast",
 ]
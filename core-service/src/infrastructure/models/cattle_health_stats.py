@@ -0,0 +1,20 @@
+# src/infrastructure/models/cattle_health_stats.py
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+from src.infrastructure.database import Base
+
+
+class CattleHealthStats(Base):
+    """Contadores de eventos de salud por animal, mantenidos al escribir health_events"""
+    __tablename__ = "cattle_health_stats"
+
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), primary_key=True)
+
+    total_eventos = Column(Integer, nullable=False, default=0)
+    total_vacunas = Column(Integer, nullable=False, default=0)
+    total_tratamientos = Column(Integer, nullable=False, default=0)
+    total_enfermedades = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -0,0 +1,36 @@
+# src/infrastructure/models/heat_forecast.py
+from sqlalchemy import Column, String, Boolean, BigInteger, Date, DateTime, Float, Integer, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.infrastructure.database import Base
+
+
+class HeatForecast(Base):
+    """
+    Pronóstico de próximo celo por vaca, calculado por ml-service.
+    core-service solo lo marca como `stale` (e incrementa `revision`) al escribir heat_events.
+    """
+    __tablename__ = "heat_forecasts"
+
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), primary_key=True)
+    owner_id = Column(UUID(as_uuid=True), nullable=False)
+
+    last_heat_date = Column(Date)
+    predicted_date = Column(Date)
+    predicted_days_rf = Column(Float)
+    predicted_days_xgb = Column(Float)
+    predicted_days_avg = Column(Float)
+    model_confidence = Column(String(10))
+    total_heat_records = Column(Integer)
+    model_version = Column(String(32))
+    error = Column(Text)  # motivo si no se pudo pronosticar (p. ej. menos de 3 celos)
+
+    stale = Column(Boolean, nullable=False, default=True)
+    computed_at = Column(DateTime)
+    revision = Column(BigInteger, nullable=False, default=0, server_default="0")  # +1 en cada invalidación
+    claimed_at = Column(DateTime)  # reserva del lote por el refresco de ml-service
+
+    __table_args__ = (
+        Index("ix_heat_forecasts_owner_id_predicted_date", "owner_id", "predicted_date"),
+        Index("ix_heat_forecasts_stale", "cattle_id", postgresql_where=stale.is_(True)),
+    )
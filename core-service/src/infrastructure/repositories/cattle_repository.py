@@ -1,15 +1,22 @@
 # src/infrastructure/repositories/cattle_repository.py
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import Optional, List
-from datetime import date
+from typing import Optional
 
-from src.infrastructure.models.cattle import Cattle
+from bovara_data import Cattle, CattleBaseRepository
+from src.infrastructure.repositories.heat_forecast_repository import HeatForecastRepository
 
 
-class CattleRepository:
+# Columnas que usa el pronóstico de celo de ml-service (features y dueño)
+FORECAST_FIELDS = {"owner_id", "gender", "breed", "birth_date", "weight", "fecha_ultimo_parto"}
+
+
+class CattleRepository(CattleBaseRepository):
+    """Lecturas compartidas (bovara_data) + escrituras de core-service"""
+
     def __init__(self, db: Session):
-        self.db = db
+        super().__init__(db)
+        self.forecast_repo = HeatForecastRepository(db)
 
     def create(self, **kwargs) -> Cattle:
         """Crear nuevo animal"""
@@ -19,10 +26,6 @@ class CattleRepository:
         self.db.refresh(cattle)
         return cattle
 
-    def get_by_id(self, cattle_id: UUID) -> Optional[Cattle]:
-        """Obtener por ID"""
-        return self.db.query(Cattle).filter(Cattle.id == cattle_id).first()
-
     def get_by_id_and_owner(self, cattle_id: UUID, owner_id: UUID) -> Optional[Cattle]:
         """Obtener por ID y dueño"""
         return self.db.query(Cattle).filter(
@@ -30,76 +33,21 @@ class CattleRepository:
             Cattle.owner_id == owner_id
         ).first()
 
-    def get_by_lote(self, lote: str) -> Optional[Cattle]:
-        """Obtener por número de lote"""
-        return self.db.query(Cattle).filter(Cattle.lote == lote).first()
-
-    def get_by_owner(
-        self,
-        owner_id: UUID,
-        gender: Optional[str] = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> List[Cattle]:
-        """Obtener ganado de un usuario"""
-        query = self.db.query(Cattle).filter(Cattle.owner_id == owner_id)
-        
-        if gender:
-            query = query.filter(Cattle.gender == gender)
-        
-        return query.offset(skip).limit(limit).all()
-
-    def count_by_owner(self, owner_id: UUID, gender: Optional[str] = None) -> int:
-        """Contar ganado de un usuario"""
-        query = self.db.query(Cattle).filter(Cattle.owner_id == owner_id)
-        
-        if gender:
-            query = query.filter(Cattle.gender == gender)
-        
-        return query.count()
-
-    # ✅ AGREGAR ESTOS 3 MÉTODOS NUEVOS
-    
-    def get_all(
-        self,
-        gender: Optional[str] = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> List[Cattle]:
-        """Obtener todo el ganado (sin filtro de owner)"""
-        query = self.db.query(Cattle)
-        
-        if gender:
-            query = query.filter(Cattle.gender == gender)
-        
-        return query.offset(skip).limit(limit).all()
-
-    def count_all(self, gender: Optional[str] = None) -> int:
-        """Contar todo el ganado (sin filtro de owner)"""
-        query = self.db.query(Cattle)
-        
-        if gender:
-            query = query.filter(Cattle.gender == gender)
-        
-        return query.count()
-
-    def search_by_lote(self, query: str) -> List[Cattle]:  # ✅ QUITAR owner_id
-        """Buscar por lote (sin filtro de owner)"""
-        return self.db.query(Cattle).filter(
-            Cattle.lote.ilike(f"%{query}%")
-        ).all()
-
-    # Métodos update y delete ya están bien
-    
     def update(self, cattle_id: UUID, **updates) -> Optional[Cattle]:
         """Actualizar animal"""
         cattle = self.get_by_id(cattle_id)
         if not cattle:
             return None
         
+        changed = set()
         for key, value in updates.items():
-            if value is not None:
+            if value is not None and getattr(cattle, key) != value:
                 setattr(cattle, key, value)
+                changed.add(key)
+        
+        if changed & FORECAST_FIELDS:
+            self.db.flush()
+            self.forecast_repo.mark_cattle_changed(cattle_id)
         
         self.db.commit()
         self.db.refresh(cattle)
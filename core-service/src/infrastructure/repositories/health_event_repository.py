@@ -4,45 +4,33 @@ from uuid import UUID
 from typing import Optional, List
 from datetime import date
 
-from src.infrastructure.models.health_event import HealthEvent
+from bovara_data import HealthEvent, HealthEventBaseRepository, EventTypeEnum
+from src.infrastructure.repositories.health_stats_repository import HealthStatsRepository
 
 
-class HealthEventRepository:
+class HealthEventRepository(HealthEventBaseRepository):
+    """Lecturas compartidas (bovara_data) + escrituras de core-service"""
+
     def __init__(self, db: Session):
-        self.db = db
+        super().__init__(db)
+        self.stats_repo = HealthStatsRepository(db)
 
     def create(self, **kwargs) -> HealthEvent:
         """Crear nuevo evento de salud"""
         event = HealthEvent(**kwargs)
         self.db.add(event)
+        self.stats_repo.apply(event.cattle_id, event.event_type, 1)
         self.db.commit()
         self.db.refresh(event)
         return event
 
-    def get_by_id(self, event_id: UUID) -> Optional[HealthEvent]:
-        """Obtener evento por ID"""
-        return self.db.query(HealthEvent).filter(HealthEvent.id == event_id).first()
-
-    def get_by_cattle(self, cattle_id: UUID) -> List[HealthEvent]:
+    def get_by_cattle(self, cattle_id: UUID) -> List:
         """Obtener todos los eventos de un animal"""
-        return (
-            self.db.query(HealthEvent)
-            .filter(HealthEvent.cattle_id == cattle_id)
-            .order_by(HealthEvent.application_date.desc())
-            .all()
-        )
+        return self.get_by_cattle_id(cattle_id, limit=None)
 
-    def get_vaccines_by_cattle(self, cattle_id: UUID) -> List[HealthEvent]:
+    def get_vaccines_by_cattle(self, cattle_id: UUID) -> List:
         """Obtener solo vacunas de un animal"""
-        return (
-            self.db.query(HealthEvent)
-            .filter(
-                HealthEvent.cattle_id == cattle_id,
-                HealthEvent.event_type == "vaccine"
-            )
-            .order_by(HealthEvent.application_date.desc())
-            .all()
-        )
+        return self.get_by_cattle_and_type(cattle_id, EventTypeEnum.vaccine, limit=None)
 
     def get_by_cattle_and_id(
         self, 
@@ -65,10 +53,16 @@ class HealthEventRepository:
         if not event:
             return None
         
+        old_cattle_id, old_type = event.cattle_id, event.event_type
         for key, value in updates.items():
             if value is not None:
                 setattr(event, key, value)
         
+        # Contadores: solo cambian si el evento pasa a otro animal o a otro tipo
+        if (event.cattle_id, getattr(event.event_type, "value", event.event_type)) != (old_cattle_id, getattr(old_type, "value", old_type)):
+            self.stats_repo.apply(old_cattle_id, old_type, -1)
+            self.stats_repo.apply(event.cattle_id, event.event_type, 1)
+        
         self.db.commit()
         self.db.refresh(event)
         return event
@@ -80,20 +74,10 @@ class HealthEventRepository:
             return False
         
         self.db.delete(event)
+        self.stats_repo.apply(event.cattle_id, event.event_type, -1)
         self.db.commit()
         return True
 
-    def get_upcoming_doses(self, cattle_id: UUID) -> List[HealthEvent]:
-        """Obtener próximas dosis programadas"""
-        from datetime import datetime
-        today = datetime.now().date()
-        
-        return (
-            self.db.query(HealthEvent)
-            .filter(
-                HealthEvent.cattle_id == cattle_id,
-                HealthEvent.next_dose_date >= today
-            )
-            .order_by(HealthEvent.next_dose_date)
-            .all()
-        )
+    def get_upcoming_doses(self, cattle_id: UUID, **kwargs) -> List:
+        """Obtener próximas dosis programadas de un animal"""
+        return super().get_upcoming_doses(date.today(), cattle_id=cattle_id, limit=None, **kwargs)
@@ -0,0 +1,73 @@
+# src/infrastructure/repositories/health_stats_repository.py
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from uuid import UUID
+from typing import Optional
+
+from src.infrastructure.models.cattle_health_stats import CattleHealthStats
+
+
+# Tipos de evento con contador propio (el resto solo suma a total_eventos)
+COUNTED_TYPES = {
+    "vaccine": "total_vacunas",
+    "treatment": "total_tratamientos",
+    "illness": "total_enfermedades",
+}
+
+UPSERT_DELTA = text("""
+    INSERT INTO cattle_health_stats
+        (cattle_id, total_eventos, total_vacunas, total_tratamientos, total_enfermedades, updated_at)
+    VALUES
+        (:cattle_id, :total_eventos, :total_vacunas, :total_tratamientos, :total_enfermedades, now())
+    ON CONFLICT (cattle_id) DO UPDATE SET
+        total_eventos = cattle_health_stats.total_eventos + EXCLUDED.total_eventos,
+        total_vacunas = cattle_health_stats.total_vacunas + EXCLUDED.total_vacunas,
+        total_tratamientos = cattle_health_stats.total_tratamientos + EXCLUDED.total_tratamientos,
+        total_enfermedades = cattle_health_stats.total_enfermedades + EXCLUDED.total_enfermedades,
+        updated_at = now()
+""")
+
+# Recalcula todos los contadores (cargas masivas que no pasan por el servicio)
+REBUILD = text("""
+    INSERT INTO cattle_health_stats
+        (cattle_id, total_eventos, total_vacunas, total_tratamientos, total_enfermedades, updated_at)
+    SELECT
+        c.id,
+        COUNT(he.id),
+        COUNT(CASE WHEN he.event_type = 'vaccine' THEN 1 END),
+        COUNT(CASE WHEN he.event_type = 'treatment' THEN 1 END),
+        COUNT(CASE WHEN he.event_type = 'illness' THEN 1 END),
+        now()
+    FROM cattle c
+    LEFT JOIN health_events he ON c.id = he.cattle_id
+    GROUP BY c.id
+    ON CONFLICT (cattle_id) DO UPDATE SET
+        total_eventos = EXCLUDED.total_eventos,
+        total_vacunas = EXCLUDED.total_vacunas,
+        total_tratamientos = EXCLUDED.total_tratamientos,
+        total_enfermedades = EXCLUDED.total_enfermedades,
+        updated_at = now()
+""")
+
+
+class HealthStatsRepository:
+    """Contadores de salud por animal. No hace commit: va en la transacción del evento"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_cattle(self, cattle_id: UUID) -> Optional[CattleHealthStats]:
+        """Obtener contadores de un animal"""
+        return self.db.get(CattleHealthStats, cattle_id)
+
+    def apply(self, cattle_id: UUID, event_type, delta: int) -> None:
+        """Sumar (delta=1) o restar (delta=-1) un evento a los contadores del animal"""
+        event_type = getattr(event_type, "value", event_type)
+        params = {"cattle_id": cattle_id, "total_eventos": delta}
+        for counted, column in COUNTED_TYPES.items():
+            params[column] = delta if event_type == counted else 0
+        self.db.execute(UPSERT_DELTA, params)
+
+    def rebuild(self) -> None:
+        """Recalcular todos los contadores desde health_events"""
+        self.db.execute(REBUILD)
@@ -1,32 +1,28 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select
 from typing import List, Optional
 from uuid import UUID
 
-from src.infrastructure.models.heat_event import HeatEventModel
+from bovara_data import HeatEvent, HeatEventBaseRepository
+from src.infrastructure.repositories.heat_forecast_repository import HeatForecastRepository
 
 
-class HeatEventRepository:
+class HeatEventRepository(HeatEventBaseRepository):
     def __init__(self, db: Session):
-        self.db = db
+        super().__init__(db)
+        self.forecast_repo = HeatForecastRepository(db)
     
-    def create(self, heat_event: HeatEventModel) -> HeatEventModel:
+    def create(self, heat_event: HeatEvent) -> HeatEvent:
         self.db.add(heat_event)
+        self.forecast_repo.mark_stale(heat_event.cattle_id)
         self.db.commit()
         self.db.refresh(heat_event)
         return heat_event
     
-    def get_by_id(self, heat_event_id: UUID) -> Optional[HeatEventModel]:
-        return self.db.query(HeatEventModel).filter(
-            HeatEventModel.id == heat_event_id
-        ).first()
+    def get_by_cattle_id(self, cattle_id: UUID, skip: int = 0, limit: Optional[int] = None) -> List:
+        return super().get_by_cattle_id(cattle_id, skip=skip, limit=limit)
     
-    def get_by_cattle_id(self, cattle_id: UUID) -> List[HeatEventModel]:
-        return self.db.query(HeatEventModel).filter(
-            HeatEventModel.cattle_id == cattle_id
-        ).order_by(HeatEventModel.heat_date.desc()).all()
-    
-    def update(self, heat_event: HeatEventModel) -> HeatEventModel:
+    def update(self, heat_event: HeatEvent) -> HeatEvent:
+        self.forecast_repo.mark_stale(heat_event.cattle_id)
         self.db.commit()
         self.db.refresh(heat_event)
         return heat_event
@@ -35,6 +31,7 @@ class HeatEventRepository:
         heat_event = self.get_by_id(heat_event_id)
         if heat_event:
             self.db.delete(heat_event)
+            self.forecast_repo.mark_stale(heat_event.cattle_id)
             self.db.commit()
             return True
         return False
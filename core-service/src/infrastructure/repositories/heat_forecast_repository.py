@@ -0,0 +1,52 @@
+# src/infrastructure/repositories/heat_forecast_repository.py
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from uuid import UUID
+
+
+# Toda invalidación incrementa `revision`: ml-service calcula sin bloquear la fila y solo
+# guarda si la revisión no cambió, así que nunca espera al cálculo de un pronóstico.
+#
+# Crea la fila si la vaca aún no tiene pronóstico; ml-service la recalcula en segundo plano
+MARK_STALE = text("""
+    INSERT INTO heat_forecasts (cattle_id, owner_id, stale)
+    SELECT c.id, c.owner_id, true FROM cattle c WHERE c.id = :cattle_id
+    ON CONFLICT (cattle_id) DO UPDATE SET stale = true, revision = heat_forecasts.revision + 1
+""")
+
+# Cambios en la vaca (features del modelo o dueño): solo si ya tiene pronóstico
+MARK_CATTLE_CHANGED = text("""
+    UPDATE heat_forecasts f
+    SET stale = true, revision = f.revision + 1, owner_id = c.owner_id
+    FROM cattle c
+    WHERE c.id = :cattle_id AND f.cattle_id = c.id
+""")
+
+# Siembra inicial: todas las hembras con celos (igual que la migración 8a2f6d1c0b37)
+MARK_ALL_STALE = text("""
+    INSERT INTO heat_forecasts (cattle_id, owner_id, stale)
+    SELECT c.id, c.owner_id, true
+    FROM cattle c
+    WHERE c.gender = 'female'
+      AND EXISTS (SELECT 1 FROM heat_events he WHERE he.cattle_id = c.id)
+    ON CONFLICT (cattle_id) DO UPDATE SET stale = true, revision = heat_forecasts.revision + 1
+""")
+
+
+class HeatForecastRepository:
+    """Invalidación de pronósticos. No hace commit: va en la transacción del celo"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def mark_stale(self, cattle_id: UUID) -> None:
+        """Marcar el pronóstico de una vaca para recálculo"""
+        self.db.execute(MARK_STALE, {"cattle_id": cattle_id})
+
+    def mark_cattle_changed(self, cattle_id: UUID) -> None:
+        """Marcar para recálculo (y copiar el dueño) tras editar la vaca"""
+        self.db.execute(MARK_CATTLE_CHANGED, {"cattle_id": cattle_id})
+
+    def mark_all_stale(self) -> None:
+        """Marcar para recálculo a todas las hembras con celos"""
+        self.db.execute(MARK_ALL_STALE)
@@ -4,12 +4,14 @@ from uuid import UUID
 from typing import Optional, List
 from datetime import date
 
-from src.infrastructure.models.reminder import Reminder
+from bovara_data import Reminder, ReminderBaseRepository
 
 
-class ReminderRepository:
+class ReminderRepository(ReminderBaseRepository):
+    """Lecturas compartidas (bovara_data) + escrituras de core-service"""
+
     def __init__(self, db: Session):
-        self.db = db
+        super().__init__(db)
 
     def create(self, **kwargs) -> Reminder:
         """Crear nuevo recordatorio"""
@@ -19,48 +21,9 @@ class ReminderRepository:
         self.db.refresh(reminder)
         return reminder
 
-    def get_by_id(self, reminder_id: UUID) -> Optional[Reminder]:
-        """Obtener recordatorio por ID"""
-        return self.db.query(Reminder).filter(Reminder.id == reminder_id).first()
-
-    # ✅ AGREGAR ESTOS MÉTODOS PÚBLICOS (sin user_id)
-    
-    def get_all(
-        self,
-        status: Optional[str] = None,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> List[Reminder]:
-        """Obtener todos los recordatorios (sin filtro de user)"""
-        query = self.db.query(Reminder)
-        
-        if status:
-            query = query.filter(Reminder.status == status)
-        
-        if start_date:
-            query = query.filter(Reminder.reminder_date >= start_date)
-        
-        if end_date:
-            query = query.filter(Reminder.reminder_date <= end_date)
-        
-        return query.order_by(Reminder.reminder_date).offset(skip).limit(limit).all()
-
-    def get_today_reminders(self) -> List[Reminder]:
+    def get_today_reminders(self) -> List:
         """Obtener recordatorios de hoy (sin filtro de user)"""
-        from datetime import datetime
-        today = datetime.now().date()
-        
-        return (
-            self.db.query(Reminder)
-            .filter(
-                Reminder.reminder_date == today,
-                Reminder.status == "pending"
-            )
-            .order_by(Reminder.reminder_date)
-            .all()
-        )
+        return self.get_today()
 
     # ============================================
     # MÉTODOS CON USER_ID (legacy - puedes mantenerlos por compatibilidad)
@@ -0,0 +1,27 @@
+# src/infrastructure/schema.py
+from sqlalchemy import inspect
+
+from src.infrastructure.database import Base, SessionLocal, engine
+import src.infrastructure.models  # noqa: F401  registra todas las tablas en Base.metadata
+from src.infrastructure.repositories.health_stats_repository import HealthStatsRepository
+from src.infrastructure.repositories.heat_forecast_repository import HeatForecastRepository
+
+
+def create_tables() -> None:
+    """
+    Crea las tablas que falten (despliegues sin Alembic). Las tablas derivadas
+    recién creadas se rellenan desde sus tablas de origen, igual que hacen sus
+    migraciones; si ya existían, las mantienen los repositorios.
+    """
+    existing = set(inspect(engine).get_table_names())
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        if "cattle_health_stats" not in existing:
+            HealthStatsRepository(db).rebuild()
+        if "heat_forecasts" not in existing:
+            HeatForecastRepository(db).mark_all_stale()
+        db.commit()
+    finally:
+        db.close()
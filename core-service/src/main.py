@@ -1,12 +1,15 @@
 # src/main.py
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from bovara_ops import ReadinessProbe, health_router, sql_check, setup_metrics, setup_tracing, setup_logging, instrument_engine
 from src.api.v1 import api_router
-from src.infrastructure.database import Base, engine
+from src.infrastructure.auth.revocations import revocation_list
+from src.infrastructure.database import engine
+from src.infrastructure.schema import create_tables
 
 
-# Crear tablas
-Base.metadata.create_all(bind=engine)
+# Crear tablas (y rellenar las derivadas la primera vez)
+create_tables()
 
 
 app = FastAPI(
@@ -28,8 +31,31 @@ app.add_middleware(
 )
 
 
+# Métricas (/metrics) y trazas distribuidas
+setup_metrics(app, "core-service")
+setup_tracing(app, "core-service")
+instrument_engine(engine)
+
+
+# Logging estructurado (JSON, asíncrono y muestreado por petición)
+setup_logging("core-service", app)
+
+
+# Health checks (readiness cacheada, refrescada en segundo plano)
+probe = ReadinessProbe(service="core-service")
+probe.add_check("database", sql_check(engine))
+app.add_event_handler("startup", probe.start)
+app.add_event_handler("shutdown", probe.stop)
+
+
+# Sincronización de tokens revocados (logout) con auth-service
+app.add_event_handler("startup", revocation_list.start)
+app.add_event_handler("shutdown", revocation_list.stop)
+
+
 # Incluir routers
 app.include_router(api_router, prefix="/api/v1")
+app.include_router(health_router(probe))
 
 
 @app.get("/")
@@ -42,11 +68,6 @@ def root():
     }
 
 
-@app.get("/health")
-def health_check():
-    return {"status": "healthy", "service": "core-service"}
-
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
@@ -0,0 +1,75 @@
+# tests/conftest.py
+"""
+Base de datos de los tests de planes de consulta (tests/test_query_plans.py).
+
+TEST_DATABASE_URL debe apuntar a una base de core-service migrada y poblada con
+un hato de tamaño realista:
+
+    alembic upgrade head
+    python ../benchmarks/seed.py --herd 100k --database-url $TEST_DATABASE_URL
+
+Con tablas de pocas filas el planner elige, con razón, un seq scan, así que sin
+TEST_DATABASE_URL, sin conexión o sin hato los tests se omiten. Cada test corre
+en una transacción que se revierte.
+"""
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import DBAPIError
+
+
+MIN_HERD = 10_000
+
+SAMPLE_QUERIES = {
+    "cattle_id": "SELECT id FROM cattle ORDER BY random() LIMIT 1",
+    "owner_id": "SELECT owner_id FROM cattle LIMIT 1",
+    "lote": "SELECT lote FROM cattle ORDER BY random() LIMIT 1",
+    "heat_cattle_id": "SELECT cattle_id FROM heat_events ORDER BY random() LIMIT 1",
+    "health_cattle_id": "SELECT cattle_id FROM health_events ORDER BY random() LIMIT 1",
+    "health_event_id": "SELECT id FROM health_events ORDER BY random() LIMIT 1",
+    "reminder_cattle_id": "SELECT cattle_id FROM reminders WHERE cattle_id IS NOT NULL ORDER BY random() LIMIT 1",
+    "reminder_id": "SELECT id FROM reminders ORDER BY id LIMIT 1",
+    "reminder_user_id": "SELECT user_id FROM reminders ORDER BY id LIMIT 1",
+    # Otro rancho: con un solo dueño en el hato sintético su filtro no sería selectivo
+    "other_owner_id": "SELECT gen_random_uuid()",
+}
+
+
+@pytest.fixture(scope="session")
+def engine():
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL no definida")
+
+    engine = create_engine(url)
+    try:
+        with engine.connect() as conn:
+            herd = conn.execute(text("SELECT COUNT(*) FROM cattle")).scalar()
+    except DBAPIError as e:
+        engine.dispose()
+        pytest.skip(f"Base de pruebas no disponible: {e.orig}")
+
+    if herd < MIN_HERD:
+        engine.dispose()
+        pytest.skip(f"Hato de {herd} animales; hacen falta al menos {MIN_HERD} (benchmarks/seed.py)")
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def sample(engine) -> dict:
+    """IDs y valores reales de la base para parametrizar las consultas"""
+    with engine.connect() as conn:
+        return {name: conn.execute(text(sql)).scalar() for name, sql in SAMPLE_QUERIES.items()}
+
+
+@pytest.fixture
+def conn(engine):
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            yield conn
+        finally:
+            trans.rollback()
@@ -0,0 +1,241 @@
+# tests/test_query_plans.py
+"""
+Planes de las consultas de repositorio (core-service y bovara_data, compartido
+con chatbot-service) contra el hato de benchmarks/seed.py.
+
+No se explican consultas escritas a mano: se ejecuta el método real del
+repositorio, se capturan las sentencias SQL que emite y se explica cada una con
+sus mismos parámetros y la configuración por defecto del planner. Cada caso
+indica los índices que el plan debe usar (ver la migración b41e7d2a9c55).
+
+Los listados del chatbot que muestran nombre y lote de cada animal deben traer el
+ganado en el mismo SELECT (with_cattle), sin una consulta por fila.
+
+Sin caso, a propósito: count()/count_all()/count_pending() (recorren la tabla),
+search_by_name()/search_by_lote() (ILIKE '%...%') y get_by_breed(). Las
+consultas de ml-service están en ml-service/tests/test_query_plans.py.
+"""
+import json
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from bovara_data import (
+    CattleBaseRepository,
+    EventTypeEnum,
+    HealthEventBaseRepository,
+    HeatEventBaseRepository,
+    ReminderBaseRepository,
+)
+from src.infrastructure.repositories import CattleRepository, HealthEventRepository, ReminderRepository
+from src.infrastructure.repositories.health_stats_repository import HealthStatsRepository
+from src.infrastructure.repositories.heat_event_repository import HeatEventRepository
+from src.infrastructure.repositories.heat_forecast_repository import HeatForecastRepository
+
+
+TODAY = date.today()
+
+# (id, índices esperados, llamada)
+CASES = [
+    # core-service
+    ("cattle.get_by_id", {"cattle_pkey"},
+     lambda r, s: r.cattle.get_by_id(s["cattle_id"])),
+    ("cattle.get_by_id_and_owner", {"cattle_pkey"},
+     lambda r, s: r.cattle.get_by_id_and_owner(s["cattle_id"], s["owner_id"])),
+    ("cattle.get_by_owner", {"ix_cattle_owner_id"},
+     lambda r, s: r.cattle.get_by_owner(s["other_owner_id"])),
+    ("cattle.get_by_lote", {"ix_cattle_lote"},
+     lambda r, s: r.cattle.get_by_lote(s["lote"])),
+    ("cattle.exists_lote", {"ix_cattle_lote"},
+     lambda r, s: r.cattle.exists_lote(s["lote"], exclude_id=s["cattle_id"])),
+    ("cattle.get_all", {"ix_cattle_lote"},
+     lambda r, s: r.cattle.get_all(limit=100)),
+    ("health.get_by_cattle", {"ix_health_events_cattle_id_event_type"},
+     lambda r, s: r.health.get_by_cattle(s["health_cattle_id"])),
+    ("health.get_vaccines_by_cattle", {"ix_health_events_cattle_id_event_type"},
+     lambda r, s: r.health.get_vaccines_by_cattle(s["health_cattle_id"])),
+    ("health.get_by_cattle_and_id", {"health_events_pkey"},
+     lambda r, s: r.health.get_by_cattle_and_id(s["health_event_id"], s["health_cattle_id"])),
+    ("health.get_upcoming_doses", {"ix_health_events_cattle_id_event_type"},
+     lambda r, s: r.health.get_upcoming_doses(s["health_cattle_id"])),
+    ("health.get_by_date_range", {"ix_health_events_application_date"},
+     lambda r, s: r.health.get_by_date_range(TODAY - timedelta(days=30), TODAY)),
+    ("health_stats.get_by_cattle", {"cattle_health_stats_pkey"},
+     lambda r, s: r.health_stats.get_by_cattle(s["cattle_id"])),
+    ("health_stats.apply", {"cattle_health_stats_pkey"},
+     lambda r, s: r.health_stats.apply(s["cattle_id"], EventTypeEnum.vaccine, 1)),
+    ("heat.get_by_cattle_id", {"ix_heat_events_cattle_id_heat_date"},
+     lambda r, s: r.heat.get_by_cattle_id(s["heat_cattle_id"])),
+    ("reminder.get_all", {"ix_reminders_reminder_date"},
+     lambda r, s: r.reminder.get_all()),
+    ("reminder.get_all_status", {"ix_reminders_status_reminder_date"},
+     lambda r, s: r.reminder.get_all(status="pending")),
+    ("reminder.get_today_reminders", {"ix_reminders_status_reminder_date"},
+     lambda r, s: r.reminder.get_today_reminders()),
+    ("reminder.get_by_user", {"ix_reminders_user_id_reminder_date"},
+     lambda r, s: r.reminder.get_by_user(s["other_owner_id"])),
+    ("reminder.get_pending_reminders", {"ix_reminders_user_id_reminder_date"},
+     lambda r, s: r.reminder.get_pending_reminders(s["other_owner_id"])),
+    ("reminder.count_by_user", {"ix_reminders_user_id_reminder_date"},
+     lambda r, s: r.reminder.count_by_user(s["other_owner_id"])),
+    ("reminder.get_by_id_and_user", {"reminders_pkey"},
+     lambda r, s: r.reminder.get_by_id_and_user(s["reminder_id"], s["reminder_user_id"])),
+    # chatbot-service (bovara_data, con los argumentos de sus tools)
+    ("chatbot.cattle.get_by_gender", {"ix_cattle_lote"},
+     lambda r, s: r.shared_cattle.get_by_gender("female", limit=50)),
+    ("chatbot.health.get_by_cattle_id", {"ix_health_events_cattle_id_event_type"},
+     lambda r, s: r.shared_health.get_by_cattle_id(s["health_cattle_id"], limit=20)),
+    ("chatbot.health.get_last_by_type", {"ix_health_events_cattle_id_event_type"},
+     lambda r, s: r.shared_health.get_last_by_type(s["health_cattle_id"], EventTypeEnum.vaccine, medicine_name="aftosa")),
+    ("chatbot.health.get_doses_in_range", {"ix_health_events_next_dose_date"},
+     lambda r, s: r.shared_health.get_doses_in_range(TODAY, TODAY + timedelta(days=30), limit=50)),
+    ("chatbot.health.count_doses_in_range", {"ix_health_events_next_dose_date"},
+     lambda r, s: r.shared_health.count_doses_in_range(TODAY, TODAY + timedelta(days=30))),
+    ("chatbot.health.get_upcoming_doses", {"ix_health_events_next_dose_date", "cattle_pkey"},
+     lambda r, s: r.shared_health.get_upcoming_doses(TODAY, limit=100, with_cattle=True)),
+    ("chatbot.health.count_upcoming_doses", {"ix_health_events_next_dose_date"},
+     lambda r, s: r.shared_health.count_upcoming_doses(TODAY)),
+    ("chatbot.heat.get_by_cattle_id", {"ix_heat_events_cattle_id_heat_date"},
+     lambda r, s: r.shared_heat.get_by_cattle_id(s["heat_cattle_id"], limit=20)),
+    ("chatbot.heat.get_last_heat", {"ix_heat_events_cattle_id_heat_date"},
+     lambda r, s: r.shared_heat.get_last_heat(s["heat_cattle_id"])),
+    ("chatbot.heat.get_confirmed_pregnancies", {"ix_heat_events_confirmed_pregnancy", "cattle_pkey"},
+     lambda r, s: r.shared_heat.get_confirmed_pregnancies(limit=50, with_cattle=True)),
+    ("chatbot.heat.get_pending_pregnancy_check", {"ix_heat_events_pending_pregnancy", "cattle_pkey"},
+     lambda r, s: r.shared_heat.get_pending_pregnancy_check(45, limit=50, with_cattle=True)),
+    ("chatbot.reminder.get_by_cattle_id", {"ix_reminders_cattle_id_reminder_date"},
+     lambda r, s: r.shared_reminder.get_by_cattle_id(s["reminder_cattle_id"], limit=20)),
+    ("chatbot.reminder.get_pending", {"ix_reminders_status_reminder_date"},
+     lambda r, s: r.shared_reminder.get_pending(limit=50)),
+    ("chatbot.reminder.get_upcoming", {"ix_reminders_status_reminder_date"},
+     lambda r, s: r.shared_reminder.get_upcoming(days=7, limit=50)),
+    ("chatbot.reminder.get_overdue", {"ix_reminders_status_reminder_date"},
+     lambda r, s: r.shared_reminder.get_overdue(limit=50)),
+]
+
+# El hato sembrado confirma o descarta todas las inseminaciones: se dejan dos sin confirmar
+PENDING_PREGNANCY_SETUP = """
+    UPDATE heat_events SET pregnancy_confirmed = NULL
+    WHERE id IN (
+        SELECT id FROM heat_events
+        WHERE was_inseminated IS true AND insemination_date <= CURRENT_DATE - 45
+        LIMIT 2
+    )
+"""
+
+# Listados del chatbot que leen event.cattle: (id, preparación, llamada)
+WITH_CATTLE_CASES = [
+    ("chatbot.heat.get_confirmed_pregnancies", None,
+     lambda r: r.shared_heat.get_confirmed_pregnancies(limit=50, with_cattle=True)),
+    ("chatbot.heat.get_pending_pregnancy_check", PENDING_PREGNANCY_SETUP,
+     lambda r: r.shared_heat.get_pending_pregnancy_check(45, limit=50, with_cattle=True)),
+    ("chatbot.health.get_doses_in_range", None,
+     lambda r: r.shared_health.get_doses_in_range(TODAY, TODAY + timedelta(days=30), limit=50)),
+    ("chatbot.health.get_upcoming_doses", None,
+     lambda r: r.shared_health.get_upcoming_doses(TODAY, limit=100, with_cattle=True)),
+]
+
+# Necesitan heat_forecasts poblada (fixture forecasts)
+FORECAST_CASES = [
+    ("heat_forecast.mark_stale", {"cattle_pkey", "heat_forecasts_pkey"},
+     lambda r, s: r.heat_forecast.mark_stale(s["heat_cattle_id"])),
+    ("heat_forecast.mark_cattle_changed", {"cattle_pkey", "heat_forecasts_pkey"},
+     lambda r, s: r.heat_forecast.mark_cattle_changed(s["heat_cattle_id"])),
+]
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _describe(node: dict) -> list:
+    """Índices (o recorridos sin índice) de un nodo del plan"""
+    if "Index Name" in node:
+        return [node["Index Name"]]
+    # INSERT ... ON CONFLICT: el índice con el que se resuelve el conflicto
+    if "Conflict Arbiter Indexes" in node:
+        return node["Conflict Arbiter Indexes"]
+    if node["Node Type"].endswith("Scan") and "Relation Name" in node:
+        return [f"{node['Node Type']} on {node['Relation Name']}"]
+    return []
+
+
+def _statements(conn, fn) -> list:
+    """Ejecuta `fn` y devuelve las sentencias (y parámetros) que emite"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(conn, "before_cursor_execute", capture)
+    try:
+        fn()
+    finally:
+        event.remove(conn, "before_cursor_execute", capture)
+    return statements
+
+
+def _plan_indexes(conn, repos, sample, call) -> list:
+    """Ejecuta `call` y devuelve lo que usan los planes de cada sentencia que emite"""
+    statements = _statements(conn, lambda: call(repos, sample))
+    assert statements, "la llamada no emitió SQL"
+    used = []
+    for statement, parameters in statements:
+        raw = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+        for node in _plan_nodes(plan):
+            used += _describe(node)
+    return used
+
+
+@pytest.fixture
+def repos(conn):
+    db = Session(bind=conn)
+    yield SimpleNamespace(
+        cattle=CattleRepository(db),
+        health=HealthEventRepository(db),
+        health_stats=HealthStatsRepository(db),
+        heat=HeatEventRepository(db),
+        heat_forecast=HeatForecastRepository(db),
+        reminder=ReminderRepository(db),
+        shared_cattle=CattleBaseRepository(db),
+        shared_health=HealthEventBaseRepository(db),
+        shared_heat=HeatEventBaseRepository(db),
+        shared_reminder=ReminderBaseRepository(db),
+    )
+    db.close()
+
+
+@pytest.fixture(scope="module")
+def forecasts(engine):
+    """heat_forecasts poblada (benchmarks/seed.py la rellena con pronósticos en régimen normal)"""
+    with engine.connect() as conn:
+        if not conn.execute(text("SELECT EXISTS (SELECT 1 FROM heat_forecasts)")).scalar():
+            pytest.skip("heat_forecasts vacía: poblar la base con benchmarks/seed.py")
+
+
+@pytest.mark.parametrize("expected, call", [case[1:] for case in CASES], ids=[case[0] for case in CASES])
+def test_query_uses_index(conn, repos, sample, expected, call):
+    used = _plan_indexes(conn, repos, sample, call)
+    assert expected <= set(used), f"índices esperados {sorted(expected)}, plan: {used}"
+
+
+@pytest.mark.parametrize("expected, call", [case[1:] for case in FORECAST_CASES], ids=[case[0] for case in FORECAST_CASES])
+def test_forecast_query_uses_index(conn, forecasts, repos, sample, expected, call):
+    used = _plan_indexes(conn, repos, sample, call)
+    assert expected <= set(used), f"índices esperados {sorted(expected)}, plan: {used}"
+
+
+@pytest.mark.parametrize("setup, call", [case[1:] for case in WITH_CATTLE_CASES], ids=[case[0] for case in WITH_CATTLE_CASES])
+def test_listing_loads_cattle_in_one_statement(conn, repos, setup, call):
+    if setup:
+        conn.execute(text(setup))
+    rows = []
+    statements = _statements(conn, lambda: rows.extend((row, row.cattle.name, row.cattle.lote) for row in call(repos)))
+    assert rows, "la consulta no devolvió filas"
+    assert len(statements) == 1, f"{len(statements)} sentencias para {len(rows)} filas (N+1)"
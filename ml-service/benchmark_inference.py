@@ -0,0 +1,90 @@
+# benchmark_inference.py
+"""
+Paridad y latencia de la inferencia de forecasting: nativa (sklearn / xgboost
+sobre DataFrame) frente a ONNX (onnxruntime sobre float32).
+
+1. Paridad: máx. |Δ| en días entre ambas rutas sobre todas las filas de
+   features reales; sale con código 1 si supera la tolerancia.
+2. Latencia: p50/p99 por llamada para un animal (batch 1) y para lotes,
+   por modelo y backend.
+
+Requiere modelos entrenados y exportados (export_onnx.py).
+
+Uso:
+    python benchmark_inference.py
+    python benchmark_inference.py --batch-sizes 1,16,256,4096 --repeat 200 --output results/inference.json
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from src.config import settings
+from src.database import SessionLocal
+from src.services import onnx_models
+from src.services.multimodal_forecasting_service import MultimodalForecastingService
+
+
+def _latency(model, X, repeat: int) -> Dict[str, float]:
+    model.predict(X)  # calentamiento
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.predict(X)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "p50_ms": round(timings[len(timings) // 2], 4),
+        "p99_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.99))], 4),
+        "rows_per_s": round(len(X) / (timings[len(timings) // 2] / 1000), 1),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Paridad y latencia de inferencia nativa vs ONNX")
+    parser.add_argument("--source", choices=["db", "snapshot"], default=None)
+    parser.add_argument("--batch-sizes", default="1,8,64,512,4096")
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--tolerance", type=float, default=onnx_models.PARITY_TOLERANCE)
+    parser.add_argument("--output", default=None, help="Guardar el reporte JSON")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        service = MultimodalForecastingService(db)
+        X = service.feature_matrix(args.source)
+    finally:
+        db.close()
+
+    native = {"rf_model": service.rf_model, "xgb_model": service.xgb_model}
+    compiled = {
+        key: onnx_models.OnnxRegressor(service.model_path / name, settings.onnx_threads)
+        for key, name in onnx_models.ONNX_ARTIFACTS.items()
+    }
+
+    parity = {key: onnx_models.parity(native[key], compiled[key], X) for key in native}
+    report = {"rows": len(X), "tolerance": args.tolerance, "parity_max_abs_diff": parity, "latency": {}}
+    print(f"Paridad sobre {len(X)} filas (máx. |Δ| días): {parity}")
+
+    rng = np.random.default_rng(42)
+    for batch in [int(b) for b in args.batch_sizes.split(",")]:
+        X_batch = X.iloc[rng.integers(0, len(X), batch)]
+        for key in native:
+            for backend, model in (("native", native[key]), ("onnx", compiled[key])):
+                result = _latency(model, X_batch, args.repeat)
+                report["latency"][f"{key}/{backend}/batch_{batch}"] = result
+                print(f"  {key:<10} {backend:<7} batch={batch:<5} p50={result['p50_ms']}ms  p99={result['p99_ms']}ms  {result['rows_per_s']} filas/s")
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    failed = {key: diff for key, diff in parity.items() if diff > args.tolerance}
+    if failed:
+        print(f"\n❌ Paridad fuera de tolerancia: {failed}")
+        sys.exit(1)
+    print("\n✅ Paridad dentro de tolerancia")
@@ -0,0 +1,49 @@
+# export_onnx.py
+"""
+Exporta los forecasters entrenados (RF y XGBoost) a ONNX para INFERENCE_BACKEND=onnx.
+
+La exportación solo se publica si la predicción ONNX coincide con la nativa
+dentro de la tolerancia sobre una muestra de features reales. Con
+INFERENCE_BACKEND=onnx, /forecasting/train exporta automáticamente; este
+script sirve para modelos ya entrenados.
+
+Uso:
+    pip install -r requirements_onnx.txt
+    python export_onnx.py
+    python export_onnx.py --sample 5000 --tolerance 0.01 --source snapshot
+"""
+import argparse
+import json
+import sys
+
+from src.config import settings
+from src.database import SessionLocal
+from src.services import onnx_models
+from src.services.multimodal_forecasting_service import MultimodalForecastingService
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exportar forecasters a ONNX con verificación de paridad")
+    parser.add_argument("--source", choices=["db", "snapshot"], default=None)
+    parser.add_argument("--sample", type=int, default=2_000, help="Filas de features para la paridad")
+    parser.add_argument("--tolerance", type=float, default=onnx_models.PARITY_TOLERANCE, help="Máx. |Δ| en días")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        service = MultimodalForecastingService(db)
+        X = service.feature_matrix(args.source)
+    finally:
+        db.close()
+
+    sample = X.sample(min(len(X), args.sample), random_state=42)
+    try:
+        report = onnx_models.export_onnx(
+            service.rf_model, service.xgb_model, sample, service.model_path, settings.onnx_threads, args.tolerance
+        )
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(json.dumps({"rows": len(sample), "parity_max_abs_diff": report}, indent=2))
+    print(f"\n✅ Modelos ONNX guardados en {service.model_path} (activar con INFERENCE_BACKEND=onnx)")
@@ -0,0 +1,45 @@
+# export_snapshots.py
+"""
+Exporta cattle, heat_events y health_events a un snapshot Parquet particionado
+por dueño (rancho) y mes, para entrenar y analizar sin consultar la base OLTP.
+
+Uso:
+    python export_snapshots.py                       # todas las tablas → snapshots/<id>/
+    python export_snapshots.py --tables heat_events,cattle --chunk-size 50000
+
+Entrenar desde el último snapshot:
+    POST /api/v1/forecasting/train?source=snapshot
+    POST /api/v1/clustering/train?source=snapshot
+    (o TRAINING_SOURCE=snapshot para que sea el defecto)
+
+Análisis offline (notebook / forest-ml), leyendo solo las columnas necesarias:
+    from src.services import snapshot_store
+    df = snapshot_store.read_heat_history()
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from src.database import engine
+from src.services import snapshot_store
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exportar snapshot Parquet de la base de datos")
+    parser.add_argument("--output", default=str(snapshot_store.SNAPSHOT_PATH))
+    parser.add_argument("--tables", default=",".join(snapshot_store.EXPORT_QUERIES))
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = snapshot_store.export_snapshot(
+        engine,
+        root=Path(args.output),
+        tables=args.tables.split(","),
+        chunk_size=args.chunk_size,
+    )
+    result["seconds"] = round(time.perf_counter() - start, 2)
+
+    print(json.dumps(result, indent=2))
+    print(f"\n✅ Snapshot {result['snapshot_id']} exportado en {result['path']}")
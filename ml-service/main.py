@@ -1,7 +1,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from bovara_ops import ReadinessProbe, health_router, sql_check, async_sql_check, setup_metrics, setup_tracing, setup_logging, instrument_engine
+
+from src.config import settings
+from src import executors
+from src.auth.revocations import revocation_list
+from src.database import async_engine, engine
 from src.routes import clustering_routes, forecasting_routes
+from src.services.model_store import forecasting_readiness
+from src.services.forecast_refresher import ForecastRefresher
 
 app = FastAPI(
     title="Bovara ML Service",
@@ -31,20 +39,53 @@ def root():
             },
             "forecasting": {
                 "train": "/api/v1/forecasting/train",
-                "predict": "/api/v1/forecasting/predict/{cattle_id}"
+                "predict": "/api/v1/forecasting/predict/{cattle_id}",
+                "upcoming": "/api/v1/forecasting/upcoming?days=7 (Authorization: Bearer)"
             }
         }
     }
 
 
-@app.get("/health")
-def health_check():
-    return {"status": "healthy", "service": "ml-service"}
+# Métricas (/metrics) y trazas distribuidas
+setup_metrics(app, "ml-service")
+setup_tracing(app, "ml-service")
+instrument_engine(engine)
+instrument_engine(async_engine)
+
+
+# Logging estructurado (JSON, asíncrono y muestreado por petición)
+setup_logging("ml-service", app)
+
+
+# Health checks (readiness cacheada, refrescada en segundo plano)
+probe = ReadinessProbe(service="ml-service")
+probe.add_check("database", sql_check(engine))
+probe.add_check("database_async", async_sql_check(async_engine))
+probe.add_check("forecasting_models", forecasting_readiness)
+app.add_event_handler("startup", probe.start)
+app.add_event_handler("shutdown", probe.stop)
+
+
+# Recálculo en segundo plano de heat_forecasts (celos escritos en core-service y reentrenamientos)
+if settings.forecast_refresh_enabled:
+    refresher = ForecastRefresher()
+    app.add_event_handler("startup", refresher.start)
+    app.add_event_handler("shutdown", refresher.stop)
+
+
+# Logouts de auth-service: tokens revocados antes de su expiración (src/auth/revocations.py)
+app.add_event_handler("startup", revocation_list.start)
+app.add_event_handler("shutdown", revocation_list.stop)
+
+
+# Ejecutores de inferencia y entrenamiento (src/executors.py)
+app.add_event_handler("shutdown", executors.shutdown)
 
 
 # Incluir routers
 app.include_router(clustering_routes.router, prefix="/api/v1")
 app.include_router(forecasting_routes.router, prefix="/api/v1")
+app.include_router(health_router(probe))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+from .jwt_handler import decode_token
+from .auth_bearer import verify_token
+from .dependencies import get_current_user, UserAuth
+
+__all__ = [
+    "decode_token",
+    "verify_token",
+    "get_current_user",
+    "UserAuth"
+]
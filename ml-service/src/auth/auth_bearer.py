@@ -0,0 +1,18 @@
+from fastapi import Security, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from .jwt_handler import decode_token
+
+security = HTTPBearer()
+
+
+def verify_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> dict:
+    """Verifica el token JWT y retorna el payload"""
+    payload = decode_token(credentials.credentials)
+    
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Token inválido o expirado"
+        )
+    
+    return payload
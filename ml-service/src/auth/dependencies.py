@@ -0,0 +1,29 @@
+from fastapi import Depends, HTTPException, status
+from uuid import UUID
+
+from .auth_bearer import verify_token
+
+
+class UserAuth:
+    """Usuario autenticado (el `sub` del token es su id, y el owner_id de su ganado)"""
+    def __init__(self, id: UUID, email: str = ""):
+        self.id = id
+        self.email = email
+
+
+def get_current_user(token_data: dict = Depends(verify_token)) -> UserAuth:
+    """Dependency para obtener el usuario actual desde el token JWT"""
+    user_id = token_data.get("sub")
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token inválido: no contiene user_id"
+        )
+    
+    try:
+        return UserAuth(id=UUID(user_id), email=token_data.get("email", ""))
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token inválido: user_id malformado"
+        )
@@ -0,0 +1,42 @@
+import logging
+import time
+from typing import Optional
+from jose import JWTError, jwt
+
+from src.config import settings
+from .revocations import revocation_list
+
+logger = logging.getLogger(__name__)
+
+
+def decode_token(token: str) -> Optional[dict]:
+    """
+    Decodifica y valida un token JWT de auth-service (misma clave que core-service).
+    Retorna el payload si es válido, None si no lo es
+    """
+    try:
+        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+        
+        exp = payload.get("exp")
+        if exp is None:
+            logger.info("Token sin fecha de expiración")
+            return None
+        
+        if time.time() > exp:
+            logger.info("Token expirado")
+            return None
+        
+        # Revocado con /auth/logout en auth-service
+        jti = payload.get("jti")
+        if jti and revocation_list.is_revoked(jti):
+            logger.info("Token revocado")
+            return None
+        
+        return payload
+    
+    except JWTError as e:
+        logger.info("JWT inválido: %s", e)
+        return None
+    except Exception as e:
+        logger.warning("Error decodificando token: %s", e)
+        return None
@@ -1,4 +1,9 @@
-from sqlalchemy import create_engine
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from src.config import settings
@@ -12,6 +17,21 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Lecturas de las rutas (I/O) sin ocupar hilos: engine async sobre asyncpg.
+# El engine sync queda para entrenamiento y cálculo, que ya corren en sus ejecutores.
+async_engine = create_async_engine(
+    make_url(settings.database_url).set(drivername="postgresql+asyncpg"),
+    pool_pre_ping=True,
+    echo=False
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False
+)
+
 
 def get_db():
     db = SessionLocal()
@@ -19,3 +39,69 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+def stream_frame(
+    db,
+    query,
+    columns: Dict[str, str],
+    params: Optional[Dict[str, Any]] = None,
+    chunk_size: int = 50_000
+) -> pd.DataFrame:
+    """
+    Ejecuta `query` con cursor de servidor (stream_results) y construye el
+    DataFrame columna a columna, en bloques de `chunk_size` filas.
+
+    `columns` mapea el nombre de cada columna (en el orden del SELECT) a su
+    dtype de NumPy: 'float64' (None → NaN), 'int64', 'datetime64[D]' (None → NaT)
+    u 'object' (textos, UUIDs y booleanos con NULL). Nunca existe la lista
+    completa de Rows en memoria: el pico es la matriz final más un bloque.
+    """
+    names = list(columns)
+    chunks: Dict[str, List[np.ndarray]] = {name: [] for name in names}
+
+    for block in _iter_columns(db, query, columns, params, chunk_size):
+        for name in names:
+            chunks[name].append(block[name])
+
+    data = {}
+    for name in names:
+        # Se concatena y libera columna a columna para no duplicar toda la tabla a la vez
+        parts = chunks.pop(name)
+        data[name] = np.concatenate(parts) if parts else np.array([], dtype=columns[name])
+        del parts
+    return pd.DataFrame(data, copy=False)
+
+
+def iter_frames(
+    db,
+    query,
+    columns: Dict[str, str],
+    params: Optional[Dict[str, Any]] = None,
+    chunk_size: int = 50_000
+) -> Iterator[pd.DataFrame]:
+    """Como stream_frame, pero entrega un DataFrame por bloque (memoria acotada a un bloque)"""
+    for block in _iter_columns(db, query, columns, params, chunk_size):
+        yield pd.DataFrame(block, copy=False)
+
+
+def _iter_columns(db, query, columns: Dict[str, str], params, chunk_size: int) -> Iterator[Dict[str, np.ndarray]]:
+    names = list(columns)
+    result = db.execute(
+        query,
+        params or {},
+        execution_options={"stream_results": True, "max_row_buffer": chunk_size}
+    )
+    try:
+        for partition in result.partitions(chunk_size):
+            yield {
+                name: np.array(values, dtype=columns[name])
+                for name, values in zip(names, zip(*partition))
+            }
+    finally:
+        result.close()
@@ -0,0 +1,53 @@
+"""
+Ejecutores dedicados de ml-service.
+
+- inference: predicciones (/forecasting/predict, /clustering). Pocos hilos y
+  modelos con n_jobs=INFERENCE_N_JOBS, para que la latencia sea estable.
+- training: entrenamientos y recálculo masivo de pronósticos, con
+  TRAINING_WORKERS trabajos a la vez y TRAINING_N_JOBS hilos cada uno.
+
+Ninguno de los dos usa el threadpool de uvicorn/anyio, que queda libre para
+atender peticiones aunque haya un entrenamiento en curso.
+"""
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from src.config import settings
+
+
+inference_executor = ThreadPoolExecutor(max_workers=settings.inference_workers, thread_name_prefix="inference")
+training_executor = ThreadPoolExecutor(max_workers=settings.training_workers, thread_name_prefix="training")
+
+
+def training_n_jobs() -> int:
+    """Hilos por entrenamiento: TRAINING_N_JOBS o los núcleos que no reserva la inferencia"""
+    if settings.training_n_jobs > 0:
+        return settings.training_n_jobs
+    reserved = settings.inference_workers * settings.inference_n_jobs
+    return max(1, ((os.cpu_count() or 2) - reserved) // settings.training_workers)
+
+
+async def run_inference(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Ejecuta `fn` en el ejecutor de inferencia (conserva el contexto de trazas)"""
+    return await _run(inference_executor, fn, *args, **kwargs)
+
+
+async def run_training(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Ejecuta `fn` en el ejecutor de entrenamiento (conserva el contexto de trazas)"""
+    return await _run(training_executor, fn, *args, **kwargs)
+
+
+async def _run(executor: ThreadPoolExecutor, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, fn, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+
+def shutdown() -> None:
+    """Detiene ambos ejecutores (sin esperar trabajos pendientes)"""
+    inference_executor.shutdown(wait=False, cancel_futures=True)
+    training_executor.shutdown(wait=False, cancel_futures=True)
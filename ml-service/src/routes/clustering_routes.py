@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Query, status
+from typing import Literal, Optional
 from uuid import UUID
 
-from src.database import get_db
+from src.database import SessionLocal
+from src.executors import run_inference, run_training
 from src.services.clustering_service import ClusteringService
 from src.schemas.clustering_schemas import (
     ClusterPredictionResponse,
@@ -13,21 +14,41 @@ from src.schemas.clustering_schemas import (
 router = APIRouter(prefix="/clustering", tags=["Clustering"])
 
 
+def _with_service(method: str, *args):
+    """Ejecuta un método de ClusteringService con su propia sesión (dentro de un ejecutor)"""
+    db = SessionLocal()
+    try:
+        return getattr(ClusteringService(db), method)(*args)
+    finally:
+        db.close()
+
+
 @router.post(
     "/train",
     response_model=TrainClusteringResponse,
     status_code=status.HTTP_200_OK
 )
-def train_clustering_model(db: Session = Depends(get_db)):
-    """Entrenar modelo de clustering"""
+async def train_clustering_model(
+    source: Optional[Literal["db", "snapshot"]] = Query(
+        None, description="Origen de los datos (defecto: TRAINING_SOURCE). snapshot lee el último Parquet exportado"
+    ),
+    mode: Optional[Literal["full", "minibatch"]] = Query(
+        None, description="full: KMeans en memoria; minibatch: MiniBatchKMeans por bloques (defecto: CLUSTERING_MODE)"
+    ),
+    n_clusters: Optional[int] = Query(
+        None, ge=0, le=20, description="Número de clusters; 0 = elegir por silhouette (defecto: CLUSTERING_N_CLUSTERS)"
+    )
+):
+    """Entrenar modelo de clustering (ejecutor de entrenamiento)"""
     try:
-        service = ClusteringService(db)
-        result = service.train_model()
+        result = await run_training(_with_service, "train_model", source, mode, n_clusters)
         
         return {
             "total_cattle": result["total_cattle"],
             "clusters_created": result["clusters_created"],
             "cluster_distribution": result["cluster_distribution"],
+            "mode": result["mode"],
+            "silhouette_scores": result["silhouette_scores"],
             "message": "Modelo entrenado exitosamente"
         }
     
@@ -48,14 +69,10 @@ def train_clustering_model(db: Session = Depends(get_db)):
     response_model=ClusterPredictionResponse,
     status_code=status.HTTP_200_OK
 )
-def predict_cattle_cluster(
-    cattle_id: UUID,
-    db: Session = Depends(get_db)
-):
-    """Predecir cluster de un ganado específico"""
+async def predict_cattle_cluster(cattle_id: UUID):
+    """Predecir cluster de un ganado específico (ejecutor de inferencia)"""
     try:
-        service = ClusteringService(db)
-        result = service.predict_cluster(cattle_id)
+        result = await run_inference(_with_service, "predict_cluster", cattle_id)
         
         if not result:
             raise HTTPException(
@@ -67,6 +84,11 @@ def predict_cattle_cluster(
     
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -79,13 +101,17 @@ def predict_cattle_cluster(
     response_model=AllClustersResponse,
     status_code=status.HTTP_200_OK
 )
-def get_all_clusters(db: Session = Depends(get_db)):
-    """Obtener clusters de todo el ganado"""
+async def get_all_clusters():
+    """Obtener clusters de todo el ganado (ejecutor de inferencia)"""
     try:
-        service = ClusteringService(db)
-        result = service.get_all_clusters()
+        result = await run_inference(_with_service, "get_all_clusters")
         return result
     
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,27 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Literal, Optional
 from uuid import UUID
 
-from src.database import get_db
+from src.auth import UserAuth, get_current_user
+from src.database import SessionLocal, get_async_db
+from src.executors import run_training
 from src.services.multimodal_forecasting_service import MultimodalForecastingService
+from src.services import forecast_store
+from src.services.predict_batcher import forecast_batcher
 from src.schemas.multimodal_schemas import (
     TrainModelResponse,
-    MultimodalPredictionResponse
+    MultimodalPredictionResponse,
+    UpcomingHeatsResponse
 )
 
 router = APIRouter(prefix="/forecasting", tags=["Multimodal Heat Forecasting"])
 
 
+def _train(source: Optional[str]):
+    db = SessionLocal()
+    try:
+        return MultimodalForecastingService(db).train_models(source)
+    finally:
+        db.close()
+
+
 @router.post(
     "/train",
     response_model=TrainModelResponse,
     status_code=status.HTTP_200_OK
 )
-def train_forecasting_models(db: Session = Depends(get_db)):
-    """Entrenar modelos Random Forest y XGBoost para forecasting"""
+async def train_forecasting_models(
+    source: Optional[Literal["db", "snapshot"]] = Query(
+        None, description="Origen de los datos (defecto: TRAINING_SOURCE). snapshot lee el último Parquet exportado"
+    )
+):
+    """Entrenar modelos Random Forest y XGBoost para forecasting (ejecutor de entrenamiento)"""
     try:
-        service = MultimodalForecastingService(db)
-        result = service.train_models()
+        result = await run_training(_train, source)
         return result
     
     except ValueError as e:
@@ -41,14 +58,10 @@ def train_forecasting_models(db: Session = Depends(get_db)):
     response_model=MultimodalPredictionResponse,
     status_code=status.HTTP_200_OK
 )
-def predict_next_heat(
-    cattle_id: UUID,
-    db: Session = Depends(get_db)
-):
-    """Predecir próximo celo usando ML multimodal"""
+async def predict_next_heat(cattle_id: UUID):
+    """Predecir próximo celo usando ML multimodal (peticiones concurrentes agrupadas en lotes)"""
     try:
-        service = MultimodalForecastingService(db)
-        result = service.predict_next_heat(cattle_id)
+        result = await forecast_batcher.submit(cattle_id)
         
         if not result:
             raise HTTPException(
@@ -70,3 +83,33 @@ def predict_next_heat(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error prediciendo celo: {str(e)}"
         )
+
+
+@router.get(
+    "/upcoming",
+    response_model=UpcomingHeatsResponse,
+    status_code=status.HTTP_200_OK
+)
+async def get_upcoming_heats(
+    days: int = Query(7, ge=0, le=90, description="Horizonte en días desde hoy"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    current_user: UserAuth = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Calendario de celos previstos del rancho del usuario autenticado, ordenado por fecha"""
+    try:
+        total, forecasts = await forecast_store.list_upcoming(db, current_user.id, days, skip, limit)
+        return {
+            "days": days,
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+            "forecasts": forecasts
+        }
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error obteniendo calendario de celos: {str(e)}"
+        )
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Dict
+from typing import Dict, Optional
 
 
 class HealthStats(BaseModel):
@@ -22,6 +22,8 @@ class TrainClusteringResponse(BaseModel):
     total_cattle: int
     clusters_created: int
     cluster_distribution: Dict[int, int]
+    mode: str = "full"
+    silhouette_scores: Optional[Dict[int, float]] = None
     message: str = "Modelo entrenado exitosamente"
 
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 
 
 class TrainModelResponse(BaseModel):
@@ -18,3 +18,23 @@ class MultimodalPredictionResponse(BaseModel):
     days_until_heat: int
     total_heat_records: int
     model_confidence: str
+
+
+class UpcomingHeat(BaseModel):
+    cattle_id: str
+    name: str
+    lote: str
+    last_heat_date: str
+    predicted_next_heat_date: str
+    days_until_heat: int
+    predicted_days_avg: float
+    model_confidence: str
+    stale: bool
+
+
+class UpcomingHeatsResponse(BaseModel):
+    days: int
+    total: int
+    skip: int
+    limit: int
+    forecasts: List[UpcomingHeat]
@@ -1,91 +1,244 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from uuid import UUID
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import pairwise_distances_argmin, silhouette_score
 from sklearn.preprocessing import StandardScaler
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict
+from threadpoolctl import threadpool_limits
+from typing import Optional, Dict, Iterator, Tuple
+
+from bovara_ops import time_inference
+
+from src.config import settings
+from src.database import iter_frames, stream_frame
+from src.executors import training_n_jobs
+from src.services import model_store, snapshot_store
+
+
+HEALTH_STATS_COLUMNS = {
+    'cattle_id': 'object',
+    'name': 'object',
+    'lote': 'object',
+    'total_eventos': 'int64',
+    'total_vacunas': 'int64',
+    'total_tratamientos': 'int64',
+    'total_enfermedades': 'int64',
+}
+
+FEATURE_COLUMNS = ['total_eventos', 'total_vacunas', 'total_tratamientos', 'total_enfermedades']
+
+# Animales sin eventos no tienen fila en cattle_health_stats
+HEALTH_FEATURES_SELECT = """
+    COALESCE(hs.total_eventos, 0) as total_eventos,
+    COALESCE(hs.total_vacunas, 0) as total_vacunas,
+    COALESCE(hs.total_tratamientos, 0) as total_tratamientos,
+    COALESCE(hs.total_enfermedades, 0) as total_enfermedades
+"""
+
+HEALTH_STATS_SELECT = f"""
+    c.id as cattle_id,
+    c.name,
+    c.lote,
+    {HEALTH_FEATURES_SELECT}
+"""
+
+# Contadores mantenidos por core-service (cattle_health_stats): sin GROUP BY sobre health_events
+HEALTH_STATS_QUERY = text(f"""
+    SELECT {HEALTH_STATS_SELECT}
+    FROM cattle c
+    LEFT JOIN cattle_health_stats hs ON hs.cattle_id = c.id
+""")
+
+HEALTH_FEATURES_QUERY = text(f"""
+    SELECT {HEALTH_FEATURES_SELECT}
+    FROM cattle c
+    LEFT JOIN cattle_health_stats hs ON hs.cattle_id = c.id
+""")
+
+# Contadores de un animal. cattle_id se enlaza como UUID nativo, igual que
+# HEAT_HISTORY_BY_CATTLE_QUERY, para buscar por las PK de cattle y cattle_health_stats
+HEALTH_STATS_BY_CATTLE_QUERY = text(f"""
+    SELECT {HEALTH_STATS_SELECT}
+    FROM cattle c
+    LEFT JOIN cattle_health_stats hs ON hs.cattle_id = c.id
+    WHERE c.id = :cattle_id
+""").bindparams(bindparam("cattle_id", type_=PG_UUID(as_uuid=True)))
 
 
 class ClusteringService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, n_clusters: Optional[int] = None):
         self.db = db
-        self.n_clusters = 4
+        # 0 = elegir k por silhouette al entrenar
+        self.n_clusters = settings.clustering_n_clusters if n_clusters is None else n_clusters
         self.kmeans = None
         self.scaler = StandardScaler()
     
-    def _get_health_stats(self) -> pd.DataFrame:
-        query = text("""
-            SELECT 
-                c.id as cattle_id,
-                c.name,
-                c.lote,
-                COUNT(he.id) as total_eventos,
-                COUNT(CASE WHEN he.event_type = 'vaccine' THEN 1 END) as total_vacunas,
-                COUNT(CASE WHEN he.event_type = 'treatment' THEN 1 END) as total_tratamientos,
-                COUNT(CASE WHEN he.event_type = 'illness' THEN 1 END) as total_enfermedades
-            FROM cattle c
-            LEFT JOIN health_events he ON c.id = he.cattle_id
-            GROUP BY c.id, c.name, c.lote
-        """)
-        
-        result = self.db.execute(query)
-        data = result.fetchall()
-        
-        df = pd.DataFrame(data, columns=[
-            'cattle_id', 'name', 'lote', 
-            'total_eventos', 'total_vacunas', 
-            'total_tratamientos', 'total_enfermedades'
-        ])
-        
-        return df
+    def _get_health_stats(self, source: Optional[str] = None) -> pd.DataFrame:
+        if (source or settings.training_source) == "snapshot":
+            return snapshot_store.read_health_stats()
+        
+        return stream_frame(self.db, HEALTH_STATS_QUERY, HEALTH_STATS_COLUMNS)
     
-    def train_model(self) -> Dict:
-        df = self._get_health_stats()
+    def _iter_features(self, source: Optional[str] = None) -> Iterator[np.ndarray]:
+        """Matriz de features por bloques de clustering_chunk_size filas"""
+        chunk_size = settings.clustering_chunk_size
+        
+        if (source or settings.training_source) == "snapshot":
+            features = snapshot_store.read_health_stats()[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+            for start in range(0, len(features), chunk_size):
+                yield features[start:start + chunk_size]
+            return
+        
+        columns = {name: 'int64' for name in FEATURE_COLUMNS}
+        for chunk in iter_frames(self.db, HEALTH_FEATURES_QUERY, columns, chunk_size=chunk_size):
+            yield chunk.to_numpy(dtype=np.float64)
+    
+    def _select_k(self, sample: np.ndarray) -> Tuple[int, Dict[int, float]]:
+        """Elegir k en [clustering_k_min, clustering_k_max] por silhouette sobre una muestra escalada"""
+        scores = {}
+        for k in range(settings.clustering_k_min, settings.clustering_k_max + 1):
+            if k >= len(sample):
+                break
+            labels = MiniBatchKMeans(n_clusters=k, random_state=42, n_init=3).fit_predict(sample)
+            if len(np.unique(labels)) < 2:
+                continue
+            scores[k] = round(float(silhouette_score(sample, labels)), 4)
+        
+        if not scores:
+            raise ValueError("No se pudo elegir el número de clusters: los datos no forman grupos distintos")
+        return max(scores, key=scores.get), scores
+    
+    def train_model(
+        self,
+        source: Optional[str] = None,
+        mode: Optional[str] = None,
+        n_clusters: Optional[int] = None
+    ) -> Dict:
+        if n_clusters is not None:
+            self.n_clusters = n_clusters
+        
+        # KMeans no tiene n_jobs: sus hilos OpenMP se limitan a los de entrenamiento
+        with threadpool_limits(limits=training_n_jobs(), user_api="openmp"):
+            if (mode or settings.clustering_mode) == "minibatch":
+                result = self._train_minibatch(source)
+            else:
+                result = self._train_full(source)
+        
+        model_store.set_clustering_artifacts({"kmeans": self.kmeans, "scaler": self.scaler})
+        return result
+    
+    def _load_model(self) -> None:
+        """Modelo entrenado por /clustering/train (ver model_store); aquí nunca se entrena"""
+        artifacts = model_store.get_clustering_artifacts()
+        self.kmeans = artifacts["kmeans"]
+        self.scaler = artifacts["scaler"]
+    
+    def _train_full(self, source: Optional[str] = None) -> Dict:
+        """KMeans en memoria sobre todo el hato"""
+        df = self._get_health_stats(source)
         
         if len(df) < 10:
             raise ValueError("Necesitas al menos 10 registros de ganado para clustering")
         
-        features = df[['total_eventos', 'total_vacunas', 'total_tratamientos', 'total_enfermedades']].values
+        features = df[FEATURE_COLUMNS].values
         features_scaled = self.scaler.fit_transform(features)
         
+        silhouette_scores = None
+        if self.n_clusters == 0:
+            rng = np.random.default_rng(42)
+            size = min(len(features_scaled), settings.clustering_sample_size)
+            sample = features_scaled[rng.choice(len(features_scaled), size, replace=False)]
+            self.n_clusters, silhouette_scores = self._select_k(sample)
+        
         self.kmeans = KMeans(n_clusters=self.n_clusters, random_state=42, n_init=10)
         df['cluster'] = self.kmeans.fit_predict(features_scaled)
         
-        cluster_stats = df.groupby('cluster')[['total_eventos', 'total_vacunas', 'total_tratamientos', 'total_enfermedades']].mean()
+        cluster_stats = df.groupby('cluster')[FEATURE_COLUMNS].mean()
         
         return {
             "total_cattle": len(df),
             "clusters_created": self.n_clusters,
             "cluster_distribution": df['cluster'].value_counts().to_dict(),
-            "cluster_stats": cluster_stats.to_dict()
+            "cluster_stats": cluster_stats.to_dict(),
+            "mode": "full",
+            "silhouette_scores": silhouette_scores
+        }
+    
+    def _train_minibatch(self, source: Optional[str] = None) -> Dict:
+        """
+        Entrenamiento por bloques con memoria acotada (un bloque + la muestra):
+        1. StandardScaler.partial_fit y muestra uniforme (bottom-k sobre claves aleatorias)
+        2. Centros iniciales con KMeans sobre la muestra (y k por silhouette si n_clusters=0)
+        3. MiniBatchKMeans.partial_fit bloque a bloque
+        4. Distribución y medias por cluster con el modelo final
+        """
+        rng = np.random.default_rng(42)
+        sample_size = settings.clustering_sample_size
+        sample = np.empty((0, len(FEATURE_COLUMNS)))
+        keys = np.empty(0)
+        total = 0
+        
+        for features in self._iter_features(source):
+            self.scaler.partial_fit(features)
+            total += len(features)
+            sample = np.vstack([sample, features])
+            keys = np.concatenate([keys, rng.random(len(features))])
+            if len(keys) > sample_size:
+                keep = np.argpartition(keys, sample_size)[:sample_size]
+                sample, keys = sample[keep], keys[keep]
+        
+        if total < 10:
+            raise ValueError("Necesitas al menos 10 registros de ganado para clustering")
+        
+        sample_scaled = self.scaler.transform(sample)
+        silhouette_scores = None
+        if self.n_clusters == 0:
+            self.n_clusters, silhouette_scores = self._select_k(sample_scaled)
+        
+        seed_model = KMeans(n_clusters=self.n_clusters, random_state=42, n_init=10).fit(sample_scaled)
+        self.kmeans = MiniBatchKMeans(
+            n_clusters=self.n_clusters,
+            init=seed_model.cluster_centers_,
+            n_init=1,
+            random_state=42
+        )
+        for features in self._iter_features(source):
+            self.kmeans.partial_fit(self.scaler.transform(features))
+        
+        counts = np.zeros(self.n_clusters, dtype=np.int64)
+        sums = np.zeros((self.n_clusters, len(FEATURE_COLUMNS)))
+        for features in self._iter_features(source):
+            labels = self.kmeans.predict(self.scaler.transform(features))
+            counts += np.bincount(labels, minlength=self.n_clusters)
+            np.add.at(sums, labels, features)
+        
+        populated = np.flatnonzero(counts)
+        means = sums[populated] / counts[populated, None]
+        
+        return {
+            "total_cattle": total,
+            "clusters_created": self.n_clusters,
+            "cluster_distribution": {int(c): int(counts[c]) for c in populated},
+            "cluster_stats": {
+                column: {int(c): float(means[i, j]) for i, c in enumerate(populated)}
+                for j, column in enumerate(FEATURE_COLUMNS)
+            },
+            "mode": "minibatch",
+            "silhouette_scores": silhouette_scores
         }
     
     def predict_cluster(self, cattle_id: UUID) -> Optional[Dict]:
-        query = text("""
-            SELECT 
-                c.id as cattle_id,
-                c.name,
-                c.lote,
-                COUNT(he.id) as total_eventos,
-                COUNT(CASE WHEN he.event_type = 'vaccine' THEN 1 END) as total_vacunas,
-                COUNT(CASE WHEN he.event_type = 'treatment' THEN 1 END) as total_tratamientos,
-                COUNT(CASE WHEN he.event_type = 'illness' THEN 1 END) as total_enfermedades
-            FROM cattle c
-            LEFT JOIN health_events he ON c.id = he.cattle_id
-            WHERE c.id = :cattle_id
-            GROUP BY c.id, c.name, c.lote
-        """)
-        
-        result = self.db.execute(query, {"cattle_id": str(cattle_id)})
+        result = self.db.execute(HEALTH_STATS_BY_CATTLE_QUERY, {"cattle_id": cattle_id})
         data = result.fetchone()
         
         if not data:
             return None
         
         if self.kmeans is None:
-            self.train_model()
+            self._load_model()
         
         features = np.array([[
             data.total_eventos,
@@ -94,8 +247,9 @@ class ClusteringService:
             data.total_enfermedades
         ]])
         
-        features_scaled = self.scaler.transform(features)
-        cluster = int(self.kmeans.predict(features_scaled)[0])
+        with time_inference("clustering"):
+            features_scaled = self.scaler.transform(features)
+            cluster = int(self._assign_clusters(features_scaled)[0])
         
         cluster_label = self._get_cluster_label(
             data.total_eventos,
@@ -118,6 +272,15 @@ class ClusteringService:
             }
         }
     
+    def _assign_clusters(self, features_scaled: np.ndarray) -> np.ndarray:
+        """
+        Centro más cercano de cada fila (lo mismo que kmeans.predict) con los hilos de
+        inferencia. KMeans.predict usa los hilos OpenMP fijados al entrenar e ignora
+        threadpool_limits; pairwise_distances_argmin sí lo respeta.
+        """
+        with threadpool_limits(limits=settings.inference_n_jobs):
+            return pairwise_distances_argmin(features_scaled, self.kmeans.cluster_centers_)
+    
     def _get_cluster_label(self, eventos: int, vacunas: int, tratamientos: int, enfermedades: int) -> str:
         if eventos <= 1:
             return "Ganado Sano"
@@ -131,14 +294,15 @@ class ClusteringService:
             return "Mantenimiento Regular"
     
     def get_all_clusters(self) -> Dict:
-        df = self._get_health_stats()
-        
         if self.kmeans is None:
-            self.train_model()
+            self._load_model()
+        
+        df = self._get_health_stats()
         
-        features = df[['total_eventos', 'total_vacunas', 'total_tratamientos', 'total_enfermedades']].values
-        features_scaled = self.scaler.transform(features)
-        df['cluster'] = self.kmeans.predict(features_scaled)
+        features = df[FEATURE_COLUMNS].values
+        with time_inference("clustering_batch"):
+            features_scaled = self.scaler.transform(features)
+            df['cluster'] = self._assign_clusters(features_scaled)
         
         df['cluster_type'] = df.apply(
             lambda row: self._get_cluster_label(
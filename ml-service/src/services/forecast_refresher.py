@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from typing import Optional
+
+from src.config import settings
+from src.database import SessionLocal
+from src.executors import run_training
+from src.services import forecast_store
+from src.services.multimodal_forecasting_service import MultimodalForecastingService
+
+
+logger = logging.getLogger(__name__)
+
+
+class ForecastRefresher:
+    """Recalcula en segundo plano los pronósticos marcados como stale en heat_forecasts"""
+
+    def __init__(
+        self,
+        interval: float = settings.forecast_refresh_interval,
+        batch_size: int = settings.forecast_refresh_batch,
+        lease: float = settings.forecast_refresh_lease
+    ):
+        self._interval = interval
+        self._batch_size = batch_size
+        self._lease = lease
+        self._task: Optional[asyncio.Task] = None
+
+    def run_once(self) -> int:
+        """
+        Recalcula un lote de pendientes; devuelve cuántas vacas tomó. La reserva y el
+        guardado son transacciones cortas: el cálculo no retiene bloqueos de fila.
+        """
+        db = SessionLocal()
+        try:
+            revisions = forecast_store.claim_stale(db, self._batch_size, self._lease)
+            db.commit()
+            if revisions:
+                saved = MultimodalForecastingService(db).refresh_forecasts(revisions)
+                forecast_store.release_claims(db, list(revisions))
+                db.commit()
+                logger.info(
+                    "heat_forecasts recalculados",
+                    extra={"claimed": len(revisions), "saved": saved}
+                )
+            return len(revisions)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                # Trabajo por lotes: ejecutor de entrenamiento, no compite con /predict
+                claimed = await run_training(self.run_once)
+            except ValueError as e:
+                # Modelos aún no entrenados: se reintenta en el siguiente ciclo
+                logger.debug("Refresco de pronósticos en espera: %s", e)
+                claimed = 0
+            except Exception:
+                logger.exception("Error recalculando heat_forecasts")
+                claimed = 0
+            # Lote lleno: probablemente quedan más (p. ej. tras reentrenar), seguir sin esperar
+            if claimed < self._batch_size:
+                await asyncio.sleep(self._interval)
+
+    async def start(self) -> None:
+        """Lanza la tarea de refresco en segundo plano"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Detiene la tarea de refresco"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,253 @@
+"""
+Pronósticos de celo precalculados (tabla heat_forecasts, migración 8a2f6d1c0b37
+de core-service).
+
+core-service marca una vaca como `stale` al escribir sus celos; ForecastRefresher
+(src/services/forecast_refresher.py) recalcula las filas `stale` por lotes y
+/forecasting/predict lee la fila por PK. Tras reentrenar se invalidan todas.
+
+Los pronósticos se calculan sin bloquear filas: cada invalidación incrementa
+`revision`, el cálculo lee la revisión antes que el historial y el upsert solo
+escribe si no ha cambiado. Un celo escrito durante el cálculo deja la fila `stale`
+para el siguiente ciclo en lugar de esperar a que termine.
+"""
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import pandas as pd
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+GET_FORECASTS = text("""
+    SELECT
+        cattle_id, last_heat_date, predicted_date,
+        predicted_days_rf, predicted_days_xgb, predicted_days_avg,
+        model_confidence, total_heat_records, model_version, error, stale
+    FROM heat_forecasts
+    WHERE cattle_id = ANY(:cattle_ids)
+""").bindparams(bindparam("cattle_ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+
+# Toma un lote de pendientes y lo reserva (claimed_at) en una transacción corta; SKIP LOCKED
+# y la reserva reparten el trabajo entre procesos. Una reserva de un proceso caído caduca
+# tras `lease` segundos. Devuelve la revisión con la que se hará el upsert condicional.
+CLAIM_STALE = text("""
+    UPDATE heat_forecasts f
+    SET claimed_at = now()
+    FROM (
+        SELECT cattle_id
+        FROM heat_forecasts
+        WHERE stale IS true
+          AND (claimed_at IS NULL OR claimed_at < now() - make_interval(secs => :lease))
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+    ) pending
+    WHERE f.cattle_id = pending.cattle_id
+    RETURNING f.cattle_id, f.revision
+""")
+
+# Reservas del lote que el upsert no liberó (la vaca cambió durante el cálculo)
+RELEASE_CLAIMS = text("""
+    UPDATE heat_forecasts
+    SET claimed_at = NULL
+    WHERE cattle_id = ANY(:cattle_ids) AND claimed_at IS NOT NULL
+""").bindparams(bindparam("cattle_ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+
+# Cálculo bajo demanda (/predict): crea la fila si falta para que toda invalidación
+# posterior de core-service incremente una revisión ya leída
+ENSURE_FORECAST_ROWS = text("""
+    INSERT INTO heat_forecasts (cattle_id, owner_id, stale)
+    SELECT c.id, c.owner_id, true
+    FROM cattle c
+    WHERE c.id = ANY(:cattle_ids)
+    ORDER BY c.id
+    ON CONFLICT (cattle_id) DO NOTHING
+""").bindparams(bindparam("cattle_ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+
+GET_REVISIONS = text("""
+    SELECT cattle_id, revision
+    FROM heat_forecasts
+    WHERE cattle_id = ANY(:cattle_ids)
+""").bindparams(bindparam("cattle_ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+
+INVALIDATE_ALL = text("""
+    INSERT INTO heat_forecasts (cattle_id, owner_id, stale)
+    SELECT c.id, c.owner_id, true
+    FROM cattle c
+    WHERE c.gender = 'female'
+      AND EXISTS (SELECT 1 FROM heat_events he WHERE he.cattle_id = c.id)
+    ON CONFLICT (cattle_id) DO UPDATE SET stale = true, revision = heat_forecasts.revision + 1
+""")
+
+# Un solo INSERT para todo el lote (arrays paralelos + unnest). Solo pisa las filas cuya
+# revisión sigue siendo la leída antes del cálculo; las demás quedan stale.
+UPSERT_FORECASTS = text("""
+    INSERT INTO heat_forecasts (
+        cattle_id, owner_id, last_heat_date, predicted_date,
+        predicted_days_rf, predicted_days_xgb, predicted_days_avg,
+        model_confidence, total_heat_records, model_version, error, stale, computed_at, revision
+    )
+    SELECT
+        c.id, c.owner_id, f.last_heat_date, f.predicted_date,
+        f.predicted_days_rf, f.predicted_days_xgb, f.predicted_days_avg,
+        f.model_confidence, f.total_heat_records, :model_version, f.error, false, now(), f.revision
+    FROM unnest(
+        CAST(:cattle_ids AS uuid[]),
+        CAST(:last_heat_dates AS date[]),
+        CAST(:predicted_dates AS date[]),
+        CAST(:predicted_days_rf AS float8[]),
+        CAST(:predicted_days_xgb AS float8[]),
+        CAST(:predicted_days_avg AS float8[]),
+        CAST(:model_confidences AS text[]),
+        CAST(:total_heat_records AS int[]),
+        CAST(:errors AS text[]),
+        CAST(:revisions AS bigint[])
+    ) AS f(
+        cattle_id, last_heat_date, predicted_date,
+        predicted_days_rf, predicted_days_xgb, predicted_days_avg,
+        model_confidence, total_heat_records, error, revision
+    )
+    JOIN cattle c ON c.id = f.cattle_id
+    ON CONFLICT (cattle_id) DO UPDATE SET
+        last_heat_date = EXCLUDED.last_heat_date,
+        predicted_date = EXCLUDED.predicted_date,
+        predicted_days_rf = EXCLUDED.predicted_days_rf,
+        predicted_days_xgb = EXCLUDED.predicted_days_xgb,
+        predicted_days_avg = EXCLUDED.predicted_days_avg,
+        model_confidence = EXCLUDED.model_confidence,
+        total_heat_records = EXCLUDED.total_heat_records,
+        model_version = EXCLUDED.model_version,
+        error = EXCLUDED.error,
+        stale = false,
+        computed_at = EXCLUDED.computed_at,
+        claimed_at = NULL
+    WHERE heat_forecasts.revision = EXCLUDED.revision
+""")
+
+
+# Calendario de un rancho: rango sobre ix_heat_forecasts_owner_id_predicted_date.
+# Las filas stale se sirven igualmente (último pronóstico conocido) y se marcan como tales.
+UPCOMING_FILTER = """
+    WHERE f.predicted_date BETWEEN :start AND :end
+      AND f.error IS NULL
+      AND f.owner_id = :owner_id
+"""
+
+# Sin JOIN a cattle: la FK (ON DELETE CASCADE) garantiza que cada fila tiene su vaca
+COUNT_UPCOMING = text(f"SELECT COUNT(*) FROM heat_forecasts f {UPCOMING_FILTER}")
+
+LIST_UPCOMING = text(f"""
+    SELECT
+        f.cattle_id, c.name, c.lote, f.last_heat_date, f.predicted_date,
+        f.predicted_days_avg, f.model_confidence, f.stale
+    FROM heat_forecasts f
+    JOIN cattle c ON c.id = f.cattle_id
+    {UPCOMING_FILTER}
+    ORDER BY f.predicted_date, f.cattle_id
+    LIMIT :limit OFFSET :skip
+""")
+
+
+def get_forecasts(db: Session, cattle_ids: List[UUID]) -> List:
+    """Filas de heat_forecasts de varias vacas (las que existan)"""
+    return db.execute(GET_FORECASTS, {"cattle_ids": list(cattle_ids)}).fetchall()
+
+
+async def get_forecasts_async(db: AsyncSession, cattle_ids: List[UUID]) -> List:
+    """Como get_forecasts, con la sesión async de las rutas"""
+    return (await db.execute(GET_FORECASTS, {"cattle_ids": list(cattle_ids)})).fetchall()
+
+
+def claim_stale(db: Session, limit: int, lease: float) -> Dict[UUID, int]:
+    """Reserva hasta `limit` vacas con pronóstico pendiente; devuelve su revisión. No hace commit"""
+    return {row.cattle_id: row.revision for row in db.execute(CLAIM_STALE, {"limit": limit, "lease": lease})}
+
+
+def release_claims(db: Session, cattle_ids: List[UUID]) -> None:
+    """Libera las reservas que sigan puestas (vacas invalidadas durante el cálculo)"""
+    db.execute(RELEASE_CLAIMS, {"cattle_ids": list(cattle_ids)})
+
+
+def get_revisions(db: Session, cattle_ids: List[UUID]) -> Dict[UUID, int]:
+    """Crea (si faltan) las filas de estas vacas y devuelve su revisión. No hace commit"""
+    params = {"cattle_ids": list(cattle_ids)}
+    db.execute(ENSURE_FORECAST_ROWS, params)
+    return {row.cattle_id: row.revision for row in db.execute(GET_REVISIONS, params)}
+
+
+def invalidate_all(db: Session) -> None:
+    """Marca para recálculo a todas las hembras con celos (tras reentrenar)"""
+    db.execute(INVALIDATE_ALL)
+
+
+def save_forecasts(
+    db: Session,
+    forecasts: pd.DataFrame,
+    model_version: str,
+    revisions: Dict[UUID, int],
+    errors: Optional[Dict[UUID, str]] = None
+) -> int:
+    """
+    Guarda los pronósticos (salida de MultimodalForecastingService._forecast_frame)
+    y, para las vacas en `errors`, el motivo por el que no se pudieron calcular.
+    Solo escribe las vacas cuya revisión sigue siendo la de `revisions`; devuelve
+    cuántas filas escribió. No hace commit.
+    """
+    errors = errors or {}
+    if forecasts.empty and not errors:
+        return 0
+
+    revision_by_id = {str(cattle_id): revision for cattle_id, revision in revisions.items()}
+    cattle_ids = [str(c) for c in forecasts['cattle_id']] + [str(c) for c in errors]
+
+    n_errors = len(errors)
+    params = {
+        "model_version": model_version,
+        "cattle_ids": cattle_ids,
+        "last_heat_dates": [d.date() for d in forecasts['last_heat_date']] + [None] * n_errors,
+        "predicted_dates": [d.date() for d in forecasts['predicted_date']] + [None] * n_errors,
+        "predicted_days_rf": forecasts['predicted_days_rf'].tolist() + [None] * n_errors,
+        "predicted_days_xgb": forecasts['predicted_days_xgb'].tolist() + [None] * n_errors,
+        "predicted_days_avg": forecasts['predicted_days_avg'].tolist() + [None] * n_errors,
+        "model_confidences": forecasts['model_confidence'].tolist() + [None] * n_errors,
+        "total_heat_records": [int(n) for n in forecasts['total_heat_records']] + [None] * n_errors,
+        "errors": [None] * len(forecasts) + list(errors.values()),
+        "revisions": [revision_by_id[cattle_id] for cattle_id in cattle_ids],
+    }
+    return db.execute(UPSERT_FORECASTS, params).rowcount
+
+
+async def list_upcoming(
+    db: AsyncSession,
+    owner_id: UUID,
+    days: int,
+    skip: int = 0,
+    limit: int = 100
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Vacas del rancho con celo previsto entre hoy y hoy + `days`, por fecha; devuelve (total, página)"""
+    today = date.today()
+    params = {
+        "start": today,
+        "end": today + timedelta(days=days),
+        "owner_id": owner_id,
+    }
+    total = (await db.execute(COUNT_UPCOMING, params)).scalar_one()
+    rows = (await db.execute(LIST_UPCOMING, {**params, "skip": skip, "limit": limit})).fetchall()
+
+    return total, [
+        {
+            "cattle_id": str(row.cattle_id),
+            "name": row.name,
+            "lote": row.lote,
+            "last_heat_date": str(row.last_heat_date),
+            "predicted_next_heat_date": str(row.predicted_date),
+            "days_until_heat": (row.predicted_date - today).days,
+            "predicted_days_avg": row.predicted_days_avg,
+            "model_confidence": row.model_confidence,
+            "stale": row.stale,
+        }
+        for row in rows
+    ]
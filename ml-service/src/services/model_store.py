@@ -0,0 +1,162 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional
+import logging
+import joblib
+
+from src.config import settings
+from src.services.onnx_models import ONNX_ARTIFACTS, OnnxRegressor
+
+
+logger = logging.getLogger(__name__)
+
+
+MODEL_PATH = Path("models")
+
+FORECASTING_ARTIFACTS = {
+    "rf_model": "rf_model.pkl",
+    "xgb_model": "xgb_model.pkl",
+    "label_encoders": "label_encoders.pkl",
+    "feature_columns": "feature_columns.pkl",
+}
+
+CLUSTERING_ARTIFACTS = {
+    "kmeans": "kmeans_model.pkl",
+    "scaler": "kmeans_scaler.pkl",
+}
+
+_lock = Lock()
+_forecasting: Optional[Dict[str, Any]] = None
+_forecasting_mtime: Optional[float] = None
+_onnx: Optional[Dict[str, Any]] = None
+_onnx_mtime: Optional[float] = None
+_clustering: Optional[Dict[str, Any]] = None
+_clustering_mtime: Optional[float] = None
+
+
+def _for_inference(artifacts: Dict[str, Any]) -> Dict[str, Any]:
+    """Limita los hilos por predicción (se entrenan con n_jobs de entrenamiento)"""
+    artifacts["rf_model"].n_jobs = settings.inference_n_jobs
+    artifacts["xgb_model"].set_params(n_jobs=settings.inference_n_jobs)
+    return artifacts
+
+
+def _artifacts_mtime(artifacts: Dict[str, str] = FORECASTING_ARTIFACTS) -> Optional[float]:
+    """Última modificación de los artefactos, o None si falta alguno"""
+    paths = [MODEL_PATH / name for name in artifacts.values()]
+    if not all(path.exists() for path in paths):
+        return None
+    return max(path.stat().st_mtime for path in paths)
+
+
+def get_forecasting_artifacts() -> Dict[str, Any]:
+    """
+    Artefactos de forecasting cargados una vez por proceso.
+    Se recargan si los archivos cambian en disco (p. ej. tras /train).
+    """
+    global _forecasting, _forecasting_mtime
+    
+    mtime = _artifacts_mtime()
+    if mtime is None:
+        raise ValueError("Modelos no entrenados. Ejecutar /train primero")
+    
+    if _forecasting is None or mtime != _forecasting_mtime:
+        with _lock:
+            if _forecasting is None or mtime != _forecasting_mtime:
+                _forecasting = _for_inference({
+                    key: joblib.load(MODEL_PATH / name)
+                    for key, name in FORECASTING_ARTIFACTS.items()
+                })
+                _forecasting_mtime = mtime
+    
+    return _forecasting
+
+
+def set_forecasting_artifacts(artifacts: Dict[str, Any]) -> None:
+    """Guarda los artefactos en disco y los publica en memoria"""
+    global _forecasting, _forecasting_mtime
+    
+    MODEL_PATH.mkdir(exist_ok=True)
+    with _lock:
+        for key, name in FORECASTING_ARTIFACTS.items():
+            joblib.dump(artifacts[key], MODEL_PATH / name)
+        _forecasting = _for_inference(dict(artifacts))
+        _forecasting_mtime = _artifacts_mtime()
+
+
+def get_clustering_artifacts() -> Dict[str, Any]:
+    """KMeans y escalador de clustering, cargados una vez por proceso (como los de forecasting)"""
+    global _clustering, _clustering_mtime
+    
+    mtime = _artifacts_mtime(CLUSTERING_ARTIFACTS)
+    if mtime is None:
+        raise ValueError("Modelo de clustering no entrenado. Ejecutar /clustering/train primero")
+    
+    if _clustering is None or mtime != _clustering_mtime:
+        with _lock:
+            if _clustering is None or mtime != _clustering_mtime:
+                _clustering = {
+                    key: joblib.load(MODEL_PATH / name)
+                    for key, name in CLUSTERING_ARTIFACTS.items()
+                }
+                _clustering_mtime = mtime
+    
+    return _clustering
+
+
+def set_clustering_artifacts(artifacts: Dict[str, Any]) -> None:
+    """Guarda KMeans y escalador en disco y los publica en memoria"""
+    global _clustering, _clustering_mtime
+    
+    MODEL_PATH.mkdir(exist_ok=True)
+    with _lock:
+        for key, name in CLUSTERING_ARTIFACTS.items():
+            joblib.dump(artifacts[key], MODEL_PATH / name)
+        _clustering = dict(artifacts)
+        _clustering_mtime = _artifacts_mtime(CLUSTERING_ARTIFACTS)
+
+
+def get_inference_models() -> Dict[str, Any]:
+    """
+    Modelos RF / XGBoost para predecir, según INFERENCE_BACKEND: los nativos o
+    sus versiones ONNX. Si faltan los .onnx o son anteriores al último
+    entrenamiento (export_onnx.py no se volvió a ejecutar), se usan los nativos.
+    """
+    global _onnx, _onnx_mtime
+    
+    artifacts = get_forecasting_artifacts()
+    native = {"rf_model": artifacts["rf_model"], "xgb_model": artifacts["xgb_model"]}
+    if settings.inference_backend != "onnx":
+        return native
+    
+    paths = [MODEL_PATH / name for name in ONNX_ARTIFACTS.values()]
+    if not all(path.exists() for path in paths) or min(path.stat().st_mtime for path in paths) < _forecasting_mtime:
+        if _onnx_mtime != -1:
+            logger.warning("Modelos ONNX ausentes o desactualizados; se usa la inferencia nativa")
+            _onnx, _onnx_mtime = None, -1
+        return native
+    
+    mtime = max(path.stat().st_mtime for path in paths)
+    if _onnx is None or mtime != _onnx_mtime:
+        with _lock:
+            if _onnx is None or mtime != _onnx_mtime:
+                _onnx = {
+                    key: OnnxRegressor(MODEL_PATH / name, settings.onnx_threads)
+                    for key, name in ONNX_ARTIFACTS.items()
+                }
+                _onnx_mtime = mtime
+    
+    return _onnx
+
+
+def forecasting_version() -> str:
+    """Versión de los artefactos en memoria: instante (UTC) de su última escritura"""
+    get_forecasting_artifacts()
+    return datetime.fromtimestamp(_forecasting_mtime, timezone.utc).strftime("%Y%m%dT%H%M%S.%f")
+
+
+def forecasting_readiness() -> Dict[str, Any]:
+    """Check de readiness: los artefactos existen y están cargados en memoria"""
+    get_forecasting_artifacts()
+    return {"artifacts": sorted(FORECASTING_ARTIFACTS)}
@@ -1,15 +1,107 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import text, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from uuid import UUID
 from datetime import datetime, timedelta, date
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple, Union
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import LabelEncoder
 import xgboost as xgb
-import joblib
 from pathlib import Path
+import logging
+
+from bovara_ops import time_inference
+
+from src.config import settings
+from src.database import stream_frame
+from src.executors import training_n_jobs
+from src.services import forecast_store, model_store, onnx_models, snapshot_store
+
+
+logger = logging.getLogger(__name__)
+
+
+# Historial de celos de una vaca con sus datos base. cattle_id se enlaza como
+# UUID nativo para que el planner use la PK de cattle y
+# ix_heat_events_cattle_id_heat_date (un cast ::text forzaría seq scan).
+HEAT_HISTORY_BY_CATTLE_QUERY = text("""
+    SELECT
+        he.id,
+        c.id AS cattle_id,
+        he.heat_date,
+        he.allows_mounting,
+        he.vaginal_discharge,
+        he.vulva_swelling,
+        he.comportamiento,
+        he.was_inseminated,
+        he.pregnancy_confirmed,
+        c.birth_date,
+        c.weight,
+        c.fecha_ultimo_parto,
+        c.breed,
+        c.gender
+    FROM cattle c
+    LEFT JOIN heat_events he ON he.cattle_id = c.id
+    WHERE c.id = :cattle_id
+    ORDER BY he.heat_date
+""").bindparams(bindparam("cattle_id", type_=PG_UUID(as_uuid=True)))
+
+
+CATTLE_GENDER_QUERY = text("""
+    SELECT id, gender FROM cattle WHERE id = ANY(:cattle_ids)
+""").bindparams(bindparam("cattle_ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+
+
+# Columnas de _forecast_frame (y de heat_forecasts)
+FORECAST_COLUMNS = [
+    'cattle_id', 'last_heat_date', 'predicted_date', 'predicted_days_rf',
+    'predicted_days_xgb', 'predicted_days_avg', 'model_confidence', 'total_heat_records'
+]
+
+
+# Historial de un lote de vacas (recálculo de heat_forecasts), mismas columnas que el entrenamiento
+HEAT_HISTORY_BY_CATTLE_IDS_QUERY = text("""
+    SELECT
+        he.id,
+        he.cattle_id,
+        he.heat_date,
+        he.allows_mounting,
+        he.vaginal_discharge,
+        he.vulva_swelling,
+        he.comportamiento,
+        he.was_inseminated,
+        he.pregnancy_confirmed,
+        c.birth_date,
+        c.weight,
+        c.fecha_ultimo_parto,
+        c.breed
+    FROM heat_events he
+    JOIN cattle c ON he.cattle_id = c.id
+    WHERE c.gender = 'female'
+      AND c.id = ANY(:cattle_ids)
+      AND he.cattle_id = ANY(:cattle_ids)
+    ORDER BY he.cattle_id, he.heat_date
+""").bindparams(bindparam("cattle_ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+
+
+# Columnas (y dtypes) del historial para entrenamiento; los booleanos admiten NULL
+HEAT_HISTORY_COLUMNS = {
+    'id': 'object',
+    'cattle_id': 'object',
+    'heat_date': 'datetime64[D]',
+    'allows_mounting': 'object',
+    'vaginal_discharge': 'object',
+    'vulva_swelling': 'object',
+    'comportamiento': 'object',
+    'was_inseminated': 'object',
+    'pregnancy_confirmed': 'object',
+    'birth_date': 'datetime64[D]',
+    'weight': 'float64',
+    'fecha_ultimo_parto': 'datetime64[D]',
+    'breed': 'object',
+}
 
 
 class MultimodalForecastingService:
@@ -19,11 +111,16 @@ class MultimodalForecastingService:
         self.xgb_model = None
         self.label_encoders = {}
         self.feature_columns = []
-        self.model_path = Path("models")
-        self.model_path.mkdir(exist_ok=True)
+        self.model_path = model_store.MODEL_PATH
     
-    def _get_heat_history_with_cattle_info(self) -> pd.DataFrame:
-        """Obtener historial completo de celos con info de cattle"""
+    def _get_heat_history_with_cattle_info(self, source: Optional[str] = None) -> pd.DataFrame:
+        """Obtener historial completo de celos con info de cattle (base de datos o snapshot Parquet)"""
+        if (source or settings.training_source) == "snapshot":
+            df = snapshot_store.read_heat_history()
+            if df.empty:
+                raise ValueError("No hay datos de celo disponibles en el snapshot")
+            return self._parse_dates(df)
+        
         query = text("""
             SELECT 
                 he.id,
@@ -45,19 +142,14 @@ class MultimodalForecastingService:
             ORDER BY he.cattle_id, he.heat_date
         """)
         
-        result = self.db.execute(query)
-        data = result.fetchall()
+        df = stream_frame(self.db, query, HEAT_HISTORY_COLUMNS)
         
-        if not data:
+        if df.empty:
             raise ValueError("No hay datos de celo disponibles en la base de datos")
         
-        df = pd.DataFrame(data, columns=[
-            'id', 'cattle_id', 'heat_date', 'allows_mounting',
-            'vaginal_discharge', 'vulva_swelling', 'comportamiento',
-            'was_inseminated', 'pregnancy_confirmed', 'birth_date',
-            'weight', 'fecha_ultimo_parto', 'breed'
-        ])
-        
+        return self._parse_dates(df)
+    
+    def _parse_dates(self, df: pd.DataFrame) -> pd.DataFrame:
         df['heat_date'] = pd.to_datetime(df['heat_date'])
         df['birth_date'] = pd.to_datetime(df['birth_date'])
         df['fecha_ultimo_parto'] = pd.to_datetime(df['fecha_ultimo_parto'])
@@ -124,9 +216,9 @@ class MultimodalForecastingService:
         
         return df
     
-    def train_models(self) -> Dict:
+    def train_models(self, source: Optional[str] = None) -> Dict:
         """Entrenar modelos Random Forest y XGBoost"""
-        df = self._get_heat_history_with_cattle_info()
+        df = self._get_heat_history_with_cattle_info(source)
         
         if len(df) < 50:
             raise ValueError("Se necesitan al menos 50 registros para entrenar")
@@ -159,7 +251,7 @@ class MultimodalForecastingService:
             max_depth=10,
             min_samples_split=5,
             random_state=42,
-            n_jobs=-1
+            n_jobs=training_n_jobs()
         )
         self.rf_model.fit(X, y)
         
@@ -168,12 +260,19 @@ class MultimodalForecastingService:
             max_depth=6,
             learning_rate=0.1,
             random_state=42,
-            n_jobs=-1
+            n_jobs=training_n_jobs()
         )
         self.xgb_model.fit(X, y)
         
         self._save_models()
         
+        if settings.inference_backend == "onnx":
+            self._export_onnx(X)
+        
+        # Todos los pronósticos precalculados quedan obsoletos; ForecastRefresher los recalcula
+        forecast_store.invalidate_all(self.db)
+        self.db.commit()
+        
         return {
             "total_records": len(df_train),
             "features_count": len(self.feature_columns),
@@ -181,147 +280,257 @@ class MultimodalForecastingService:
         }
     
     def _save_models(self):
-        """Guardar modelos y encoders"""
-        joblib.dump(self.rf_model, self.model_path / "rf_model.pkl")
-        joblib.dump(self.xgb_model, self.model_path / "xgb_model.pkl")
-        joblib.dump(self.label_encoders, self.model_path / "label_encoders.pkl")
-        joblib.dump(self.feature_columns, self.model_path / "feature_columns.pkl")
+        """Guardar modelos y encoders (disco + caché del proceso)"""
+        model_store.set_forecasting_artifacts({
+            "rf_model": self.rf_model,
+            "xgb_model": self.xgb_model,
+            "label_encoders": self.label_encoders,
+            "feature_columns": self.feature_columns,
+        })
     
-    def _load_models(self):
-        """Cargar modelos guardados"""
-        if not (self.model_path / "rf_model.pkl").exists():
-            raise ValueError("Modelos no entrenados. Ejecutar /train primero")
-        
-        self.rf_model = joblib.load(self.model_path / "rf_model.pkl")
-        self.xgb_model = joblib.load(self.model_path / "xgb_model.pkl")
-        self.label_encoders = joblib.load(self.model_path / "label_encoders.pkl")
-        self.feature_columns = joblib.load(self.model_path / "feature_columns.pkl")
+    def _export_onnx(self, X: pd.DataFrame) -> Optional[Dict[str, float]]:
+        """Exportar a ONNX con verificación de paridad; si falla se sigue con la inferencia nativa"""
+        sample = X.sample(min(len(X), 2_000), random_state=42).fillna(0).astype(float)
+        try:
+            report = onnx_models.export_onnx(
+                self.rf_model, self.xgb_model, sample, self.model_path, settings.onnx_threads
+            )
+        except (RuntimeError, ValueError) as e:
+            logger.warning("Exportación ONNX descartada: %s", e)
+            return None
+        logger.info("Modelos ONNX exportados", extra={"parity_max_abs_diff": report})
+        return report
     
-    def predict_next_heat(self, cattle_id: UUID) -> Optional[Dict]:
-        """Predecir próximo celo de una vaca"""
+    def feature_matrix(self, source: Optional[str] = None) -> pd.DataFrame:
+        """Features de todos los celos con intervalo calculable (paridad y benchmarks de inferencia)"""
         if self.rf_model is None:
             self._load_models()
         
-        cattle_id_str = str(cattle_id)
+        df = self._get_heat_history_with_cattle_info(source)
+        df = self._create_features(df)
+        df = self._encode_features(df, fit=False)
         
-        # Verificar que la vaca existe
-        check_query = text("""
-            SELECT id::text as id, gender
-            FROM cattle
-            WHERE id::text = :cattle_id
-        """)
+        return df[df['interval_lag1'].notna()][self.feature_columns].fillna(0).astype(float)
+    
+    def _load_models(self):
+        """Cargar modelos guardados (una vez por proceso, ver model_store)"""
+        artifacts = model_store.get_forecasting_artifacts()
         
-        check_result = self.db.execute(check_query, {"cattle_id": cattle_id_str})
-        cattle_row = check_result.fetchone()
+        self.rf_model = artifacts["rf_model"]
+        self.xgb_model = artifacts["xgb_model"]
+        self.label_encoders = artifacts["label_encoders"]
+        self.feature_columns = artifacts["feature_columns"]
+    
+    def _forecast_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Pronóstico vectorizado para todas las vacas de `df` (historial con fechas
+        parseadas, ordenado por cattle_id y heat_date). Una fila por vaca con al
+        menos 3 celos y un intervalo calculable; el resto no aparece.
+        """
+        if df.empty:
+            return pd.DataFrame(columns=FORECAST_COLUMNS)
+        
+        total_records = df.groupby('cattle_id')['heat_date'].transform('size')
+        df = self._create_features(df)
+        df = self._encode_features(df, fit=False)
         
-        if not cattle_row:
-            raise ValueError(f"Vaca {cattle_id} no encontrada")
+        valid = df[df['interval_lag1'].notna() & (total_records >= 3)]
+        last = valid.groupby('cattle_id', sort=False).tail(1)
+        if last.empty:
+            return pd.DataFrame(columns=FORECAST_COLUMNS)
         
-        if cattle_row.gender != 'female':
-            raise ValueError(f"Vaca {cattle_id} no es hembra")
+        X_pred = last[self.feature_columns].fillna(0).astype(float)
         
-        # Verificar registros de celo DIRECTOS
-        heat_check_query = text("""
-            SELECT 
-                he.id,
-                he.cattle_id::text as cattle_id,
-                he.heat_date
-            FROM heat_events he
-            WHERE he.cattle_id::text = :cattle_id
-            ORDER BY he.heat_date DESC
-        """)
+        # Nativos u ONNX según INFERENCE_BACKEND (misma interfaz predict)
+        models = model_store.get_inference_models()
+        with time_inference("forecasting_rf"):
+            pred_rf = models["rf_model"].predict(X_pred).astype(float)
+        with time_inference("forecasting_xgb"):
+            pred_xgb = models["xgb_model"].predict(X_pred).astype(float)
+        pred_avg = (pred_rf + pred_xgb) / 2
         
-        heat_result = self.db.execute(heat_check_query, {"cattle_id": cattle_id_str})
-        heat_rows = heat_result.fetchall()
+        # Confianza según el acuerdo entre modelos
+        diff = np.abs(pred_rf - pred_xgb)
+        confidence = np.select([diff < 2, diff < 5], ["Alta", "Media"], default="Baja")
+        
+        last_heat_date = last['heat_date'].dt.normalize()
+        predicted_date = last_heat_date + pd.to_timedelta(np.round(pred_avg).astype(int), unit='D').values
+        
+        return pd.DataFrame({
+            'cattle_id': last['cattle_id'].values,
+            'last_heat_date': last_heat_date.values,
+            'predicted_date': predicted_date.values,
+            'predicted_days_rf': np.round(pred_rf, 2),
+            'predicted_days_xgb': np.round(pred_xgb, 2),
+            'predicted_days_avg': np.round(pred_avg, 2),
+            'model_confidence': confidence,
+            'total_heat_records': total_records[last.index].values,
+        })
+    
+    @staticmethod
+    def _forecast_to_dict(forecast) -> Dict:
+        """Respuesta de /predict a partir de una fila de _forecast_frame o de heat_forecasts"""
+        last_heat_date = pd.Timestamp(forecast['last_heat_date']).date()
+        predicted_date = pd.Timestamp(forecast['predicted_date']).date()
         
-        if len(heat_rows) < 3:
-            raise ValueError(f"Se necesitan al menos 3 registros de celo. Tiene: {len(heat_rows)}")
+        return {
+            "cattle_id": str(forecast['cattle_id']),
+            "last_heat_date": str(last_heat_date),
+            "predicted_days_rf": float(forecast['predicted_days_rf']),
+            "predicted_days_xgb": float(forecast['predicted_days_xgb']),
+            "predicted_days_avg": float(forecast['predicted_days_avg']),
+            "predicted_next_heat_date": str(predicted_date),
+            "days_until_heat": (predicted_date - date.today()).days,
+            "total_heat_records": int(forecast['total_heat_records']),
+            "model_confidence": forecast['model_confidence']
+        }
+    
+    def _compute_forecast(self, cattle_id: UUID) -> pd.DataFrame:
+        """Calcular el pronóstico de una vaca desde su historial (una fila)"""
+        # Una sola consulta por animal: PK de cattle + ix_heat_events_cattle_id_heat_date.
+        # El LEFT JOIN devuelve la fila de la vaca aunque no tenga celos registrados.
+        rows = self.db.execute(
+            HEAT_HISTORY_BY_CATTLE_QUERY, {"cattle_id": cattle_id}
+        ).fetchall()
+        
+        if not rows:
+            raise ValueError(f"Vaca {cattle_id} no encontrada")
         
-        # Obtener datos COMPLETOS para esta vaca específica
-        specific_query = text("""
-            SELECT 
-                he.id,
-                he.cattle_id::text as cattle_id,
-                he.heat_date,
-                he.allows_mounting,
-                he.vaginal_discharge,
-                he.vulva_swelling,
-                he.comportamiento,
-                he.was_inseminated,
-                he.pregnancy_confirmed,
-                c.birth_date,
-                c.weight,
-                c.fecha_ultimo_parto,
-                c.breed
-            FROM heat_events he
-            JOIN cattle c ON he.cattle_id = c.id
-            WHERE he.cattle_id::text = :cattle_id
-            ORDER BY he.heat_date
-        """)
+        if rows[0].gender != 'female':
+            raise ValueError(f"Vaca {cattle_id} no es hembra")
         
-        result = self.db.execute(specific_query, {"cattle_id": cattle_id_str})
-        data = result.fetchall()
+        data = [row for row in rows if row.id is not None]
         
-        if not data:
-            raise ValueError(f"No se pudo obtener datos completos para {cattle_id}")
+        if len(data) < 3:
+            raise ValueError(f"Se necesitan al menos 3 registros de celo. Tiene: {len(data)}")
         
         df_cattle = pd.DataFrame(data, columns=[
             'id', 'cattle_id', 'heat_date', 'allows_mounting',
             'vaginal_discharge', 'vulva_swelling', 'comportamiento',
             'was_inseminated', 'pregnancy_confirmed', 'birth_date',
-            'weight', 'fecha_ultimo_parto', 'breed'
-        ])
-        
-        df_cattle['heat_date'] = pd.to_datetime(df_cattle['heat_date'])
-        df_cattle['birth_date'] = pd.to_datetime(df_cattle['birth_date'])
-        df_cattle['fecha_ultimo_parto'] = pd.to_datetime(df_cattle['fecha_ultimo_parto'])
-        
-        if len(df_cattle) < 3:
-            raise ValueError(f"Registros procesados: {len(df_cattle)} (requiere mínimo 3)")
-        
-        # Crear features
-        df_cattle = self._create_features(df_cattle)
-        df_cattle = self._encode_features(df_cattle, fit=False)
+            'weight', 'fecha_ultimo_parto', 'breed', 'gender'
+        ]).drop(columns=['gender'])
+        df_cattle['cattle_id'] = cattle_id
         
-        # Obtener último registro con features válidos
-        df_cattle_valid = df_cattle[df_cattle['interval_lag1'].notna()].copy()
+        forecast = self._forecast_frame(self._parse_dates(df_cattle))
         
-        if len(df_cattle_valid) == 0:
+        if forecast.empty:
             raise ValueError("No hay registros con intervalos calculables")
         
-        last_heat = df_cattle_valid.iloc[-1]
+        return forecast
+    
+    def predict_next_heat(self, cattle_id: UUID) -> Optional[Dict]:
+        """Predecir próximo celo de una vaca (lectura de heat_forecasts si está al día)"""
+        result = self.predict_many([cattle_id])[cattle_id]
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
+    def predict_many(self, cattle_ids: List[UUID]) -> Dict[UUID, Union[Dict, ValueError]]:
+        """
+        Pronóstico de varias vacas a la vez: una lectura de heat_forecasts para
+        todas y un único cálculo vectorizado (y guardado) para las que no están
+        al día. Cada vaca recibe su respuesta o el ValueError que le corresponde.
+        """
+        if self.rf_model is None:
+            self._load_models()
+        version = model_store.forecasting_version()
         
-        # Preparar features
-        X_pred = pd.DataFrame([last_heat[self.feature_columns]])
-        X_pred = X_pred.fillna(0).astype(float)
+        results = self.stored_results(forecast_store.get_forecasts(self.db, cattle_ids), version)
+        misses = [cattle_id for cattle_id in cattle_ids if str(cattle_id) not in results]
+        if misses:
+            results.update(self.compute_missing(misses, version))
         
-        # Predicciones
-        pred_rf = float(self.rf_model.predict(X_pred)[0])
-        pred_xgb = float(self.xgb_model.predict(X_pred)[0])
-        pred_avg = (pred_rf + pred_xgb) / 2
+        return {cattle_id: results[str(cattle_id)] for cattle_id in cattle_ids}
+    
+    @classmethod
+    def stored_results(cls, rows, version: str) -> Dict[str, Union[Dict, ValueError]]:
+        """Respuestas de las filas de heat_forecasts al día (no stale y del modelo cargado), por str(cattle_id)"""
+        return {
+            str(stored.cattle_id): (
+                ValueError(stored.error) if stored.error else cls._forecast_to_dict(stored._mapping)
+            )
+            for stored in rows
+            if not stored.stale and stored.model_version == version
+        }
+    
+    def compute_missing(self, cattle_ids: List[UUID], version: str) -> Dict[str, Union[Dict, ValueError]]:
+        """Calcula y guarda (con commit) los pronósticos sin fila al día, por str(cattle_id)"""
+        if self.rf_model is None:
+            self._load_models()
         
-        # Calcular próxima fecha
-        last_heat_date = last_heat['heat_date'].date()
-        predicted_date = last_heat_date + timedelta(days=int(round(pred_avg)))
-        days_until = (predicted_date - date.today()).days
-        
-        # Confianza
-        diff = abs(pred_rf - pred_xgb)
-        if diff < 2:
-            confidence = "Alta"
-        elif diff < 5:
-            confidence = "Media"
+        results: Dict[str, Union[Dict, ValueError]] = {}
+        genders = {
+            str(row.id): row.gender
+            for row in self.db.execute(CATTLE_GENDER_QUERY, {"cattle_ids": list(cattle_ids)})
+        }
+        females = []
+        for cattle_id in cattle_ids:
+            gender = genders.get(str(cattle_id))
+            if gender is None:
+                results[str(cattle_id)] = ValueError(f"Vaca {cattle_id} no encontrada")
+            elif gender != 'female':
+                results[str(cattle_id)] = ValueError(f"Vaca {cattle_id} no es hembra")
+            else:
+                females.append(cattle_id)
+        
+        if females:
+            # Revisión leída (y confirmada) antes que el historial: el cálculo no bloquea
+            # filas y el upsert no pisa un celo escrito por core-service mientras tanto
+            revisions = forecast_store.get_revisions(self.db, females)
+            self.db.commit()
+            forecasts, errors = self._compute_batch(females)
+            forecast_store.save_forecasts(self.db, forecasts, version, revisions, errors)
+            self.db.commit()
+            for _, forecast in forecasts.iterrows():
+                results[str(forecast['cattle_id'])] = self._forecast_to_dict(forecast)
+            for cattle_id, error in errors.items():
+                results[str(cattle_id)] = ValueError(error)
+        
+        return results
+    
+    def _compute_batch(self, cattle_ids: List[UUID]) -> Tuple[pd.DataFrame, Dict[UUID, str]]:
+        """
+        Pronósticos de un lote de hembras desde su historial, con una sola
+        consulta y una llamada a cada modelo. Devuelve (pronósticos, errores por vaca).
+        """
+        df = stream_frame(self.db, HEAT_HISTORY_BY_CATTLE_IDS_QUERY, HEAT_HISTORY_COLUMNS, {"cattle_ids": list(cattle_ids)})
+        counts = df['cattle_id'].astype(str).value_counts()
+        errors = {}
+        
+        try:
+            forecasts = self._forecast_frame(self._parse_dates(df))
+        except ValueError:
+            # Una categoría desconocida para los encoders invalida el lote: se recalcula vaca a vaca
+            frames = []
+            for cattle_id in cattle_ids:
+                try:
+                    frames.append(self._compute_forecast(cattle_id))
+                except ValueError as e:
+                    errors[cattle_id] = str(e)
+            forecasts = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=FORECAST_COLUMNS)
         else:
-            confidence = "Baja"
+            computed = set(forecasts['cattle_id'].astype(str))
+            for cattle_id in cattle_ids:
+                if str(cattle_id) in computed:
+                    continue
+                total = int(counts.get(str(cattle_id), 0))
+                errors[cattle_id] = (
+                    f"Se necesitan al menos 3 registros de celo. Tiene: {total}" if total < 3
+                    else "No hay registros con intervalos calculables"
+                )
+        
+        return forecasts, errors
+    
+    def refresh_forecasts(self, revisions: Dict[UUID, int]) -> int:
+        """
+        Recalcula y guarda (sin commit) los pronósticos de un lote de vacas con la
+        revisión leída al reservarlas; devuelve cuántas filas escribió. Las vacas
+        sin pronóstico posible quedan con el motivo en `error`.
+        """
+        if self.rf_model is None:
+            self._load_models()
+        version = model_store.forecasting_version()
         
-        return {
-            "cattle_id": str(cattle_id),
-            "last_heat_date": str(last_heat_date),
-            "predicted_days_rf": round(pred_rf, 2),
-            "predicted_days_xgb": round(pred_xgb, 2),
-            "predicted_days_avg": round(pred_avg, 2),
-            "predicted_next_heat_date": str(predicted_date),
-            "days_until_heat": days_until,
-            "total_heat_records": len(df_cattle),
-            "model_confidence": confidence
-        }
\ No newline at end of file
+        forecasts, errors = self._compute_batch(list(revisions))
+        return forecast_store.save_forecasts(self.db, forecasts, version, revisions, errors)
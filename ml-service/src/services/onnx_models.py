@@ -0,0 +1,103 @@
+"""
+Ruta de inferencia ONNX (opcional) para los forecasters RF y XGBoost.
+
+Los modelos entrenados se convierten con skl2onnx / onnxmltools y se ejecutan
+con onnxruntime sobre un array float32: sin validación de DataFrame ni
+conversión de tipos por llamada. Dependencias en requirements_onnx.txt.
+
+La exportación solo se publica si la predicción ONNX coincide con la nativa
+(sklearn / xgboost) dentro de PARITY_TOLERANCE días sobre una muestra real.
+"""
+import copy
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+
+ONNX_ARTIFACTS = {
+    "rf_model": "rf_model.onnx",
+    "xgb_model": "xgb_model.onnx",
+}
+
+# Ambos modelos trabajan internamente en float32; la diferencia esperada es de redondeo
+PARITY_TOLERANCE = 0.01
+
+
+class OnnxRegressor:
+    """Sesión de onnxruntime con la misma interfaz predict(X) que sklearn"""
+
+    def __init__(self, path: Path, threads: int = 1):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self._session = ort.InferenceSession(str(path), options, providers=["CPUExecutionProvider"])
+        self._input = self._session.get_inputs()[0].name
+
+    def predict(self, X) -> np.ndarray:
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        return self._session.run(None, {self._input: X})[0].ravel()
+
+
+def _convert(rf_model, xgb_model, n_features: int) -> Dict[str, Any]:
+    try:
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+        from onnxmltools import convert_xgboost
+        from onnxmltools.convert.common.data_types import FloatTensorType as XgbFloatTensorType
+    except ImportError as e:
+        raise RuntimeError("La exportación ONNX requiere los paquetes de requirements_onnx.txt") from e
+
+    # El conversor de XGBoost solo acepta features anónimas (f0, f1, ...)
+    xgb_anonymous = copy.deepcopy(xgb_model)
+    xgb_anonymous.get_booster().feature_names = None
+
+    return {
+        "rf_model": convert_sklearn(rf_model, initial_types=[("input", FloatTensorType([None, n_features]))]),
+        "xgb_model": convert_xgboost(xgb_anonymous, initial_types=[("input", XgbFloatTensorType([None, n_features]))]),
+    }
+
+
+def parity(native, compiled, X: pd.DataFrame) -> float:
+    """Máxima diferencia absoluta (días) entre la predicción nativa y la compilada"""
+    return float(np.max(np.abs(native.predict(X) - compiled.predict(X)))) if len(X) else 0.0
+
+
+def export_onnx(
+    rf_model,
+    xgb_model,
+    X_sample: pd.DataFrame,
+    path: Path,
+    threads: int = 1,
+    tolerance: float = PARITY_TOLERANCE
+) -> Dict[str, float]:
+    """
+    Convierte RF y XGBoost a ONNX, comprueba la paridad sobre `X_sample` y, si
+    pasa, los publica en `path` (escritura atómica). Devuelve max |Δ| por modelo.
+    """
+    converted = _convert(rf_model, xgb_model, X_sample.shape[1])
+    native = {"rf_model": rf_model, "xgb_model": xgb_model}
+    report = {}
+    tmp_paths = {}
+
+    try:
+        for key, onnx_model in converted.items():
+            tmp_paths[key] = path / f"{ONNX_ARTIFACTS[key]}.tmp"
+            tmp_paths[key].write_bytes(onnx_model.SerializeToString())
+            report[key] = parity(native[key], OnnxRegressor(tmp_paths[key], threads), X_sample)
+
+        failed = {key: diff for key, diff in report.items() if diff > tolerance}
+        if failed:
+            raise ValueError(f"Paridad ONNX fuera de tolerancia ({tolerance} días): {failed}")
+
+        for key, tmp in tmp_paths.items():
+            tmp.replace(path / ONNX_ARTIFACTS[key])
+    finally:
+        for tmp in tmp_paths.values():
+            tmp.unlink(missing_ok=True)
+
+    return report
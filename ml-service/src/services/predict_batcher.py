@@ -0,0 +1,115 @@
+"""
+Micro-batching de peticiones de predicción concurrentes.
+
+Las peticiones que llegan dentro de una ventana de `max_wait_ms` (o hasta
+llenar `max_batch`) se resuelven con una sola llamada al handler: una
+lectura async de heat_forecasts y, solo para las vacas sin pronóstico al
+día, una construcción vectorizada de features y una llamada a cada modelo
+en el ejecutor de inferencia. Cada petición recibe su propio resultado o
+excepción.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from bovara_ops import observe_batch
+
+from src.config import settings
+from src.database import AsyncSessionLocal, SessionLocal
+from src.executors import run_inference
+from src.services import forecast_store, model_store
+from src.services.multimodal_forecasting_service import MultimodalForecastingService
+
+
+class MicroBatcher:
+    """Agrupa peticiones concurrentes y las resuelve con una llamada por lote"""
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+        max_batch: int = 64,
+        max_wait_ms: float = 5.0
+    ):
+        self.name = name
+        self._handler = handler
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._pending: List[Tuple[Hashable, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, key: Hashable) -> Any:
+        """Encola `key` y espera su resultado (o la excepción que le corresponda)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((key, future))
+
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Hashable, asyncio.Future]]) -> None:
+        # Claves repetidas (la misma vaca pedida dos veces) se calculan una sola vez
+        keys = list(dict.fromkeys(key for key, _ in batch))
+        observe_batch(self.name, len(keys))
+
+        try:
+            results = await self._handler(keys)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch:
+            if future.done():  # petición cancelada (cliente desconectado)
+                continue
+            result = results[key]
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def _compute_missing(cattle_ids: List[Hashable], version: str) -> Dict[str, Any]:
+    db = SessionLocal()
+    try:
+        return MultimodalForecastingService(db).compute_missing(cattle_ids, version)
+    finally:
+        db.close()
+
+
+async def _predict_batch(cattle_ids: List[Hashable]) -> Dict[Hashable, Any]:
+    # Carga (o recarga) de artefactos: lectura de disco, fuera del event loop
+    version = await run_inference(model_store.forecasting_version)
+
+    async with AsyncSessionLocal() as db:
+        rows = await forecast_store.get_forecasts_async(db, cattle_ids)
+    results = MultimodalForecastingService.stored_results(rows, version)
+
+    misses = [cattle_id for cattle_id in cattle_ids if str(cattle_id) not in results]
+    if misses:
+        results.update(await run_inference(_compute_missing, misses, version))
+
+    return {cattle_id: results[str(cattle_id)] for cattle_id in cattle_ids}
+
+
+forecast_batcher = MicroBatcher(
+    "forecast_predict",
+    _predict_batch,
+    max_batch=settings.predict_batch_max_size,
+    max_wait_ms=settings.predict_batch_max_wait_ms
+)
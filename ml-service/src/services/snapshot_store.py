@@ -0,0 +1,233 @@
+"""
+Snapshots columnares (Parquet) de cattle, heat_events y health_events.
+
+Cada exportación se guarda en `<snapshot_path>/<snapshot_id>/<tabla>/` con
+particionado hive por dueño (rancho) y mes:
+
+    snapshots/20261019T120000Z/heat_events/owner_id=<uuid>/month=2025-03/part-0.parquet
+
+El fichero `LATEST` apunta a la última exportación completa. El entrenamiento
+puede leer de ahí (solo las columnas necesarias, con memory-mapping) en lugar
+de consultar la base OLTP.
+"""
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pyarrow import fs
+from sqlalchemy import text
+
+from src.config import settings
+
+
+SNAPSHOT_PATH = Path(settings.snapshot_path)
+
+# UUIDs como texto y mes precalculado: el particionado no depende del tipo del driver
+EXPORT_QUERIES = {
+    "cattle": """
+        SELECT
+            c.id::text AS id,
+            c.name,
+            c.lote,
+            c.breed,
+            c.gender::text AS gender,
+            c.birth_date,
+            c.weight,
+            c.fecha_ultimo_parto,
+            c.owner_id::text AS owner_id
+        FROM cattle c
+    """,
+    "heat_events": """
+        SELECT
+            he.id::text AS id,
+            he.cattle_id::text AS cattle_id,
+            he.heat_date,
+            he.allows_mounting,
+            he.vaginal_discharge,
+            he.vulva_swelling,
+            he.comportamiento,
+            he.was_inseminated,
+            he.insemination_date,
+            he.pregnancy_confirmed,
+            c.owner_id::text AS owner_id,
+            to_char(he.heat_date, 'YYYY-MM') AS month
+        FROM heat_events he
+        JOIN cattle c ON c.id = he.cattle_id
+    """,
+    "health_events": """
+        SELECT
+            h.id::text AS id,
+            h.cattle_id::text AS cattle_id,
+            h.event_type::text AS event_type,
+            h.disease_name,
+            h.medicine_name,
+            h.application_date,
+            h.next_dose_date,
+            h.treatment_end_date,
+            c.owner_id::text AS owner_id,
+            to_char(h.application_date, 'YYYY-MM') AS month
+        FROM health_events h
+        JOIN cattle c ON c.id = h.cattle_id
+    """,
+}
+
+SCHEMAS = {
+    "cattle": pa.schema([
+        ("id", pa.string()),
+        ("name", pa.string()),
+        ("lote", pa.string()),
+        ("breed", pa.string()),
+        ("gender", pa.string()),
+        ("birth_date", pa.date32()),
+        ("weight", pa.float64()),
+        ("fecha_ultimo_parto", pa.date32()),
+        ("owner_id", pa.string()),
+    ]),
+    "heat_events": pa.schema([
+        ("id", pa.string()),
+        ("cattle_id", pa.string()),
+        ("heat_date", pa.date32()),
+        ("allows_mounting", pa.bool_()),
+        ("vaginal_discharge", pa.string()),
+        ("vulva_swelling", pa.string()),
+        ("comportamiento", pa.string()),
+        ("was_inseminated", pa.bool_()),
+        ("insemination_date", pa.date32()),
+        ("pregnancy_confirmed", pa.bool_()),
+        ("owner_id", pa.string()),
+        ("month", pa.string()),
+    ]),
+    "health_events": pa.schema([
+        ("id", pa.string()),
+        ("cattle_id", pa.string()),
+        ("event_type", pa.string()),
+        ("disease_name", pa.string()),
+        ("medicine_name", pa.string()),
+        ("application_date", pa.date32()),
+        ("next_dose_date", pa.date32()),
+        ("treatment_end_date", pa.date32()),
+        ("owner_id", pa.string()),
+        ("month", pa.string()),
+    ]),
+}
+
+PARTITION_COLUMNS = {
+    "cattle": ["owner_id"],
+    "heat_events": ["owner_id", "month"],
+    "health_events": ["owner_id", "month"],
+}
+
+
+def _partitioning(table: str) -> ds.Partitioning:
+    schema = SCHEMAS[table]
+    return ds.partitioning(pa.schema([schema.field(c) for c in PARTITION_COLUMNS[table]]), flavor="hive")
+
+
+def _batches(engine, table: str, chunk_size: int) -> Iterator[pa.RecordBatch]:
+    """Filas de la tabla en bloques, con cursor de servidor (no carga todo en memoria)"""
+    schema = SCHEMAS[table]
+    with engine.connect() as conn:
+        conn = conn.execution_options(stream_results=True, max_row_buffer=chunk_size)
+        for chunk in pd.read_sql(text(EXPORT_QUERIES[table]), conn, chunksize=chunk_size):
+            yield pa.RecordBatch.from_pandas(chunk[schema.names], schema=schema, preserve_index=False)
+
+
+def export_snapshot(engine, root: Path = SNAPSHOT_PATH, tables: Optional[List[str]] = None, chunk_size: int = 100_000) -> Dict:
+    """Exporta las tablas a un nuevo snapshot particionado y actualiza LATEST"""
+    snapshot_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    base = root / snapshot_id
+    base.mkdir(parents=True)
+    rows = {}
+
+    for table in tables or list(EXPORT_QUERIES):
+        counter = {"rows": 0}
+
+        def counted(batches):
+            for batch in batches:
+                counter["rows"] += batch.num_rows
+                yield batch
+
+        ds.write_dataset(
+            counted(_batches(engine, table, chunk_size)),
+            str(base / table),
+            schema=SCHEMAS[table],
+            format="parquet",
+            partitioning=_partitioning(table),
+            basename_template="part-{i}.parquet",
+            existing_data_behavior="error",
+            max_rows_per_group=chunk_size,
+        )
+        rows[table] = counter["rows"]
+
+    # LATEST se escribe al final y de forma atómica: un lector nunca ve un snapshot a medias
+    tmp = root / "LATEST.tmp"
+    tmp.write_text(snapshot_id)
+    tmp.replace(root / "LATEST")
+
+    return {"snapshot_id": snapshot_id, "path": str(base), "rows": rows}
+
+
+def resolve_snapshot(root: Path = SNAPSHOT_PATH, snapshot_id: Optional[str] = None) -> Path:
+    """Directorio del snapshot pedido o del último exportado"""
+    if snapshot_id is None:
+        latest = root / "LATEST"
+        if not latest.exists():
+            raise ValueError(f"No hay snapshots en {root}. Ejecuta primero export_snapshots.py")
+        snapshot_id = latest.read_text().strip()
+    base = root / snapshot_id
+    if not base.exists():
+        raise ValueError(f"Snapshot no encontrado: {base}")
+    return base
+
+
+def read_table(base: Path, table: str, columns: List[str], filter=None) -> pa.Table:
+    """Lee solo `columns` de una tabla del snapshot, con memory-mapping"""
+    dataset = ds.dataset(
+        str(base / table),
+        format="parquet",
+        partitioning=_partitioning(table),
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+    )
+    return dataset.to_table(columns=columns, filter=filter)
+
+
+def read_heat_history(snapshot_id: Optional[str] = None) -> pd.DataFrame:
+    """Historial de celos de hembras con datos base (mismas columnas que la consulta SQL)"""
+    base = resolve_snapshot(snapshot_id=snapshot_id)
+    heat = read_table(base, "heat_events", [
+        "id", "cattle_id", "heat_date", "allows_mounting", "vaginal_discharge",
+        "vulva_swelling", "comportamiento", "was_inseminated", "pregnancy_confirmed",
+    ])
+    cattle = read_table(
+        base, "cattle",
+        ["id", "birth_date", "weight", "fecha_ultimo_parto", "breed"],
+        filter=pc.field("gender") == "female",
+    ).rename_columns(["cattle_id", "birth_date", "weight", "fecha_ultimo_parto", "breed"])
+
+    joined = heat.join(cattle, keys="cattle_id", join_type="inner")
+    return joined.sort_by([("cattle_id", "ascending"), ("heat_date", "ascending")]).to_pandas()
+
+
+def read_health_stats(snapshot_id: Optional[str] = None) -> pd.DataFrame:
+    """Conteos de eventos de salud por animal (mismas columnas que la consulta SQL)"""
+    base = resolve_snapshot(snapshot_id=snapshot_id)
+    cattle = read_table(base, "cattle", ["id", "name", "lote"]).to_pandas()
+    events = read_table(base, "health_events", ["cattle_id", "event_type"]).to_pandas()
+
+    event_type = events["event_type"]
+    counts = pd.DataFrame({
+        "cattle_id": events["cattle_id"],
+        "total_eventos": 1,
+        "total_vacunas": (event_type == "vaccine").astype(int),
+        "total_tratamientos": (event_type == "treatment").astype(int),
+        "total_enfermedades": (event_type == "illness").astype(int),
+    }).groupby("cattle_id", sort=False).sum()
+
+    df = cattle.rename(columns={"id": "cattle_id"}).merge(counts, left_on="cattle_id", right_index=True, how="left")
+    count_columns = ["total_eventos", "total_vacunas", "total_tratamientos", "total_enfermedades"]
+    df[count_columns] = df[count_columns].fillna(0).astype(int)
+    return df
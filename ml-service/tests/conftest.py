@@ -0,0 +1,71 @@
+# tests/conftest.py
+"""
+Base de datos de los tests de planes de consulta (tests/test_query_plans.py).
+
+TEST_DATABASE_URL debe apuntar a la base de core-service migrada y poblada con
+un hato de tamaño realista (benchmarks/seed.py --herd 100k). Sin ella, sin
+conexión o sin hato los tests se omiten. Cada test corre en una transacción que
+se revierte.
+"""
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import DBAPIError
+
+from src.config import settings
+
+
+MIN_HERD = 10_000
+
+SAMPLE_QUERIES = {
+    "cattle_id": "SELECT id FROM cattle ORDER BY random() LIMIT 1",
+    "owner_id": "SELECT owner_id FROM cattle LIMIT 1",
+    "heat_cattle_id": "SELECT cattle_id FROM heat_events ORDER BY random() LIMIT 1",
+}
+
+
+@pytest.fixture(scope="session")
+def engine():
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL no definida")
+
+    engine = create_engine(url)
+    try:
+        with engine.connect() as conn:
+            herd = conn.execute(text("SELECT COUNT(*) FROM cattle")).scalar()
+    except DBAPIError as e:
+        engine.dispose()
+        pytest.skip(f"Base de pruebas no disponible: {e.orig}")
+
+    if herd < MIN_HERD:
+        engine.dispose()
+        pytest.skip(f"Hato de {herd} animales; hacen falta al menos {MIN_HERD} (benchmarks/seed.py)")
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def sample(engine) -> dict:
+    """IDs reales de la base para parametrizar las consultas"""
+    with engine.connect() as conn:
+        values = {name: conn.execute(text(sql)).scalar() for name, sql in SAMPLE_QUERIES.items()}
+        # Lotes de vacas con celos del tamaño de un lote de /predict y de uno del refresher
+        for name, size in (("predict_batch", settings.predict_batch_max_size),
+                           ("refresh_batch", settings.forecast_refresh_batch)):
+            values[name] = list(conn.execute(
+                text("SELECT DISTINCT cattle_id FROM heat_events ORDER BY cattle_id LIMIT :size"), {"size": size}
+            ).scalars())
+    return values
+
+
+@pytest.fixture
+def conn(engine):
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            yield conn
+        finally:
+            trans.rollback()
@@ -0,0 +1,164 @@
+# tests/test_query_plans.py
+"""
+Planes de las consultas de ml-service contra el hato de benchmarks/seed.py.
+
+El EXPLAIN se construye con el texto público de cada consulta y bindparam()
+explícitos con el mismo tipo que usa el servicio (UUID nativo, arrays de UUID),
+y se ejecuta con la configuración por defecto del planner.
+
+Sin caso, a propósito: el historial completo de entrenamiento
+(_get_heat_history_with_cattle_info) e INVALIDATE_ALL, que recorren las tablas.
+"""
+import json
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+
+from src.config import settings
+from src.services import forecast_store
+from src.services.clustering_service import HEALTH_FEATURES_QUERY, HEALTH_STATS_BY_CATTLE_QUERY, HEALTH_STATS_QUERY
+from src.services.multimodal_forecasting_service import (
+    CATTLE_GENDER_QUERY,
+    HEAT_HISTORY_BY_CATTLE_IDS_QUERY,
+    HEAT_HISTORY_BY_CATTLE_QUERY,
+)
+
+
+TODAY = date.today()
+
+UUID_TYPE = PG_UUID(as_uuid=True)
+UUID_ARRAY = ARRAY(PG_UUID(as_uuid=True))
+
+
+def _upcoming(s):
+    return {"start": TODAY, "end": TODAY + timedelta(days=7), "owner_id": s["owner_id"]}
+
+
+def _upsert(s):
+    ids = [str(c) for c in s["refresh_batch"]]
+    n = len(ids)
+    return {
+        "model_version": "test",
+        "cattle_ids": ids,
+        "last_heat_dates": [TODAY] * n,
+        "predicted_dates": [TODAY + timedelta(days=21)] * n,
+        "predicted_days_rf": [21.0] * n,
+        "predicted_days_xgb": [21.0] * n,
+        "predicted_days_avg": [21.0] * n,
+        "model_confidences": ["alta"] * n,
+        "total_heat_records": [5] * n,
+        "errors": [None] * n,
+        "revisions": [0] * n,
+    }
+
+
+# (id, consulta, bindparams del servicio, parámetros, índices esperados)
+CASES = [
+    ("forecasting.heat_history_by_cattle", HEAT_HISTORY_BY_CATTLE_QUERY,
+     [bindparam("cattle_id", type_=UUID_TYPE)],
+     lambda s: {"cattle_id": s["heat_cattle_id"]},
+     {"cattle_pkey", "ix_heat_events_cattle_id_heat_date"}),
+    ("forecasting.cattle_gender", CATTLE_GENDER_QUERY,
+     [bindparam("cattle_ids", type_=UUID_ARRAY)],
+     lambda s: {"cattle_ids": s["predict_batch"]},
+     {"cattle_pkey"}),
+    ("forecasting.heat_history_by_cattle_ids", HEAT_HISTORY_BY_CATTLE_IDS_QUERY,
+     [bindparam("cattle_ids", type_=UUID_ARRAY)],
+     lambda s: {"cattle_ids": s["refresh_batch"]},
+     {"cattle_pkey", "ix_heat_events_cattle_id_heat_date"}),
+    ("clustering.health_stats_by_cattle", HEALTH_STATS_BY_CATTLE_QUERY,
+     [bindparam("cattle_id", type_=UUID_TYPE)],
+     lambda s: {"cattle_id": s["cattle_id"]},
+     {"cattle_pkey", "cattle_health_stats_pkey"}),
+    ("forecast_store.get_forecasts", forecast_store.GET_FORECASTS,
+     [bindparam("cattle_ids", type_=UUID_ARRAY)],
+     lambda s: {"cattle_ids": [s["heat_cattle_id"]]},
+     {"heat_forecasts_pkey"}),
+    ("forecast_store.claim_stale", forecast_store.CLAIM_STALE,
+     [],
+     lambda s: {"limit": settings.forecast_refresh_batch, "lease": settings.forecast_refresh_lease},
+     {"ix_heat_forecasts_stale", "heat_forecasts_pkey"}),
+    ("forecast_store.release_claims", forecast_store.RELEASE_CLAIMS,
+     [bindparam("cattle_ids", type_=UUID_ARRAY)],
+     lambda s: {"cattle_ids": s["refresh_batch"]},
+     {"heat_forecasts_pkey"}),
+    ("forecast_store.ensure_forecast_rows", forecast_store.ENSURE_FORECAST_ROWS,
+     [bindparam("cattle_ids", type_=UUID_ARRAY)],
+     lambda s: {"cattle_ids": s["predict_batch"]},
+     {"cattle_pkey", "heat_forecasts_pkey"}),
+    ("forecast_store.get_revisions", forecast_store.GET_REVISIONS,
+     [bindparam("cattle_ids", type_=UUID_ARRAY)],
+     lambda s: {"cattle_ids": s["predict_batch"]},
+     {"heat_forecasts_pkey"}),
+    ("forecast_store.upsert_forecasts", forecast_store.UPSERT_FORECASTS,
+     [],
+     _upsert,
+     {"cattle_pkey", "heat_forecasts_pkey"}),
+    ("forecast_store.count_upcoming", forecast_store.COUNT_UPCOMING,
+     [bindparam("owner_id", type_=UUID_TYPE)],
+     _upcoming,
+     {"ix_heat_forecasts_owner_id_predicted_date"}),
+    ("forecast_store.list_upcoming", forecast_store.LIST_UPCOMING,
+     [bindparam("owner_id", type_=UUID_TYPE)],
+     lambda s: {**_upcoming(s), "skip": 0, "limit": 100},
+     {"ix_heat_forecasts_owner_id_predicted_date", "cattle_pkey"}),
+]
+
+# Lectura completa para clustering: solo cattle y los contadores precalculados
+# (nunca un GROUP BY sobre health_events)
+FULL_SCAN_CASES = [
+    ("clustering.health_stats", HEALTH_STATS_QUERY),
+    ("clustering.health_features", HEALTH_FEATURES_QUERY),
+]
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _explain(conn, query, bindparams, params) -> list:
+    """Nodos del plan de `query` (con los tipos de parámetro del servicio)"""
+    explain = text(f"EXPLAIN (FORMAT JSON) {query.text}").bindparams(*bindparams)
+    raw = conn.execute(explain, params).scalar()
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+    return list(_plan_nodes(plan))
+
+
+def _indexes(nodes: list) -> set:
+    used = set()
+    for node in nodes:
+        if "Index Name" in node:
+            used.add(node["Index Name"])
+        # INSERT ... ON CONFLICT: el índice con el que se resuelve el conflicto
+        used.update(node.get("Conflict Arbiter Indexes", []))
+    return used
+
+
+@pytest.fixture(scope="module")
+def forecasts(engine):
+    """heat_forecasts poblada (benchmarks/seed.py la rellena con pronósticos en régimen normal)"""
+    with engine.connect() as conn:
+        if not conn.execute(text("SELECT EXISTS (SELECT 1 FROM heat_forecasts)")).scalar():
+            pytest.skip("heat_forecasts vacía: poblar la base con benchmarks/seed.py")
+
+
+@pytest.mark.parametrize(
+    "query, bindparams, params, expected",
+    [case[1:] for case in CASES],
+    ids=[case[0] for case in CASES],
+)
+def test_query_uses_index(conn, forecasts, sample, query, bindparams, params, expected):
+    nodes = _explain(conn, query, bindparams, params(sample))
+    used = _indexes(nodes)
+    assert expected <= used, f"índices esperados {sorted(expected)}, plan usa {sorted(used) or '-'}"
+
+
+@pytest.mark.parametrize("query", [case[1] for case in FULL_SCAN_CASES], ids=[case[0] for case in FULL_SCAN_CASES])
+def test_clustering_reads_precomputed_stats(conn, query):
+    nodes = _explain(conn, query, [], {})
+    relations = {node["Relation Name"] for node in nodes if "Relation Name" in node}
+    assert relations == {"cattle", "cattle_health_stats"}